@@ -0,0 +1,59 @@
+import queue
+import threading
+from typing import List
+
+from graph_algorithm import GraphSequenceAnalyzer, SearchStats
+
+
+class AnalysisWorker(threading.Thread):
+    """
+    Runs the graphicality check and the realization search off the GUI thread.
+
+    Results are posted to the messages queue as they become available, so the
+    caller can poll it (e.g. from Tk's root.after) without ever blocking:
+
+    - ('verdict', GraphicVerdict): whether the sequence is graphic, and why
+      not if it is not; posted first
+    - ('graph', nx.Graph): each new non-isomorphic realization
+    - ('done', bool): the search ended; True if it was cancelled
+    - ('error', Exception): the analysis raised
+
+    Counters and timings of the search are kept in stats; they are complete
+    once 'done' has been posted.
+
+    Args:
+        analyzer (GraphSequenceAnalyzer): Analyzer to run the search with
+        sequence (List[int]): The degree sequence to analyze
+        method (str): Which method to use - 'havel-hakimi', 'erdos-gallai', or 'both'
+    """
+
+    def __init__(self, analyzer: GraphSequenceAnalyzer, sequence: List[int],
+                 method: str = 'both'):
+        super().__init__(daemon=True)
+        self.analyzer = analyzer
+        self.sequence = sequence
+        self.method = method
+        self.messages: "queue.Queue" = queue.Queue()
+        self.stats = SearchStats()
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel was called"""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Asks the search to stop at its next search node"""
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            verdict = self.analyzer.graphic_verdict(self.sequence, method=self.method)
+            self.messages.put(('verdict', verdict))
+            if verdict:
+                for G in self.analyzer.iter_graphs(self.sequence, stop=self._cancelled.is_set,
+                                                   stats=self.stats):
+                    self.messages.put(('graph', G))
+            self.messages.put(('done', self.cancelled))
+        except Exception as error:
+            self.messages.put(('error', error))
@@ -0,0 +1,378 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import networkx as nx
+from graph_algorithm import GraphSequenceAnalyzer, SearchStats
+from test_graph import TestCases
+
+
+def legacy_search_nodes(sequence: List[int]) -> int:
+    """
+    Counts the nodes visited by the original include/exclude edge search.
+
+    This is the enumerator generate_all_graphs used before it tracked residual
+    degrees: every pair of vertices is a binary decision, pruned only when an
+    endpoint is already saturated, with the whole degree list re-sorted at
+    every node. Only the number of visited nodes is returned.
+    """
+    n = len(sequence)
+    target_degrees = sorted(sequence, reverse=True)
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    nodes = 0
+
+    def generate_recursive(remaining_edges):
+        nonlocal nodes
+        nodes += 1
+        if sorted([G.degree(v) for v in G.nodes()], reverse=True) == target_degrees:
+            return
+        if not remaining_edges:
+            return
+
+        u, v = remaining_edges[0]
+        if (not G.has_edge(u, v) and G.degree(u) < sequence[u] and
+                G.degree(v) < sequence[v]):
+            G.add_edge(u, v)
+            generate_recursive(remaining_edges[1:])
+            G.remove_edge(u, v)
+        generate_recursive(remaining_edges[1:])
+
+    generate_recursive(list(combinations(range(n), 2)))
+    return nodes
+
+
+def benchmark_sequences():
+    """Graphic sequences from the test corpus plus a few larger ones"""
+    sequences = {
+        name: sequence
+        for name, (sequence, _, is_graphic) in TestCases.get_test_cases().items()
+        if is_graphic
+    }
+    sequences["Near-regular (3,3,3,3,3,3,2,2)"] = [3, 3, 3, 3, 3, 3, 2, 2]
+    sequences["2-Regular C7 / C3+C4 (2,...,2)"] = [2] * 7
+    return sequences
+
+
+def enumeration_sequences():
+    """benchmark_sequences plus larger regular, bipartite and power-law sequences"""
+    rng = random.Random(18)
+    sequences = benchmark_sequences()
+    sequences["Cubic (3^10)"] = [3] * 10
+    sequences["Cubic (3^12)"] = [3] * 12
+    sequences["4-Regular (4^9)"] = [4] * 9
+
+    # Degrees of random bipartite graphs: 5 + 5 vertices, both sides summing
+    # to the same number of edges
+    B = nx.bipartite.random_graph(5, 5, 0.5, seed=rng.randrange(10 ** 6))
+    sequences["Random bipartite (5+5)"] = sorted((d for _, d in B.degree()), reverse=True)
+
+    # Power-law degrees, resampled until graphic
+    analyzer = GraphSequenceAnalyzer()
+    while True:
+        sequence = sorted((min(9, int(rng.paretovariate(1.5))) for _ in range(10)), reverse=True)
+        if analyzer.is_graphic(sequence):
+            break
+    sequences["Power-law (n=10)"] = sequence
+    return sequences
+
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def best_time(function: Callable[[], Any], repeats: int) -> Tuple[float, Any]:
+    """Smallest wall time of several calls, and the result of the last one"""
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def random_sequence(n: int, rng: random.Random, max_degree: int = 10) -> List[int]:
+    """
+    A random sequence of degrees in [1, max_degree] with an even sum.
+
+    With max_degree much smaller than n such sequences are graphic, so the
+    checkers run to completion instead of exiting early.
+    """
+    sequence = rng.choices(range(1, max_degree + 1), k=n)
+    if sum(sequence) % 2:
+        sequence[0] += 1 if sequence[0] < max_degree else -1
+    return sequence
+
+
+def run_search_benchmark(legacy_max_vertices: int = 7) -> Results:
+    """Print the search nodes explored by the legacy, pruned and orderly enumerators"""
+    analyzer = GraphSequenceAnalyzer()
+    results: Results = {}
+    header = (f"{'Sequence':<40} {'Legacy nodes':>14} {'Pruned nodes':>14} "
+              f"{'Orderly nodes':>14} {'Time (s)':>9}")
+    print(header)
+    print("-" * len(header))
+
+    for name, sequence in benchmark_sequences().items():
+        legacy: Optional[int] = None
+        if len(sequence) <= legacy_max_vertices:
+            legacy = legacy_search_nodes(sequence)
+
+        pruned_stats = SearchStats()
+        analyzer.generate_all_graphs(sequence, orderly=False, stats=pruned_stats)
+        pruned = pruned_stats.nodes
+
+        orderly_stats = SearchStats()
+        start = time.perf_counter()
+        analyzer.generate_all_graphs(sequence, orderly=True, stats=orderly_stats)
+        elapsed = time.perf_counter() - start
+        orderly = orderly_stats.nodes
+
+        print(f"{name:<40} {legacy if legacy else '-':>14} {pruned:>14} "
+              f"{orderly:>14} {elapsed:>9.3f}")
+        results[f"search/{name}"] = {"seconds": elapsed, "legacy_nodes": legacy,
+                                     "pruned_nodes": pruned, "orderly_nodes": orderly}
+    return results
+
+
+def run_checker_benchmark(max_exponent: int = 7, repeats: int = 3) -> Results:
+    """Print how both checkers scale with the number of vertices"""
+    analyzer = GraphSequenceAnalyzer()
+    checkers = {"erdos-gallai": analyzer.erdos_gallai_check,
+                "havel-hakimi": analyzer.havel_hakimi_check}
+    rng = random.Random(7)
+    results: Results = {}
+    header = f"{'Vertices':>10} {'Erdős-Gallai (s)':>18} {'Havel-Hakimi (s)':>18}"
+    print(header)
+    print("-" * len(header))
+
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        sequence = random_sequence(n, rng)
+        # Large inputs are timed once; they take seconds anyway
+        runs = repeats if n < 10 ** 6 else 1
+        row = []
+        for name, check in checkers.items():
+            elapsed, graphic = best_time(lambda: check(sequence), runs)
+            results[f"checkers/{name}/n={n}"] = {"seconds": elapsed, "graphic": graphic}
+            row.append(elapsed)
+        print(f"{n:>10} {row[0]:>18.4f} {row[1]:>18.4f}")
+    return results
+
+
+def run_enumeration_benchmark(repeats: int = 3) -> Results:
+    """Print the time to enumerate the realizations of each benchmark sequence"""
+    analyzer = GraphSequenceAnalyzer()
+    results: Results = {}
+    header = (f"{'Sequence':<40} {'Graphs':>7} {'Nodes':>9} {'Pruned':>8} {'Dups':>7} "
+              f"{'Search (s)':>11} {'Dedup (s)':>10} {'Time (s)':>9}")
+    print(header)
+    print("-" * len(header))
+
+    for name, sequence in enumeration_sequences().items():
+        # Timed without instrumentation, then once more to break the time down
+        elapsed, graphs = best_time(lambda: analyzer.generate_all_graphs(sequence), repeats)
+        stats = SearchStats()
+        analyzer.generate_all_graphs(sequence, stats=stats)
+        pruned = stats.capacity_prunes + stats.residual_prunes
+        print(f"{name:<40} {len(graphs):>7} {stats.nodes:>9} {pruned:>8} {stats.duplicates:>7} "
+              f"{stats.phase_times.get('search', 0.0):>11.3f} "
+              f"{stats.phase_times.get('dedup', 0.0):>10.3f} {elapsed:>9.3f}")
+        results[f"enumeration/{name}"] = {"seconds": elapsed, "graphs": len(graphs),
+                                          "sequence": sequence, "stats": stats.as_dict()}
+    return results
+
+
+def run_render_benchmark(repeats: int = 3) -> Results:
+    """
+    Print the layout and draw time of showing realizations, as the GUI does.
+
+    Uses graph_view with matplotlib's headless Agg canvas: "first" is a
+    realization shown on an empty canvas, "page" is paging through all
+    realizations of the sequence with warm-started layouts and in-place
+    artist updates.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from graph_view import GraphDrawing, compute_layout
+
+    analyzer = GraphSequenceAnalyzer()
+    rng = random.Random(13)
+    cases = {
+        "Cubic (3^10)": analyzer.generate_all_graphs([3] * 10),
+        "4-Regular (4^9)": analyzer.generate_all_graphs([4] * 9),
+        "Random cubic (n=200)": [nx.random_regular_graph(3, 200, seed=rng.randrange(10 ** 6))
+                                 for _ in range(5)],
+        "Random cubic (n=1000)": [nx.random_regular_graph(3, 1000, seed=rng.randrange(10 ** 6))
+                                  for _ in range(3)],
+    }
+    results: Results = {}
+    header = f"{'Graphs':<24} {'Count':>6} {'First (ms)':>11} {'Per page (ms)':>14}"
+    print(header)
+    print("-" * len(header))
+
+    for name, graphs in cases.items():
+        def first():
+            figure = Figure(figsize=(8, 8), dpi=100, tight_layout=True)
+            canvas = FigureCanvasAgg(figure)
+            GraphDrawing(figure.add_subplot(111)).show(graphs[0], compute_layout(graphs[0]))
+            canvas.draw()
+
+        def page():
+            figure = Figure(figsize=(8, 8), dpi=100, tight_layout=True)
+            canvas = FigureCanvasAgg(figure)
+            drawing = GraphDrawing(figure.add_subplot(111))
+            pos = None
+            for G in graphs:
+                pos = compute_layout(G, previous=pos)
+                drawing.show(G, pos)
+                canvas.draw()
+
+        first_time, _ = best_time(first, repeats)
+        page_time, _ = best_time(page, repeats)
+        per_page = page_time / len(graphs)
+        print(f"{name:<24} {len(graphs):>6} {first_time * 1000:>11.1f} {per_page * 1000:>14.1f}")
+        results[f"render/{name}/first"] = {"seconds": first_time}
+        results[f"render/{name}/page"] = {"seconds": per_page, "graphs": len(graphs)}
+    return results
+
+
+# Modules that must not be loaded just to check sequences
+HEAVY_MODULES = ("networkx", "numpy", "matplotlib", "tkinter", "concurrent.futures")
+
+
+def measure_import(module: str, repeats: int = 5) -> Tuple[float, List[str]]:
+    """
+    Times importing a module in fresh interpreters.
+
+    Returns:
+        Tuple[float, List[str]]: Best import time in seconds, and which of
+            HEAVY_MODULES the import pulled in
+    """
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    best, heavy = float("inf"), []
+    for _ in range(repeats):
+        # Run next to the modules, so the benchmark works from any directory
+        output = subprocess.run([sys.executable, "-c", script], check=True,
+                                capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split()
+        best, heavy = min(best, float(output[0])), output[1:]
+    return best, heavy
+
+
+def run_import_benchmark(repeats: int = 5) -> Results:
+    """Print the cold import time of the modules headless callers load"""
+    results: Results = {}
+    header = f"{'Module':<20} {'Import (ms)':>12}  Heavy modules loaded"
+    print(header)
+    print("-" * len(header))
+    for module in ("graph_algorithm", "cli", "sequence_cache"):
+        elapsed, heavy = measure_import(module, repeats)
+        print(f"{module:<20} {elapsed * 1000:>12.1f}  {', '.join(heavy) or '-'}")
+        results[f"imports/{module}"] = {"seconds": elapsed, "heavy_modules": heavy}
+    return results
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """
+    Print each benchmark's time relative to a baseline run.
+
+    Args:
+        results (Results): The current run
+        baseline (Results): A stored run to compare against
+        tolerance (float): Slowdown factor above which a benchmark regressed
+
+    Returns:
+        List[str]: Names of the benchmarks that regressed
+    """
+    regressions = []
+    header = f"{'Benchmark':<60} {'Baseline (s)':>13} {'Now (s)':>10} {'Ratio':>7}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, now = baseline[name]["seconds"], result["seconds"]
+        ratio = now / before if before > 0 else float("inf")
+        flag = ""
+        if ratio > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<60} {before:>13.4f} {now:>10.4f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+SUITES = ["search", "checkers", "enumeration", "render", "imports"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graph Sequence Analyzer benchmarks")
+    parser.add_argument(
+        "--suite", choices=SUITES, action="append",
+        help="benchmark to run; may be repeated (default: all)"
+    )
+    parser.add_argument(
+        "--legacy-max-vertices", type=int, default=7,
+        help="largest sequence to run the legacy search on (it is exponential in n²)"
+    )
+    parser.add_argument(
+        "--checker-max-exponent", type=int, default=7,
+        help="largest checker benchmark has 10^this many vertices"
+    )
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="runs per benchmark; the fastest one counts")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="compare against a JSON file written by --json")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="slowdown factor that counts as a regression in --compare")
+    args = parser.parse_args()
+
+    suites = args.suite or SUITES
+    runners = {
+        "search": lambda: run_search_benchmark(args.legacy_max_vertices),
+        "checkers": lambda: run_checker_benchmark(args.checker_max_exponent, args.repeats),
+        "enumeration": lambda: run_enumeration_benchmark(args.repeats),
+        "render": lambda: run_render_benchmark(args.repeats),
+        "imports": lambda: run_import_benchmark(args.repeats),
+    }
+    results: Results = {}
+    for suite in SUITES:
+        if suite in suites:
+            if results:
+                print()
+            results.update(runners[suite]())
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        print()
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.tolerance}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
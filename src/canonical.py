@@ -0,0 +1,251 @@
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# Graphs are handled as adjacency bitsets: rows[v] has bit u set when u and v
+# are adjacent. Certificates are tuples of such rows after relabeling.
+Certificate = Tuple[int, ...]
+
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+def _mask(vertices: Sequence[int]) -> int:
+    mask = 0
+    for v in vertices:
+        mask |= 1 << v
+    return mask
+
+
+def refine(rows: Sequence[int], cells: List[List[int]],
+           splitters: Optional[List[List[int]]] = None) -> List[List[int]]:
+    """
+    Refines an ordered vertex partition until it is equitable.
+
+    A cell is split whenever its vertices differ in how many neighbors they
+    have inside some other cell (the splitter). The pieces are ordered by that
+    count, so the result depends only on the graph structure and not on the
+    vertex labels. Starting from a single cell this is the 1-dimensional
+    Weisfeiler-Lehman color refinement.
+
+    Args:
+        rows (Sequence[int]): Adjacency bitsets of the graph
+        cells (List[List[int]]): Ordered partition of the vertices
+        splitters (Optional[List[List[int]]]): Cells to split by first. Defaults
+            to all of them; when cells was equitable before one of its cells
+            got split, passing just the new pieces is enough.
+
+    Returns:
+        List[List[int]]: The coarsest equitable refinement of cells
+    """
+    cells = [list(cell) for cell in cells]
+    masks = [_mask(cell) for cell in cells]
+
+    # Every cell is used as a splitter once, and so is every piece a split
+    # produces; splitting by a stale cell is harmless since it is a union of
+    # current ones
+    queue = deque(cells if splitters is None else splitters)
+    while queue:
+        splitter = queue.popleft()
+        mask = _mask(splitter)
+        reach = 0
+        for v in splitter:
+            reach |= rows[v]
+
+        refined, refined_masks = [], []
+        for cell, cell_mask in zip(cells, masks):
+            # A cell with no neighbor in the splitter cannot be split by it
+            if len(cell) == 1 or not cell_mask & reach:
+                refined.append(cell)
+                refined_masks.append(cell_mask)
+                continue
+            groups: Dict[int, List[int]] = {}
+            for v in cell:
+                groups.setdefault(_popcount(rows[v] & mask), []).append(v)
+            if len(groups) == 1:
+                refined.append(cell)
+                refined_masks.append(cell_mask)
+            else:
+                pieces = [groups[key] for key in sorted(groups)]
+                refined.extend(pieces)
+                refined_masks.extend(_mask(piece) for piece in pieces)
+                queue.extend(pieces)
+        cells, masks = refined, refined_masks
+    return cells
+
+
+def _quotient(rows: Sequence[int], cells: List[List[int]]) -> Tuple:
+    """Cell sizes and neighbor counts between cells of an equitable partition"""
+    masks = [_mask(cell) for cell in cells]
+    return tuple(
+        (len(cell), tuple(_popcount(rows[cell[0]] & mask) for mask in masks))
+        for cell in cells
+    )
+
+
+def relabel(rows: Sequence[int], order: List[int]) -> Certificate:
+    """Adjacency bitsets after renaming vertex order[i] to i"""
+    position = [0] * len(rows)
+    for i, v in enumerate(order):
+        position[v] = i
+
+    relabeled = []
+    for v in order:
+        row, new_row = rows[v], 0
+        while row:
+            low = row & -row
+            new_row |= 1 << position[low.bit_length() - 1]
+            row ^= low
+        relabeled.append(new_row)
+    return tuple(relabeled)
+
+
+def _canonical_from(rows: Sequence[int], cells: List[List[int]]) -> Certificate:
+    """Individualization-refinement search below an already equitable partition"""
+    n = len(rows)
+    first: List = [None, None]   # certificate and order of the first leaf
+    best: List = [None, None]    # certificate and order of the largest leaf
+    generators: List[List[int]] = []
+
+    def record_automorphism(order: List[int], other: List[int]):
+        mapping = list(range(n))
+        for v, w in zip(order, other):
+            mapping[v] = w
+        generators.append(mapping)
+
+    def same_orbit(v: int, explored: List[int], prefix: List[int]) -> bool:
+        # Orbits of the automorphisms found so far that fix the prefix
+        parent = list(range(n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for mapping in generators:
+            if all(mapping[u] == u for u in prefix):
+                for x in range(n):
+                    parent[find(x)] = find(mapping[x])
+        root = find(v)
+        return any(find(w) == root for w in explored)
+
+    def search(cells: List[List[int]], prefix: List[int]):
+        target = next((i for i, cell in enumerate(cells) if len(cell) > 1), None)
+        if target is None:
+            order = [cell[0] for cell in cells]
+            certificate = relabel(rows, order)
+            if first[0] is None:
+                first[0], first[1] = certificate, order
+            elif certificate == first[0]:
+                record_automorphism(order, first[1])
+            if best[0] is None or certificate > best[0]:
+                best[0], best[1] = certificate, order
+            elif certificate == best[0] and best[1] is not first[1]:
+                record_automorphism(order, best[1])
+            return
+
+        explored: List[int] = []
+        for v in list(cells[target]):
+            # Children in the same orbit lead to the same certificates
+            if explored and same_orbit(v, explored, prefix):
+                continue
+            explored.append(v)
+            rest = [w for w in cells[target] if w != v]
+            child = cells[:target] + [[v], rest] + cells[target + 1:]
+            search(refine(rows, child, [[v]]), prefix + [v])
+
+    search(cells, [])
+    return best[0]
+
+
+def canonical_form(rows: Sequence[int]) -> Certificate:
+    """
+    Computes a canonical certificate of a simple graph.
+
+    Two graphs get the same certificate if and only if they are isomorphic.
+    The certificate is the lexicographically largest relabeled adjacency
+    over the leaves of an individualization-refinement search tree, pruned
+    with the automorphisms discovered along the way.
+
+    Args:
+        rows (Sequence[int]): Adjacency bitsets of the graph
+
+    Returns:
+        Certificate: Hashable canonical adjacency bitsets
+    """
+    cells = refine(rows, [list(range(len(rows)))] if rows else [])
+    return _canonical_from(rows, cells)
+
+
+def graph_rows(G) -> List[int]:
+    """Adjacency bitsets of a networkx graph whose nodes are 0..n-1"""
+    return [sum(1 << u for u in G[v]) for v in range(G.number_of_nodes())]
+
+
+def rows_to_graph(rows: Sequence[int]):
+    """Networkx graph on nodes 0..n-1 from adjacency bitsets"""
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(range(len(rows)))
+    for v, row in enumerate(rows):
+        row >>= v + 1
+        u = v + 1
+        while row:
+            if row & 1:
+                G.add_edge(v, u)
+            row >>= 1
+            u += 1
+    return G
+
+
+class CanonicalDeduplicator:
+    """
+    Remembers graphs up to isomorphism with O(1) hash lookups per candidate.
+
+    Candidates are first bucketed by their Weisfeiler-Lehman refinement
+    invariant, which is cheap and usually already tells non-isomorphic graphs
+    apart. The exact canonical form is only computed once a bucket receives a
+    second graph, and from then on every member of the bucket is kept in a
+    set of certificates.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple, Tuple[List, Set[Certificate]]] = {}
+
+    def __len__(self) -> int:
+        return sum(1 if pending[0] is not None else len(certificates)
+                   for pending, certificates in self._buckets.values())
+
+    def add(self, rows: Sequence[int]) -> bool:
+        """
+        Adds a graph unless an isomorphic one was added before.
+
+        Args:
+            rows (Sequence[int]): Adjacency bitsets of the graph
+
+        Returns:
+            bool: True if the graph is new, False if it is a duplicate
+        """
+        cells = refine(rows, [list(range(len(rows)))] if rows else [])
+        invariant = _quotient(rows, cells)
+
+        bucket = self._buckets.get(invariant)
+        if bucket is None:
+            self._buckets[invariant] = ([rows, cells], set())
+            return True
+
+        pending, certificates = bucket
+        if pending[0] is not None:
+            certificates.add(_canonical_from(pending[0], pending[1]))
+            pending[0] = pending[1] = None
+
+        certificate = _canonical_from(rows, cells)
+        if certificate in certificates:
+            return False
+        certificates.add(certificate)
+        return True
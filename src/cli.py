@@ -0,0 +1,319 @@
+"""
+Command-line batch analyzer for degree sequences.
+
+Reads one degree sequence per line, either as integers separated by commas
+and/or whitespace or as JSONL (a JSON array, or an object whose "sequence"
+field holds the array), and writes one result per input line as JSONL or CSV:
+
+    python cli.py sequences.txt --workers 4 --output-format csv -o results.csv
+    echo "3, 3, 2, 2, 2" | python cli.py --count
+
+Bipartite and directed sequences are given in JSON as a pair of arrays,
+(left, right) or (out, in) degrees:
+
+    echo "[[2, 1], [1, 1, 1]]" | python cli.py --method gale-ryser
+
+A single very long sequence can be given as a binary file instead (raw
+little-endian uint32/uint64 degrees, or uint64 counts per degree), which is
+memory-mapped and checked out of core with Erdős-Gallai (see sequence_io):
+
+    python cli.py degrees.bin --input-format uint32
+
+Only the standard library is imported at startup; the analyzer is loaded
+when the first chunk of sequences is processed.
+"""
+import argparse
+import csv
+import json
+import sys
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+
+Record = Dict[str, Any]
+
+# Analyzer of the current process, created on first use
+_analyzer = None
+
+# Methods that take a pair of sequences: bipartite and directed
+PAIR_METHODS = ('gale-ryser', 'fulkerson-chen-anstee')
+
+# Input formats holding one sequence as a binary file, read by sequence_io
+BINARY_FORMATS = ('uint32', 'uint64', 'histogram')
+
+
+def parse_line(line: str, input_format: str = 'auto') -> Record:
+    """
+    Parses one input line into a record holding its degree sequence.
+
+    Args:
+        line (str): The line, without surrounding whitespace
+        input_format (str): 'lines', 'jsonl', or 'auto' to treat lines
+            starting with '[' or '{' as JSON
+
+    Returns:
+        Record: {'sequence': [...]}, plus the other fields of a JSON object
+            line so that ids and labels are passed through to the output
+
+    Raises:
+        ValueError: If the line is not a valid sequence of integers
+    """
+    if input_format == 'jsonl' or (input_format == 'auto' and line[:1] in '[{'):
+        value = json.loads(line)
+        record = dict(value) if isinstance(value, dict) else {'sequence': value}
+        sequence = record.get('sequence')
+        if not _is_int_list(sequence) and not (
+                isinstance(sequence, list) and len(sequence) == 2 and
+                all(_is_int_list(half) for half in sequence)):
+            raise ValueError("expected a JSON array of integers, or a pair of them")
+        return record
+    return {'sequence': [int(x) for x in line.replace(',', ' ').split()]}
+
+
+def _is_int_list(value: Any) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(x, int) and not isinstance(x, bool) for x in value)
+
+
+def read_records(stream: IO[str], input_format: str = 'auto') -> Iterator[Record]:
+    """
+    Lazily parses an input stream, skipping blank lines and '#' comments.
+
+    Args:
+        stream (IO[str]): Text stream with one sequence per line
+        input_format (str): 'lines', 'jsonl' or 'auto'
+
+    Yields:
+        Record: {'line': number, 'sequence': [...], ...}, or {'line': number,
+            'error': message} for lines that cannot be parsed
+    """
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            yield {'line': number, **parse_line(line, input_format)}
+        except ValueError as error:
+            yield {'line': number, 'error': str(error)}
+
+
+def analyze_chunk(records: List[Record], method: str = 'both',
+                  count: bool = False, explain: bool = False) -> List[Record]:
+    """
+    Analyzes a chunk of parsed records; runs in worker processes.
+
+    Args:
+        records (List[Record]): Records from read_records
+        method (str): Which method to use - 'havel-hakimi', 'erdos-gallai',
+            'both', 'gale-ryser' or 'fulkerson-chen-anstee'
+        count (bool): Also count the non-isomorphic realizations of graphic sequences
+        explain (bool): Add the checker's 'reason' to non-graphic simple sequences
+
+    Returns:
+        List[Record]: The records with 'graphic' (and 'realizations', 'reason')
+            filled in
+    """
+    global _analyzer
+    if _analyzer is None:
+        from graph_algorithm import GraphSequenceAnalyzer
+        _analyzer = GraphSequenceAnalyzer()
+
+    results = []
+    for record in records:
+        result = dict(record)
+        if 'error' not in result:
+            try:
+                result.update(_analyze(result['sequence'], method, count, explain))
+            except ValueError as error:
+                result['error'] = str(error)
+        results.append(result)
+    return results
+
+
+def _analyze(sequence: List[Any], method: str, count: bool, explain: bool) -> Record:
+    if (method in PAIR_METHODS) != _is_pair(sequence):
+        raise ValueError("expected a pair of sequences" if method in PAIR_METHODS
+                         else "a pair of sequences needs a bipartite or directed --method")
+    if explain and method not in PAIR_METHODS:
+        # The verdict comes out of the check itself, at no extra cost
+        verdict = _analyzer.graphic_verdict(sequence, method=method)
+        result: Record = {'graphic': verdict.graphic}
+        if not verdict:
+            result['reason'] = verdict.explain()
+    else:
+        result = {'graphic': _analyzer.is_graphic(sequence, method=method)}
+    if count:
+        result['realizations'] = (
+            _analyzer.count_realizations(sequence) if result['graphic'] else 0)
+    return result
+
+
+def _is_pair(sequence: List[Any]) -> bool:
+    return len(sequence) == 2 and all(isinstance(half, list) for half in sequence)
+
+
+def analyze_records(records: Iterable[Record], method: str = 'both', count: bool = False,
+                    workers: int = 1, chunk_size: int = 1000,
+                    explain: bool = False) -> Iterator[Record]:
+    """
+    Streams records through analyze_chunk, in input order.
+
+    With more than one worker, chunks are analyzed in a process pool with a
+    bounded number of chunks in flight, so arbitrarily long inputs run in
+    constant memory.
+
+    Args:
+        records (Iterable[Record]): Records from read_records
+        method (str): Which method to use - 'havel-hakimi', 'erdos-gallai', or 'both'
+        count (bool): Also count the non-isomorphic realizations
+        workers (int): Number of worker processes; 1 analyzes in this process
+        chunk_size (int): Records sent to a worker at a time
+        explain (bool): Add the checker's 'reason' to non-graphic simple sequences
+
+    Yields:
+        Record: One result per input record
+    """
+    records = iter(records)
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield from analyze_chunk(chunk, method, count, explain)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(analyze_chunk, chunk, method, count, explain))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def analyze_binary(path: str, input_format: str, explain: bool = False) -> Record:
+    """
+    Checks the sequence of a binary degree file with Erdős-Gallai.
+
+    Args:
+        path (str): The file
+        input_format (str): 'uint32', 'uint64' or 'histogram'
+        explain (bool): Add the checker's 'reason' if the sequence is not graphic
+
+    Returns:
+        Record: {'input': path, 'graphic': ...}, or {'input': path, 'error':
+            message} if the file cannot be read as that format
+    """
+    from sequence_io import check_degree_file
+
+    result: Record = {'input': path}
+    try:
+        verdict = check_degree_file(path, input_format)
+    except ValueError as error:
+        result['error'] = str(error)
+        return result
+    result['graphic'] = verdict.graphic
+    if explain and not verdict:
+        result['reason'] = verdict.explain()
+    return result
+
+
+def write_jsonl(results: Iterable[Record], stream: IO[str]):
+    """Writes one JSON object per result"""
+    for result in results:
+        stream.write(json.dumps(result) + '\n')
+
+
+def write_csv(results: Iterable[Record], stream: IO[str], count: bool = False,
+              explain: bool = False, binary: bool = False):
+    """
+    Writes results as CSV, with the sequence as space-separated degrees and
+    the two halves of a pair separated by ' | ', or the input file's name
+    in place of both for binary input
+    """
+    fields = ((['input'] if binary else ['line', 'sequence']) + ['graphic'] + (['realizations'] if count else []) +
+              (['reason'] if explain else []) + ['error'])
+    writer = csv.DictWriter(stream, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for result in results:
+        row = dict(result)
+        if 'sequence' in row:
+            halves = row['sequence'] if _is_pair(row['sequence']) else [row['sequence']]
+            row['sequence'] = ' | '.join(' '.join(map(str, half)) for half in halves)
+        writer.writerow(row)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Batch graphicality checks for degree sequences")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file with one sequence per line (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--input-format", choices=["auto", "lines", "jsonl", *BINARY_FORMATS],
+                        default="auto",
+                        help="text formats hold one sequence per line; binary ones hold "
+                             "a single sequence, checked with Erdős-Gallai")
+    parser.add_argument("--output-format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--method", choices=["both", "havel-hakimi", "erdos-gallai",
+                                             *PAIR_METHODS],
+                        default="both")
+    parser.add_argument("--count", action="store_true",
+                        help="also count the non-isomorphic realizations (slow)")
+    parser.add_argument("--explain", action="store_true",
+                        help="say why each non-graphic sequence is rejected")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="sequences sent to a worker at a time")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the batch analyzer.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments; defaults to sys.argv[1:]
+
+    Returns:
+        int: Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.count and args.method in PAIR_METHODS:
+        parser.error("--count is only supported for simple sequences")
+    binary = args.input_format in BINARY_FORMATS
+    if binary:
+        if args.input == "-":
+            parser.error("binary input must be a file")
+        if args.count or args.method not in ("both", "erdos-gallai"):
+            parser.error("binary input only supports the Erdős-Gallai check")
+        return _write_results([analyze_binary(args.input, args.input_format, args.explain)],
+                              args, binary=True)
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    try:
+        results = analyze_records(read_records(source, args.input_format), args.method,
+                                  args.count, args.workers, max(1, args.chunk_size),
+                                  args.explain)
+        return _write_results(results, args)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _write_results(results: Iterable[Record], args: argparse.Namespace,
+                   binary: bool = False) -> int:
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8",
+                                                         newline="")
+    try:
+        if args.output_format == "csv":
+            write_csv(results, target, args.count, args.explain, binary)
+        else:
+            write_jsonl(results, target)
+    finally:
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,187 @@
-from typing import List, Set, Dict, Tuple
-import networkx as nx
+import time
+from array import array
+from typing import TYPE_CHECKING, Callable, Iterator, List, NamedTuple, Optional, Sequence, Set, Dict, Tuple
 from itertools import combinations
+from math import comb
+from canonical import CanonicalDeduplicator, canonical_form, relabel, rows_to_graph
+
+# networkx and the process pool are only imported by the code paths that
+# need them, so the degree-sequence checks load in a few milliseconds
+if TYPE_CHECKING:
+    import networkx as nx
+    from sequence_cache import SequenceCache
+
+# Kinds of realization understood by is_realizable and realize
+REALIZATION_CONSTRAINTS = ('simple', 'connected', 'tree', 'forest', 'multigraph',
+                           'multigraph-loops', 'k-edge-connected')
+
+# Realization sets larger than this are never written to the cache: holding
+# them for the cache would undo the memory savings of streaming the search
+MAX_CACHED_REALIZATIONS = 10000
+
+# Seconds between checks of stop and timeout while waiting for a worker process
+STOP_POLL_INTERVAL = 0.05
+
+# Set in every worker process of the parallel search; the parent sets it to
+# make the subtree searches still running stop at their next search node
+_cancel_event = None
+
+class _SearchStopped(Exception):
+    """Raised inside the realization search to abandon it early"""
+
+class _Subproblem(NamedTuple):
+    """An unexpanded node of the realization search, handed to a worker process"""
+    position: int
+    rows: Tuple[int, ...]
+    residual: Tuple[int, ...]
+
+class SearchStats:
+    """
+    Counters and timings of one realization search.
+    
+    Pass an instance as stats= to generate_all_graphs, iter_graphs or
+    iter_realizations to have it filled in; without one, the search does no
+    bookkeeping at all. Every search keeps its own counters here rather than
+    on the analyzer, so searches sharing an analyzer, e.g. from several
+    threads, never mix up their counts.
+    
+    Attributes:
+        nodes (int): Search nodes visited
+        leaves (int): Labeled realizations reached, before deduplication
+        capacity_prunes (int): Branches dropped because a vertex had too few
+            open vertices left to reach its degree
+        residual_checks (int): Havel-Hakimi checks of the residual degrees
+        residual_prunes (int): Branches dropped because the residual degrees
+            of the remaining vertices were not graphic
+        dedup_lookups (int): Realizations looked up in the isomorphism deduplicator
+        duplicates (int): Lookups that found an isomorphic realization
+        phase_times (Dict[str, float]): Seconds spent in each phase: 'check'
+            (is the sequence graphic), 'search' (tree walk including the
+            residual checks), 'dedup' (canonical forms) and 'graphs'
+            (building networkx graphs)
+        peak_memory (Optional[int]): Peak traced allocation in bytes when
+            tracking memory
+    
+    Args:
+        track_memory (bool): Trace allocations with tracemalloc during the
+            search, which slows it down
+    """
+    
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.nodes = 0
+        self.leaves = 0
+        self.capacity_prunes = 0
+        self.residual_checks = 0
+        self.residual_prunes = 0
+        self.dedup_lookups = 0
+        self.duplicates = 0
+        self.phase_times: Dict[str, float] = {}
+        self.peak_memory: Optional[int] = None
+        
+    def add_time(self, phase: str, seconds: float):
+        """Adds seconds to the time of a phase"""
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+        
+    def merge_counts(self, other: 'SearchStats'):
+        """Adds the counters of another search, e.g. one run in a worker process"""
+        self.nodes += other.nodes
+        self.leaves += other.leaves
+        self.capacity_prunes += other.capacity_prunes
+        self.residual_checks += other.residual_checks
+        self.residual_prunes += other.residual_prunes
+        self.dedup_lookups += other.dedup_lookups
+        self.duplicates += other.duplicates
+        
+    def as_dict(self) -> Dict:
+        """All counters and timings as a JSON-serializable dict"""
+        return {
+            'nodes': self.nodes,
+            'leaves': self.leaves,
+            'capacity_prunes': self.capacity_prunes,
+            'residual_checks': self.residual_checks,
+            'residual_prunes': self.residual_prunes,
+            'dedup_lookups': self.dedup_lookups,
+            'duplicates': self.duplicates,
+            'phase_times': dict(self.phase_times),
+            'peak_memory': self.peak_memory,
+        }
+        
+    def summary(self) -> List[str]:
+        """Short human-readable lines, e.g. for the GUI"""
+        lines = [
+            f"Search nodes: {self.nodes:,} ({self.leaves:,} labeled realizations)",
+            f"Pruned: {self.capacity_prunes + self.residual_prunes:,} branches "
+            f"({self.residual_prunes:,} of {self.residual_checks:,} residual checks)",
+            f"Isomorphism lookups: {self.dedup_lookups:,} ({self.duplicates:,} duplicates)",
+        ]
+        if self.phase_times:
+            lines.append("Time: " + ", ".join(
+                f"{phase} {seconds:.3f} s" for phase, seconds in self.phase_times.items()))
+        if self.peak_memory is not None:
+            lines.append(f"Peak memory: {self.peak_memory / 2 ** 20:.1f} MiB")
+        return lines
+
+class GraphicVerdict(NamedTuple):
+    """
+    Outcome of a graphicality check, with a certificate when it fails.
+    
+    reason is one of
+    
+    - 'graphic': the sequence is graphic
+    - 'negative': degree left is negative
+    - 'degree-too-large': degree left exceeds the right = n - 1 other vertices
+    - 'odd-sum': the degrees sum to left, which is odd
+    - 'erdos-gallai': k is the first index where the inequality fails; the
+      k largest degrees sum to left, more than the bound right
+    - 'havel-hakimi': at step number step, the vertex laid down has residual
+      degree left but only right vertices with positive residual degree remain
+    
+    A verdict is truthy exactly when the sequence is graphic, so it can be
+    used wherever a bool was.
+    """
+    graphic: bool
+    reason: str
+    k: Optional[int] = None
+    left: Optional[int] = None
+    right: Optional[int] = None
+    step: Optional[int] = None
+    
+    def __bool__(self) -> bool:
+        return self.graphic
+        
+    def explain(self) -> str:
+        """A one-line human-readable account of the verdict"""
+        if self.reason == 'graphic':
+            return "The sequence is graphic"
+        elif self.reason == 'negative':
+            return f"Degree {self.left} is negative"
+        elif self.reason == 'degree-too-large':
+            return f"Degree {self.left} exceeds the {self.right} other vertices"
+        elif self.reason == 'odd-sum':
+            return f"Sum of degrees ({self.left}) must be even"
+        elif self.reason == 'erdos-gallai':
+            return (f"Erdős-Gallai fails at k = {self.k}: the {self.k} largest degrees "
+                    f"sum to {self.left} > {self.right}")
+        vertices = "vertex" if self.right == 1 else "vertices"
+        return (f"Havel-Hakimi step {self.step}: a vertex of degree {self.left} "
+                f"but only {self.right} {vertices} left to connect to")
+
+# Shared verdict of every graphic sequence, so passing checks allocate nothing
+GRAPHIC = GraphicVerdict(True, 'graphic')
 
 class GraphSequenceAnalyzer:
     """
     A class for analyzing graphic sequences using both Havel-Hakimi and Erdős-Gallai theorems.
+    
+    Args:
+        cache (Optional[SequenceCache]): Memoizes graphicality verdicts,
+            realization counts and realization sets across calls
     """
     
+    def __init__(self, cache: Optional['SequenceCache'] = None):
+        self.cache = cache
+    
     def erdos_gallai_check(self, sequence: List[int]) -> bool:
         """
         Implements the Erdős-Gallai theorem to check if a sequence is graphic.
@@ -14,6 +189,182 @@ class GraphSequenceAnalyzer:
         The Erdős-Gallai theorem states that a sequence of non-negative integers 
         d1 ≥ d2 ≥ ... ≥ dn is graphic if and only if its sum is even and
         
+        sum(di) <= k(k-1) + sum(min(di,k)) for all k in [1,n]
+                                          i=k+1
+        
+        This runs in O(n): a simple graph on n vertices has no degree above
+        n - 1, so the sequence is counting-sorted into a degree histogram, and
+        the inequality only needs to be tested at the "corner" indices k where
+        d_k > d_(k+1) (Tripathi & Vijay, 2003). Both sides are read off running
+        suffix sums of the histogram instead of being re-summed for every k.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            bool: True if the sequence is graphic, False otherwise
+        """
+        return bool(self._erdos_gallai(sequence))
+        
+    def erdos_gallai_verdict(self, sequence: List[int]) -> GraphicVerdict:
+        """
+        The Erdős-Gallai check of erdos_gallai_check, with a failure certificate.
+        
+        A failing corner k ends a run of equal degrees, and the first failing
+        index may lie earlier in that run; only then is the run re-scanned
+        from its start, so a passing check costs nothing extra and a failing
+        one at most O(n).
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            GraphicVerdict: GRAPHIC, or why the sequence is not graphic
+        """
+        return self._erdos_gallai(sequence, certify=True)
+        
+    def _erdos_gallai(self, sequence: List[int], certify: bool = False):
+        """
+        Shared core of the Erdős-Gallai check: GRAPHIC, or on failure a
+        certificate if certify is set and plain False otherwise, so that
+        the bool check never builds one.
+        """
+        if not sequence:
+            return GRAPHIC
+            
+        n = len(sequence)
+        
+        # Counting sort; negative degrees and degrees above n - 1 can never
+        # be realized, so they are rejected while filling the histogram
+        counts = [0] * n
+        for d in sequence:
+            if d < 0 or d >= n:
+                return certify and self._degree_verdict(d, n)
+            counts[d] += 1
+            
+        return self._erdos_gallai_histogram(counts, certify)
+        
+    def erdos_gallai_histogram_check(self, counts: Sequence[int]) -> bool:
+        """
+        The Erdős-Gallai check of erdos_gallai_check, run on a degree histogram.
+        
+        counts[d] is the number of vertices of degree d, so the sequence has
+        sum(counts) vertices. The check takes O(len(counts)) time and memory
+        however many vertices there are, which lets sequences far too long to
+        hold as a list be checked from their histogram alone (see sequence_io).
+        
+        Args:
+            counts (Sequence[int]): Number of vertices of every degree
+            
+        Returns:
+            bool: True if the sequence is graphic, False otherwise
+            
+        Raises:
+            ValueError: If a count is negative
+        """
+        return bool(self._erdos_gallai_histogram(self._histogram_counts(counts)))
+        
+    def erdos_gallai_histogram_verdict(self, counts: Sequence[int]) -> GraphicVerdict:
+        """
+        The histogram check of erdos_gallai_histogram_check, with a failure certificate.
+        
+        Args:
+            counts (Sequence[int]): Number of vertices of every degree
+            
+        Returns:
+            GraphicVerdict: GRAPHIC, or why the sequence is not graphic
+            
+        Raises:
+            ValueError: If a count is negative
+        """
+        return self._erdos_gallai_histogram(self._histogram_counts(counts), certify=True)
+        
+    @staticmethod
+    def _histogram_counts(counts: Sequence[int]) -> List[int]:
+        # numpy arrays, memory-mapped ones included, convert in one call
+        counts = counts.tolist() if hasattr(counts, 'tolist') else [int(c) for c in counts]
+        if any(c < 0 for c in counts):
+            raise ValueError("counts must be non-negative")
+        return counts
+        
+    def _erdos_gallai_histogram(self, counts: List[int], certify: bool = False):
+        """Erdős-Gallai core on counts[d] = number of vertices of degree d"""
+        top = len(counts)
+        while top and not counts[top - 1]:
+            top -= 1
+            
+        # count_ge[t] / sum_ge[t]: how many degrees are >= t, and their sum.
+        # In the sorted sequence the first count_ge[t] entries are exactly the
+        # degrees >= t, so sum_ge doubles as the prefix sum at that index.
+        # Both are 0 from the largest degree on.
+        count_ge = [0] * (top + 1)
+        sum_ge = [0] * (top + 1)
+        for t in range(top - 1, -1, -1):
+            count_ge[t] = count_ge[t + 1] + counts[t]
+            sum_ge[t] = sum_ge[t + 1] + t * counts[t]
+        n, total = count_ge[0], sum_ge[0]
+        
+        if top > n:
+            return certify and self._degree_verdict(top - 1, n)
+            
+        # Check if sum is even
+        if total % 2 != 0:
+            return certify and GraphicVerdict(False, 'odd-sum', left=total)
+            
+        # Walk the corners from the largest degree down, so k only grows
+        for degree in range(top - 1, -1, -1):
+            if not counts[degree]:
+                continue
+            k = count_ge[degree]
+            left_sum = sum_ge[degree]
+            
+            # Pointer to the last index whose degree is still >= k: every
+            # entry after k up to it contributes min(di, k) = k, and every
+            # entry past it contributes its own degree
+            p = count_ge[k] if k <= top else 0
+            right_sum = k * (k - 1) + k * max(0, p - k)
+            right_sum += total - (sum_ge[k] if p >= k else left_sum)
+            
+            if left_sum > right_sum:
+                return certify and self._first_erdos_gallai_failure(degree, count_ge,
+                                                                    sum_ge, total)
+                
+        return GRAPHIC
+        
+    @staticmethod
+    def _degree_verdict(d: int, n: int) -> GraphicVerdict:
+        """Verdict on a degree outside [0, n - 1]"""
+        if d < 0:
+            return GraphicVerdict(False, 'negative', left=d)
+        return GraphicVerdict(False, 'degree-too-large', left=d, right=n - 1)
+        
+    @staticmethod
+    def _first_erdos_gallai_failure(degree: int, count_ge: List[int], sum_ge: List[int],
+                                    total: int) -> GraphicVerdict:
+        """First failing index within the run of a degree whose corner fails"""
+        first, last = count_ge[degree + 1] + 1, count_ge[degree]
+        for k in range(first, last + 1):
+            left_sum = sum_ge[degree + 1] + (k - first + 1) * degree
+            # Entries after k: the rest of the run, then degrees below it
+            right_sum = k * (k - 1) + (last - k) * min(degree, k)
+            if k <= degree:
+                right_sum += k * (count_ge[k] - last) + total - sum_ge[k]
+            else:
+                right_sum += total - sum_ge[degree]
+            if left_sum > right_sum:
+                return GraphicVerdict(False, 'erdos-gallai', k=k, left=left_sum, right=right_sum)
+        raise AssertionError("the corner of the run fails")
+        
+    def erdos_gallai_reference_check(self, sequence: List[int]) -> bool:
+        """
+        Direct O(n²) transcription of the Erdős-Gallai theorem.
+
+        Kept as the reference implementation that the test suite checks
+        erdos_gallai_check against.
+        
+        The Erdős-Gallai theorem states that a sequence of non-negative integers 
+        d1 ≥ d2 ≥ ... ≥ dn is graphic if and only if its sum is even and
+        
         sum(di) <= k(k-1) + sum(min(di,k)) for all k in [1,n]
                                           i=k+1
         
@@ -49,6 +400,192 @@ class GraphSequenceAnalyzer:
         """
         Implements the Havel-Hakimi theorem to check if a sequence is graphic.
         
+        The residual degrees live in one array kept in descending order, next
+        to a degree-indexed count table (a bucket queue). Each step retires the
+        leading vertex and lowers the next d1 entries in place: entries above
+        the smallest affected degree v stay ordered after the decrement, and
+        within the run of v's only the *last* ones are lowered, so the array
+        never has to be re-sorted. A step costs O(d1), which makes the whole
+        check O(n + m) for a sequence with m edges.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            bool: True if the sequence is graphic, False otherwise
+        """
+        return bool(self._havel_hakimi(sequence))
+        
+    def havel_hakimi_verdict(self, sequence: List[int]) -> GraphicVerdict:
+        """
+        The bucket-queue check of havel_hakimi_check, with a failure certificate.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            GraphicVerdict: GRAPHIC, or the step at which the construction
+                got stuck
+        """
+        return self._havel_hakimi(sequence, certify=True)
+        
+    def havel_hakimi_edges(self, sequence: List[int]):
+        """
+        Builds one realization of a sequence with the Havel-Hakimi construction.
+        
+        Runs the same bucket-queue steps as havel_hakimi_check. A step connects
+        the leading vertex to two contiguous ranges of positions in the sorted
+        array, and vertices never move between positions, so only the four
+        range bounds are recorded per step; the edge array is expanded from
+        them in one vectorized pass. O(n + m) overall.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            Optional[np.ndarray]: An (m, 2) int64 array of edges where vertex v
+                has degree sequence[v], or None if the sequence is not graphic
+        """
+        import numpy as np
+        
+        steps = array('q')
+        if not self._havel_hakimi(sequence, steps):
+            return None
+        if not steps:
+            return np.zeros((0, 2), dtype=np.int64)
+            
+        # Vertex at each position of the sorted array
+        ids = np.argsort(-np.asarray(sequence, dtype=np.int64), kind='stable')
+        bounds = np.frombuffer(steps, dtype=np.int64).reshape(-1, 4)
+        start, head_end, tail_start, tail_end = bounds.T
+        
+        # Every step contributes the ranges [start + 1, head_end) and
+        # [tail_start, tail_end); lay all ranges end to end and turn each
+        # output slot into the position it came from
+        range_start = np.column_stack([start + 1, tail_start]).ravel()
+        range_length = np.column_stack([head_end - start - 1, tail_end - tail_start]).ravel()
+        offsets = np.cumsum(range_length) - range_length
+        positions = (np.arange(range_length.sum()) +
+                     np.repeat(range_start - offsets, range_length))
+        
+        sources = np.repeat(ids[start], head_end - start - 1 + tail_end - tail_start)
+        return np.column_stack([sources, ids[positions]])
+        
+    def havel_hakimi_graph(self, sequence: List[int]) -> Optional['nx.Graph']:
+        """
+        Builds one realization of a sequence as a networkx graph.
+        
+        Same construction as havel_hakimi_edges, without enumerating any
+        other realization.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            
+        Returns:
+            Optional[nx.Graph]: A graph on nodes 0..n-1 where node v has
+                degree sequence[v], or None if the sequence is not graphic
+        """
+        import networkx as nx
+        
+        steps = array('q')
+        if not self._havel_hakimi(sequence, steps):
+            return None
+        ids = sorted(range(len(sequence)), key=lambda v: -sequence[v])
+        
+        G = nx.Graph()
+        G.add_nodes_from(range(len(sequence)))
+        for i in range(0, len(steps), 4):
+            start, head_end, tail_start, tail_end = steps[i:i + 4]
+            u = ids[start]
+            G.add_edges_from((u, v) for v in ids[start + 1:head_end])
+            G.add_edges_from((u, v) for v in ids[tail_start:tail_end])
+        return G
+        
+    def _havel_hakimi(self, sequence: List[int], steps: Optional[array] = None,
+                      certify: bool = False):
+        """
+        Bucket-queue Havel-Hakimi on the descending array of residual degrees.
+        
+        Returns GRAPHIC, or on failure a certificate if certify is set and
+        plain False otherwise.
+        
+        When steps is given, each step appends (start, lo, tail_start,
+        tail_end): the vertex at position start was connected to positions
+        start + 1..lo - 1 and tail_start..tail_end - 1 of the initial
+        descending order, ties broken by vertex index.
+        """
+        if not sequence:
+            return GRAPHIC
+        
+        n = len(sequence)
+        
+        # Counting sort into the bucket table; a degree outside [0, n - 1]
+        # can never be laid down
+        counts = [0] * n
+        for d in sequence:
+            if d < 0 or d >= n:
+                return certify and self._degree_verdict(d, n)
+            counts[d] += 1
+            
+        seq = []
+        for degree in range(n - 1, -1, -1):
+            seq.extend([degree] * counts[degree])
+            
+        for start in range(n):
+            d1 = seq[start]
+            
+            # The largest residual degree is 0, so all of them are
+            if d1 == 0:
+                return GRAPHIC
+            counts[d1] -= 1
+            
+            # d1 must not exceed the number of vertices left, and none of the
+            # d1 vertices it connects to may already be saturated
+            last = start + d1
+            if last >= n or seq[last] == 0:
+                if not certify:
+                    return False
+                # Count the remaining vertices that could still take an edge
+                j = min(last, n - 1)
+                while j > start and seq[j] == 0:
+                    j -= 1
+                return GraphicVerdict(False, 'havel-hakimi', left=d1, right=j - start,
+                                      step=start + 1)
+            
+            # Find where the run of the smallest affected degree v begins
+            v = seq[last]
+            lo = last
+            while lo > start + 1 and seq[lo - 1] == v:
+                lo -= 1
+            hi = lo + counts[v] - 1
+            
+            # Everything before the run is > v and keeps its order
+            for i in range(start + 1, lo):
+                counts[seq[i]] -= 1
+                seq[i] -= 1
+                counts[seq[i]] += 1
+                
+            # Lower the tail of the run rather than its head
+            lowered = last - lo + 1
+            for i in range(hi - lowered + 1, hi + 1):
+                seq[i] = v - 1
+            counts[v] -= lowered
+            counts[v - 1] += lowered
+            
+            # Residual degrees only change in place, so positions keep
+            # referring to the same vertices
+            if steps is not None:
+                steps.extend((start, lo, hi - lowered + 1, hi + 1))
+        
+        return GRAPHIC
+        
+    def havel_hakimi_reference_check(self, sequence: List[int]) -> bool:
+        """
+        Direct transcription of the Havel-Hakimi theorem, re-sorting on every step.
+
+        Kept as the reference implementation that the test suite checks
+        havel_hakimi_check against.
+        
         Args:
             sequence (List[int]): A sequence of non-negative integers
             
@@ -85,83 +622,1253 @@ class GraphSequenceAnalyzer:
         
         return True  # Added return True for case when sequence becomes empty
         
-    def is_graphic(self, sequence: List[int], method: str = 'both') -> bool:
+    def gale_ryser_check(self, left: List[int], right: List[int]) -> bool:
+        """
+        Implements the Gale-Ryser theorem to check if a pair of sequences is bigraphic.
+        
+        The pair holds the degrees of the two sides of a bipartite graph, e.g.
+        users and items. With a1 ≥ a2 ≥ ... ≥ ap on the left, it is realized
+        by a simple bipartite graph if and only if sum(a) = sum(b) and
+        
+        sum(ai) <= sum(min(bj, k)) for all k in [1, p]
+        i<=k        j
+        
+        The left side is counting-sorted, and from one k to the next the
+        right-hand side grows by the number of bj >= k, read off a suffix
+        count of the right histogram, so the check is O(p + q).
+        
+        Args:
+            left (List[int]): Degrees of the left side
+            right (List[int]): Degrees of the right side
+            
+        Returns:
+            bool: True if the pair is bigraphic, False otherwise
+        """
+        p, q = len(left), len(right)
+        
+        # A degree above the size of the other side can never be realized
+        left_counts = [0] * (q + 1)
+        for d in left:
+            if d < 0 or d > q:
+                return False
+            left_counts[d] += 1
+        right_counts = [0] * (p + 1)
+        for d in right:
+            if d < 0 or d > p:
+                return False
+            right_counts[d] += 1
+        if sum(left) != sum(right):
+            return False
+            
+        # count_ge[t]: how many right degrees are >= t
+        count_ge = [0] * (p + 2)
+        for t in range(p, -1, -1):
+            count_ge[t] = count_ge[t + 1] + right_counts[t]
+            
+        # Left degrees of 0 add nothing to the left-hand side, so the
+        # walk can stop before them
+        k = left_sum = right_sum = 0
+        for degree in range(q, 0, -1):
+            for _ in range(left_counts[degree]):
+                k += 1
+                left_sum += degree
+                right_sum += count_ge[k]
+                if left_sum > right_sum:
+                    return False
+                    
+        return True
+        
+    def fulkerson_chen_anstee_check(self, out_degrees: List[int], in_degrees: List[int]) -> bool:
+        """
+        Implements the Fulkerson-Chen-Anstee theorem to check if degree pairs are digraphic.
+        
+        Vertex i has out-degree ai and in-degree bi. With the pairs sorted
+        lexicographically, a1 ≥ a2 ≥ ... ≥ an and ties by descending bi, they
+        are realized by a simple digraph (no loops, no parallel arcs) if and
+        only if sum(a) = sum(b) and for all k in [1, n]
+        
+        sum(ai) <= sum(min(bi, k - 1)) + sum(min(bi, k))
+        i<=k       i<=k                  i>k
+        
+        The right-hand side equals sum(min(bi, k)) over all i minus the number
+        of i <= k with bi >= k. The first term grows by the number of bi >= k
+        as in gale_ryser_check; vertex i is counted by the second one for
+        exactly the k in [i, bi], so it is a running sum over a difference
+        array. After sorting the check is O(n).
+        
+        Args:
+            out_degrees (List[int]): Out-degree of every vertex
+            in_degrees (List[int]): In-degree of every vertex
+            
+        Returns:
+            bool: True if the pairs are digraphic, False otherwise
+            
+        Raises:
+            ValueError: If the two lists differ in length
+        """
+        n = len(out_degrees)
+        if len(in_degrees) != n:
+            raise ValueError("out_degrees and in_degrees must have the same length")
+        if not n:
+            return True
+            
+        in_counts = [0] * n
+        for a, b in zip(out_degrees, in_degrees):
+            if a < 0 or b < 0 or a >= n or b >= n:
+                return False
+            in_counts[b] += 1
+        if sum(out_degrees) != sum(in_degrees):
+            return False
+            
+        # Lexicographic order, descending
+        pairs = sorted(zip(out_degrees, in_degrees), reverse=True)
+        outs = [a for a, _ in pairs]
+        ins = [b for _, b in pairs]
+            
+        count_ge = [0] * (n + 1)
+        for t in range(n - 1, -1, -1):
+            count_ge[t] = count_ge[t + 1] + in_counts[t]
+            
+        # covered[k] - covered[k - 1]: change in how many of the first k
+        # vertices have bi >= k
+        covered = [0] * (n + 2)
+        for i, b in enumerate(ins, start=1):
+            if b >= i:
+                covered[i] += 1
+                covered[b + 1] -= 1
+                
+        running = left_sum = min_sum = 0
+        for k in range(1, n + 1):
+            running += covered[k]
+            left_sum += outs[k - 1]
+            min_sum += count_ge[k]
+            if left_sum > min_sum - running:
+                return False
+                
+        return True
+        
+    def gale_ryser_edges(self, left: List[int], right: List[int]):
+        """
+        Builds one bipartite realization of a pair of sequences.
+        
+        Left vertices are taken in descending order of degree, and each one is
+        joined to the right vertices of largest residual degree (Ryser's
+        greedy construction). The residual right degrees are kept in one
+        descending array with a count table, exactly like the Havel-Hakimi
+        bucket queue, so no step re-sorts and the build is O(p + q + m).
+        
+        Args:
+            left (List[int]): Degrees of the left side
+            right (List[int]): Degrees of the right side
+            
+        Returns:
+            Optional[np.ndarray]: An (m, 2) int64 array of edges (i, j) between
+                left vertex i and right vertex j, or None if the pair is not
+                bigraphic
+        """
+        import numpy as np
+        
+        p, q = len(left), len(right)
+        if (any(d < 0 or d > q for d in left) or any(d < 0 or d > p for d in right) or
+                sum(left) != sum(right)):
+            return None
+            
+        counts = [0] * (p + 1)
+        for d in right:
+            counts[d] += 1
+        ids = sorted(range(q), key=lambda j: -right[j])
+        seq = [right[j] for j in ids]
+        
+        sources, targets = array('q'), array('q')
+        for i in sorted(range(p), key=lambda i: -left[i]):
+            d = left[i]
+            if d == 0:
+                break
+            last = d - 1
+            if seq[last] == 0:
+                return None
+                
+            # Entries before the run of the smallest chosen degree v are
+            # lowered in place; within the run, the last ones are lowered
+            v = seq[last]
+            lo = last
+            while lo > 0 and seq[lo - 1] == v:
+                lo -= 1
+            hi = lo + counts[v] - 1
+            for j in range(lo):
+                counts[seq[j]] -= 1
+                seq[j] -= 1
+                counts[seq[j]] += 1
+                targets.append(ids[j])
+            lowered = last - lo + 1
+            for j in range(hi - lowered + 1, hi + 1):
+                seq[j] = v - 1
+                targets.append(ids[j])
+            counts[v] -= lowered
+            counts[v - 1] += lowered
+            sources.extend([i] * d)
+            
+        return np.column_stack([np.frombuffer(sources, dtype=np.int64),
+                                np.frombuffer(targets, dtype=np.int64)]).reshape(-1, 2)
+        
+    def kleitman_wang_edges(self, out_degrees: List[int], in_degrees: List[int]):
+        """
+        Builds one digraph realizing the given out- and in-degrees.
+        
+        Kleitman-Wang construction: any vertex with residual out-degree d is
+        given arcs to the d other vertices of largest residual in-degree, ties
+        broken by largest residual out-degree, and the pairs stay digraphic if
+        they were. Vertices are laid down in descending order of out-degree;
+        each step selects its targets with one O(n) partition, so the build is
+        O(n²) in the worst case. Pairs are first screened with
+        fulkerson_chen_anstee_check.
+        
+        Args:
+            out_degrees (List[int]): Out-degree of every vertex
+            in_degrees (List[int]): In-degree of every vertex
+            
+        Returns:
+            Optional[np.ndarray]: An (m, 2) int64 array of arcs (u, v), or None
+                if the pairs are not digraphic
+        """
+        import numpy as np
+        
+        if not self.fulkerson_chen_anstee_check(out_degrees, in_degrees):
+            return None
+        n = len(out_degrees)
+        out_left = np.array(out_degrees, dtype=np.int64).reshape(-1)
+        in_left = np.array(in_degrees, dtype=np.int64).reshape(-1)
+        
+        arcs = [np.zeros((0, 2), dtype=np.int64)]
+        for u in np.argsort(-out_left, kind='stable'):
+            d = int(out_left[u])
+            if d == 0:
+                break
+            # Both residuals are below n, so one key orders by in-degree and
+            # then out-degree; u itself can never be chosen
+            key = in_left * n + out_left
+            key[u] = -1
+            chosen = np.argpartition(-key, d - 1)[:d]
+            if (in_left[chosen] == 0).any():
+                return None
+            in_left[chosen] -= 1
+            out_left[u] = 0
+            arcs.append(np.column_stack([np.full(d, u, dtype=np.int64), chosen]))
+            
+        return np.concatenate(arcs)
+        
+    def is_graphic(self, sequence, method: str = 'both') -> bool:
         """
         Determines if a sequence is graphic using specified method(s).
         
+        The bipartite and directed methods take a pair of lists instead of a
+        single sequence: (left, right) degrees for 'gale-ryser' and (out, in)
+        degrees for 'fulkerson-chen-anstee'.
+        
+        Args:
+            sequence: A sequence of non-negative integers, or a pair of them
+            method (str): Which method to use - 'havel-hakimi', 'erdos-gallai',
+                'both', 'gale-ryser' or 'fulkerson-chen-anstee'
+            
+        Returns:
+            bool: True if the sequence is graphic, False otherwise
+        """
+        # The cache is keyed by sorted simple sequences, so pairs bypass it
+        if method.lower() == 'gale-ryser':
+            left, right = sequence
+            return self.gale_ryser_check(left, right)
+        elif method.lower() == 'fulkerson-chen-anstee':
+            out_degrees, in_degrees = sequence
+            return self.fulkerson_chen_anstee_check(out_degrees, in_degrees)
+            
+        if self.cache is not None:
+            cached = self.cache.get('graphic', sequence)
+            if cached is not None:
+                return cached
+                
+        if method.lower() == 'havel-hakimi':
+            result = self.havel_hakimi_check(sequence)
+        elif method.lower() == 'erdos-gallai':
+            result = self.erdos_gallai_check(sequence)
+        else:  # Use both methods as a double-check
+            result = (self.havel_hakimi_check(sequence) and 
+                      self.erdos_gallai_check(sequence))
+            
+        if self.cache is not None:
+            self.cache.put('graphic', sequence, result)
+        return result
+
+    def graphic_verdict(self, sequence: List[int], method: str = 'both') -> GraphicVerdict:
+        """
+        Determines if a sequence is graphic, and why not if it is not.
+        
+        'both' reports the Erdős-Gallai certificate, which names the first
+        failing k, and runs Havel-Hakimi as the double-check. The cache only
+        keeps the bool, so a cached graphic sequence answers straight away
+        while a rejected one is re-checked for its certificate.
+        
         Args:
             sequence (List[int]): A sequence of non-negative integers
             method (str): Which method to use - 'havel-hakimi', 'erdos-gallai', or 'both'
             
         Returns:
-            bool: True if the sequence is graphic, False otherwise
+            GraphicVerdict: GRAPHIC, or why the sequence is not graphic
+        """
+        if self.cache is not None and self.cache.get('graphic', sequence):
+            return GRAPHIC
+            
+        if method.lower() == 'havel-hakimi':
+            verdict = self.havel_hakimi_verdict(sequence)
+        else:
+            verdict = self.erdos_gallai_verdict(sequence)
+            if verdict and method.lower() != 'erdos-gallai':
+                verdict = self.havel_hakimi_verdict(sequence)
+                
+        if self.cache is not None:
+            self.cache.put('graphic', sequence, verdict.graphic)
+        return verdict
+
+    def is_graphic_many(self, sequences, method: str = 'both', offsets=None,
+                        return_k: bool = False):
+        """
+        Determines which of many sequences are graphic in one vectorized pass.
+
+        Sequences are given either as a 2-D array with one zero-padded sequence
+        per row, or as a flat array of values plus CSR-style offsets (row i is
+        values[offsets[i]:offsets[i + 1]]) for ragged input. Padding with zeros
+        is harmless: adding isolated vertices never changes whether a sequence
+        is graphic.
+
+        For 'gale-ryser' and 'fulkerson-chen-anstee', sequences is a 3-D
+        array of shape (B, 2, W) holding the zero-padded pair of every row.
+
+        With return_k, the Erdős-Gallai pass also reports the first failing k
+        of every row, read off the comparison it already makes, so rejected
+        rows need no separate diagnosis.
+
+        Args:
+            sequences: 2-D array of degree sequences, or a flat array of
+                values when offsets is given
+            method (str): Which method to use - 'havel-hakimi', 'erdos-gallai',
+                'both', 'gale-ryser' or 'fulkerson-chen-anstee'
+            offsets: Optional row boundaries into a flat array of values
+            return_k (bool): Also return the first failing k of every row;
+                only for the simple-graph methods
+
+        Returns:
+            np.ndarray: Boolean mask, True for every graphic row; with
+                return_k, a pair of the mask and an int64 array holding the
+                first k that violates the Erdős-Gallai inequality, or 0 where
+                none does (graphic rows, and rows rejected for their parity or
+                for a degree outside [0, W - 1] with W the padded width)
         """
+        import numpy as np
+
+        if method.lower() in ('gale-ryser', 'fulkerson-chen-anstee'):
+            if offsets is not None or return_k:
+                raise ValueError("offsets and return_k are only supported for simple sequences")
+            pairs = np.asarray(sequences, dtype=np.int64)
+            if pairs.ndim != 3 or pairs.shape[1] != 2:
+                raise ValueError("pairs must be a 3-D array of shape (B, 2, W)")
+            if method.lower() == 'gale-ryser':
+                return self._gale_ryser_many(pairs)
+            return self._fulkerson_chen_anstee_many(pairs)
+
+        if offsets is not None:
+            degrees = self._pad_ragged(sequences, offsets)
+        else:
+            degrees = np.asarray(sequences, dtype=np.int64)
+            if degrees.ndim != 2:
+                raise ValueError("sequences must be a 2-D array unless offsets are given")
+
+        if return_k:
+            mask, failing_k = self._erdos_gallai_many(degrees, return_k=True)
+            if method.lower() == 'havel-hakimi':
+                mask = self._havel_hakimi_many(degrees)
+            elif method.lower() != 'erdos-gallai' and mask.any():
+                mask[mask] = self._havel_hakimi_many(degrees[mask])
+            return mask, failing_k
+
         if method.lower() == 'havel-hakimi':
-            return self.havel_hakimi_check(sequence)
+            return self._havel_hakimi_many(degrees)
         elif method.lower() == 'erdos-gallai':
-            return self.erdos_gallai_check(sequence)
+            return self._erdos_gallai_many(degrees)
         else:  # Use both methods as a double-check
-            return (self.havel_hakimi_check(sequence) and 
-                   self.erdos_gallai_check(sequence))
+            mask = self._erdos_gallai_many(degrees)
+            if mask.any():
+                mask[mask] = self._havel_hakimi_many(degrees[mask])
+            return mask
+
+    @staticmethod
+    def _pad_ragged(values, offsets):
+        """Scatter a flat values array with CSR offsets into a zero-padded 2-D array"""
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        lengths = np.diff(offsets)
+        rows = len(lengths)
+        width = int(lengths.max()) if rows else 0
+
+        padded = np.zeros((rows, width), dtype=np.int64)
+        row_index = np.repeat(np.arange(rows), lengths)
+        col_index = (np.arange(int(lengths.sum())) -
+                     np.repeat(offsets[:-1] - offsets[0], lengths))
+        padded[row_index, col_index] = values[offsets[0]:offsets[-1]]
+        return padded
+
+    @staticmethod
+    def _erdos_gallai_many(degrees, return_k: bool = False):
+        """Erdős-Gallai check over every row of a 2-D degree array at once"""
+        import numpy as np
+
+        rows, n = degrees.shape
+        valid = ((degrees >= 0).all(axis=1) & (degrees < max(n, 1)).all(axis=1) &
+                 (degrees.sum(axis=1) % 2 == 0))
+        if n == 0:
+            return (valid, np.zeros(rows, dtype=np.int64)) if return_k else valid
+
+        # Sort each row in descending order; rejected rows are zeroed so that
+        # they stay inside the histogram below
+        seq = -np.sort(-np.where(valid[:, None], degrees, 0), axis=1)
+        prefix = np.cumsum(seq, axis=1)
+
+        # count_ge[:, t]: how many degrees in the row are >= t
+        flat = seq + (n + 1) * np.arange(rows)[:, None]
+        hist = np.bincount(flat.ravel(), minlength=rows * (n + 1)).reshape(rows, n + 1)
+        count_ge = np.cumsum(hist[:, ::-1], axis=1)[:, ::-1]
+
+        # Same pointer formula as erdos_gallai_check, broadcast over every k
+        k = np.arange(1, n + 1)
+        p = count_ge[:, 1:]
+        tail = prefix[:, -1:] - np.take_along_axis(prefix, np.maximum(k, p) - 1, axis=1)
+        right_sum = k * (k - 1) + k * np.maximum(0, p - k) + tail
+
+        holds = prefix <= right_sum
+        mask = valid & holds.all(axis=1)
+        if not return_k:
+            return mask
+        # Zero-padding sits past every real index, so it moves no k
+        failing = ~holds
+        return mask, np.where(failing.any(axis=1), failing.argmax(axis=1) + 1, 0)
+
+    @staticmethod
+    def _count_ge_many(values, top: int):
+        """count_ge[:, t]: how many entries of each row are >= t, for t in 0..top"""
+        import numpy as np
+
+        rows = len(values)
+        flat = values + (top + 1) * np.arange(rows)[:, None]
+        hist = np.bincount(flat.ravel(), minlength=rows * (top + 1)).reshape(rows, top + 1)
+        return np.cumsum(hist[:, ::-1], axis=1)[:, ::-1]
+
+    @classmethod
+    def _gale_ryser_many(cls, pairs):
+        """Gale-Ryser check over every (left, right) row of a (B, 2, W) array at once"""
+        import numpy as np
+
+        rows, _, width = pairs.shape
+        valid = ((pairs >= 0).all(axis=(1, 2)) & (pairs <= width).all(axis=(1, 2)) &
+                 (pairs[:, 0].sum(axis=1) == pairs[:, 1].sum(axis=1)))
+        if width == 0:
+            return valid
+
+        pairs = np.where(valid[:, None, None], pairs, 0)
+        prefix = np.cumsum(-np.sort(-pairs[:, 0], axis=1), axis=1)
+        # sum(min(bj, k)) for k = 1..W is a running sum of count_ge
+        min_sum = np.cumsum(cls._count_ge_many(pairs[:, 1], width)[:, 1:], axis=1)
+
+        return valid & (prefix <= min_sum).all(axis=1)
+
+    @classmethod
+    def _fulkerson_chen_anstee_many(cls, pairs):
+        """Fulkerson-Chen-Anstee check over every (out, in) row of a (B, 2, W) array at once"""
+        import numpy as np
+
+        rows, _, n = pairs.shape
+        valid = ((pairs >= 0).all(axis=(1, 2)) & (pairs < max(n, 1)).all(axis=(1, 2)) &
+                 (pairs[:, 0].sum(axis=1) == pairs[:, 1].sum(axis=1)))
+        if n == 0:
+            return valid
+
+        pairs = np.where(valid[:, None, None], pairs, 0)
+        order = np.argsort(-(pairs[:, 0] * n + pairs[:, 1]), axis=1, kind='stable')
+        outs = np.take_along_axis(pairs[:, 0], order, axis=1)
+        ins = np.take_along_axis(pairs[:, 1], order, axis=1)
+        prefix = np.cumsum(outs, axis=1)
+        min_sum = np.cumsum(cls._count_ge_many(ins, n)[:, 1:], axis=1)
 
-    def generate_all_graphs(self, sequence: List[int]) -> List[nx.Graph]:
+        # Same difference array as fulkerson_chen_anstee_check: vertex i
+        # counts for every k in [i, bi]
+        i = np.arange(1, n + 1)
+        row, column = np.nonzero(ins >= i)
+        diff = np.zeros((rows, n + 2), dtype=np.int64)
+        np.add.at(diff, (row, column + 1), 1)
+        np.add.at(diff, (row, ins[row, column] + 1), -1)
+        covered = np.cumsum(diff, axis=1)[:, 1:n + 1]
+
+        return valid & (prefix <= min_sum - covered).all(axis=1)
+
+    @staticmethod
+    def _havel_hakimi_many(degrees):
+        """Havel-Hakimi check over every row of a 2-D degree array at once"""
+        import numpy as np
+
+        rows, n = degrees.shape
+        valid = (degrees >= 0).all(axis=1) & (degrees < max(n, 1)).all(axis=1)
+        residual = np.where(valid[:, None], degrees, 0)
+        columns = np.arange(1, n)
+
+        # Retired vertices are left in place as zeros: lowering one of them
+        # means d1 exceeded the positive degrees left, which fails the row
+        for _ in range(n):
+            residual = -np.sort(-residual, axis=1)
+            d1 = residual[:, 0].copy()
+            if not d1.any():
+                break
+            residual[:, 0] = 0
+            residual[:, 1:] -= columns <= d1[:, None]
+
+            failed = (residual < 0).any(axis=1)
+            valid &= ~failed
+            residual[failed] = 0
+
+        return valid
+
+    def is_realizable(self, sequence: List[int], constraint: str = 'simple', k: int = 1) -> bool:
+        """
+        Determines if a sequence has a realization of a given kind.
+        
+        Every constraint has a closed-form criterion, so no realization is
+        enumerated and each check is O(n) on top of a graphicality check:
+        
+        - 'simple': the sequence is graphic
+        - 'connected': graphic, and either a single vertex or every degree
+          >= 1 with sum >= 2(n - 1); components can then be merged by edge
+          swaps (see sampling.connect_components)
+        - 'forest': even sum, and at most n' - 1 edges for the n' positive degrees
+        - 'tree': a single vertex of degree 0, or every degree >= 1 and
+          sum = 2(n - 1)
+        - 'multigraph': loopless multigraph, even sum and max <= sum - max
+          (Hakimi, 1962)
+        - 'multigraph-loops': multigraph with loops, even sum
+        - 'k-edge-connected': graphic, every degree >= k, and connected for
+          k = 1 (Edmonds, 1964)
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            constraint (str): The kind of realization, one of the above
+            k (int): Edge connectivity for 'k-edge-connected'
+            
+        Returns:
+            bool: True if a realization of that kind exists, False otherwise
+            
+        Raises:
+            ValueError: If the constraint is unknown or k is negative
+        """
+        constraint = constraint.lower()
+        if constraint not in REALIZATION_CONSTRAINTS:
+            raise ValueError(f"unknown constraint {constraint!r}")
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if any(d < 0 for d in sequence):
+            return False
+            
+        n = len(sequence)
+        total = sum(sequence)
+        if total % 2 != 0:
+            return False
+            
+        if constraint == 'multigraph-loops':
+            return True
+        elif constraint == 'multigraph':
+            return max(sequence, default=0) <= total - max(sequence, default=0)
+        elif constraint == 'forest':
+            positive = n - sequence.count(0)
+            return total == 0 or total // 2 <= positive - 1
+        elif constraint == 'tree':
+            return n <= 1 and total == 0 or min(sequence) >= 1 and total == 2 * (n - 1)
+        elif constraint == 'connected' or (constraint == 'k-edge-connected' and k == 1):
+            if n > 1 and (min(sequence) < 1 or total < 2 * (n - 1)):
+                return False
+        elif constraint == 'k-edge-connected' and n > 1 and min(sequence) < k:
+            return False
+        return self.erdos_gallai_check(sequence)
+        
+    def realize(self, sequence: List[int], constraint: str = 'simple', k: int = 1,
+                seed: Optional[int] = None):
+        """
+        Builds one realization of a given kind, as a witness for is_realizable.
+        
+        - 'simple': the Havel-Hakimi realization
+        - 'connected': the Havel-Hakimi realization with its components
+          merged by edge swaps, O(n + m)
+        - 'tree' and 'forest': a caterpillar holding every degree >= 2 with
+          leaves hanging off it, plus the remaining 1's paired up, O(n)
+        - 'multigraph': the stubs, laid out vertex by vertex, paired i with
+          i + m; no vertex has more than m stubs, so no pair is a loop
+        - 'multigraph-loops': the loopless pairing when it exists, otherwise
+          every other stub on the largest vertex plus loops there
+        - 'k-edge-connected': the connected realization, improved by edge
+          swaps across a minimum cut until no cut is smaller than k. This
+          local search uses networkx and max-flow cuts, so it is meant for
+          small and medium graphs
+          
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            constraint (str): The kind of realization, see is_realizable
+            k (int): Edge connectivity for 'k-edge-connected'
+            seed (Optional[int]): Seed of the swaps for 'k-edge-connected'
+            
+        Returns:
+            Optional[np.ndarray]: An (m, 2) int64 array of edges where vertex v
+                has degree sequence[v] (a loop (v, v) counts twice), or None if
+                no realization of that kind exists
+                
+        Raises:
+            ValueError: If the constraint is unknown or k is negative
+            RuntimeError: If the k-edge-connected search gives up
+        """
+        import numpy as np
+        
+        if not self.is_realizable(sequence, constraint, k):
+            return None
+        constraint = constraint.lower()
+        degrees = np.asarray(sequence, dtype=np.int64).reshape(-1)
+        total = int(degrees.sum())
+        
+        if constraint in ('multigraph', 'multigraph-loops'):
+            top = int(degrees.argmax()) if len(degrees) else 0
+            if 2 * int(degrees[top] if len(degrees) else 0) > total:
+                # Every other stub goes to the largest vertex, which closes
+                # its remaining stubs with loops
+                others = np.repeat(np.arange(len(degrees)), np.where(
+                    np.arange(len(degrees)) == top, 0, degrees))
+                loops = (int(degrees[top]) - len(others)) // 2
+                return np.column_stack([np.full(len(others) + loops, top, dtype=np.int64),
+                                        np.concatenate([others, np.full(loops, top)])])
+            stubs = np.repeat(np.arange(len(degrees)), degrees)
+            return np.column_stack([stubs[:total // 2], stubs[total // 2:]])
+            
+        if constraint in ('tree', 'forest'):
+            return self._caterpillar_edges(sequence)
+            
+        edges = self.havel_hakimi_edges(sequence)
+        if constraint == 'simple' or (constraint == 'k-edge-connected' and k == 0):
+            return edges
+            
+        from sampling import connect_components
+        
+        sources, targets = edges[:, 0].tolist(), edges[:, 1].tolist()
+        connect_components(len(sequence), sources, targets)
+        edges = np.column_stack([np.array(sources, dtype=np.int64),
+                                 np.array(targets, dtype=np.int64)]).reshape(-1, 2)
+        if constraint == 'connected' or k <= 1 or len(sequence) <= 1:
+            return edges
+        return self._raise_edge_connectivity(len(sequence), edges, k, seed)
+        
+    @staticmethod
+    def _caterpillar_edges(sequence: List[int]):
+        """Forest realization: one caterpillar tree plus single edges"""
+        import numpy as np
+        
+        spine = [v for v, d in enumerate(sequence) if d >= 2]
+        leaves = [v for v, d in enumerate(sequence) if d == 1]
+        edges = list(zip(spine, spine[1:]))
+        used = 0
+        for i, v in enumerate(spine):
+            spare = sequence[v] - (i > 0) - (i < len(spine) - 1)
+            edges.extend((v, leaf) for leaf in leaves[used:used + spare])
+            used += spare
+        edges.extend(zip(leaves[used::2], leaves[used + 1::2]))
+        return np.array(edges, dtype=np.int64).reshape(-1, 2)
+        
+    @staticmethod
+    def _raise_edge_connectivity(n: int, edges, k: int, seed: Optional[int]):
+        """
+        Swaps edges until the graph is k-edge-connected.
+        
+        With a minimum cut (S, T) smaller than k <= the minimum degree, both
+        sides hold an inner edge, (a, b) in S and (c, d) in T. Replacing them
+        by (a, c) and (b, d) adds two edges to that cut; swaps that would
+        lower the edge connectivity elsewhere are rolled back.
+        """
+        import random
+        import networkx as nx
+        import numpy as np
+        
+        rng = random.Random(seed)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        G.add_edges_from(edges.tolist())
+        connectivity = nx.edge_connectivity(G)
+        
+        for _ in range(10 * n + len(edges)):
+            if connectivity >= k:
+                return np.array(list(G.edges()), dtype=np.int64).reshape(-1, 2)
+            cut = nx.minimum_edge_cut(G)
+            H = G.copy()
+            H.remove_edges_from(cut)
+            side = nx.node_connected_component(H, next(iter(cut))[0])
+            inner_s = [(a, b) for a, b in H.edges() if a in side and b in side]
+            inner_t = [(c, d) for c, d in H.edges() if c not in side and d not in side]
+            rng.shuffle(inner_s)
+            rng.shuffle(inner_t)
+            
+            swapped = False
+            for (a, b) in inner_s[:8]:
+                for (c, d) in inner_t[:8]:
+                    if rng.random() < 0.5:
+                        c, d = d, c
+                    if G.has_edge(a, c) or G.has_edge(b, d):
+                        continue
+                    G.remove_edges_from([(a, b), (c, d)])
+                    G.add_edges_from([(a, c), (b, d)])
+                    new_connectivity = nx.edge_connectivity(G)
+                    if new_connectivity >= connectivity:
+                        connectivity = new_connectivity
+                        swapped = True
+                        break
+                    G.remove_edges_from([(a, c), (b, d)])
+                    G.add_edges_from([(a, b), (c, d)])
+                if swapped:
+                    break
+                    
+        if connectivity >= k:
+            return np.array(list(G.edges()), dtype=np.int64).reshape(-1, 2)
+        raise RuntimeError(f"no {k}-edge-connected realization found")
+        
+    def generate_all_graphs(self, sequence: List[int], orderly: bool = True,
+                            workers: Optional[int] = None,
+                            stats: Optional[SearchStats] = None) -> List['nx.Graph']:
         """
         Generates all possible non-isomorphic simple graphs with the given degree sequence.
         
+        Collects everything iter_graphs yields; see iter_realizations for how
+        the search works and how results are cached.
+        
         Args:
             sequence (List[int]): A graphic sequence
+            orderly (bool): Break symmetry between interchangeable vertices.
+                With False every labeled realization is visited.
+            workers (Optional[int]): Number of worker processes; None or 1
+                searches in this process
+            stats (Optional[SearchStats]): Filled in with counters and timings
             
         Returns:
             List[nx.Graph]: List of all non-isomorphic graphs with the given degree sequence
         """
-        if not self.is_graphic(sequence):
-            return []
+        return list(self.iter_graphs(sequence, orderly=orderly, workers=workers, stats=stats))
+
+    def iter_graphs(self, sequence: List[int], limit: Optional[int] = None,
+                    timeout: Optional[float] = None, orderly: bool = True,
+                    workers: Optional[int] = None,
+                    stop: Optional[Callable[[], bool]] = None,
+                    stats: Optional[SearchStats] = None) -> Iterator['nx.Graph']:
+        """
+        Yields the non-isomorphic simple graphs with the given degree sequence as they are found.
+        
+        Same search as iter_realizations, converting each realization to a
+        networkx graph only when it is handed out.
+        
+        Args:
+            sequence (List[int]): A graphic sequence
+            limit (Optional[int]): Stop after this many graphs
+            timeout (Optional[float]): Stop once the search has run this many seconds
+            orderly (bool): Break symmetry between interchangeable vertices.
+                With False every labeled realization is visited.
+            workers (Optional[int]): Number of worker processes; None or 1
+                searches in this process
+            stop (Optional[Callable[[], bool]]): Polled at every search node;
+                the search ends as soon as it returns True
+            stats (Optional[SearchStats]): Filled in with counters and timings
+            
+        Yields:
+            nx.Graph: Each new non-isomorphic graph with the given degree sequence
+        """
+        realizations = self.iter_realizations(sequence, limit=limit, timeout=timeout,
+                                              orderly=orderly, workers=workers, stop=stop,
+                                              stats=stats)
+        if stats is None:
+            for rows in realizations:
+                yield rows_to_graph(rows)
+            return
+        
+        for rows in realizations:
+            start = time.perf_counter()
+            G = rows_to_graph(rows)
+            stats.add_time('graphs', time.perf_counter() - start)
+            yield G
+
+    def iter_realizations(self, sequence: List[int], limit: Optional[int] = None,
+                          timeout: Optional[float] = None, orderly: bool = True,
+                          workers: Optional[int] = None,
+                          stop: Optional[Callable[[], bool]] = None,
+                          stats: Optional[SearchStats] = None,
+                          store: bool = True) -> Iterator[Tuple[int, ...]]:
+        """
+        Yields the non-isomorphic realizations of a sequence as adjacency bitsets.
+        
+        Each realization is a tuple of n ints where bit u of entry v is set when
+        u and v are adjacent, i.e. a handful of machine words per graph.
+        
+        The search completes one vertex at a time, choosing all of its remaining
+        neighbors at once, and drops a branch as soon as a vertex can no longer
+        reach its degree or the residual degrees of the untouched vertices stop
+        being graphic. The number of search nodes visited is counted in
+        stats.nodes.
+        
+        In orderly mode, open vertices with the same target degree and the same
+        neighbors so far are interchangeable, so for each such class only the
+        choice of *how many* of them to connect to is explored, always using
+        the first ones. This follows a single canonical construction path per
+        isomorphism class instead of generating every labeled realization;
+        the canonical-form check at the leaves then guarantees that each class
+        is reported exactly once.
+        
+        With more than one worker, the top of the search tree is expanded
+        until there are a few subtrees per worker, the subtrees are searched
+        in a process pool, and their results are merged in search order. The
+        output is exactly the same as that of the serial search. A subtree's
+        realizations only come back once it has been searched completely, so
+        a search with a limit runs serially, where the first realizations
+        arrive at once. Stopping the parallel search, whether by timeout,
+        stop or closing the generator, cancels the subtree searches still
+        running in the workers as well.
+        
+        With a cache, the realizations of a search that ran to completion are
+        stored labeled by position in the sorted sequence, so they are shared
+        between orderings of the same degrees; later calls replay them. Sets
+        of more than MAX_CACHED_REALIZATIONS realizations are not stored, and
+        are not kept in memory while the search runs either.
+        
+        Args:
+            sequence (List[int]): A graphic sequence
+            limit (Optional[int]): Stop after this many realizations
+            timeout (Optional[float]): Stop once the search has run this many seconds
+            orderly (bool): Break symmetry between interchangeable vertices.
+                With False every labeled realization is visited.
+            workers (Optional[int]): Number of worker processes; None or 1
+                searches in this process
+            stop (Optional[Callable[[], bool]]): Polled at every search node;
+                the search ends as soon as it returns True, which lets another
+                thread cancel it
+            stats (Optional[SearchStats]): Filled in with counters and timings
+            store (bool): Store the realizations in the cache; callers that
+                only count them pass False
+            
+        Yields:
+            Tuple[int, ...]: Adjacency bitsets of each new non-isomorphic realization
+        """
+        if limit is not None and limit <= 0:
+            return
+        if stats is None:
+            if not self.is_graphic(sequence):
+                return
+        else:
+            start = time.perf_counter()
+            graphic = self.is_graphic(sequence)
+            stats.add_time('check', time.perf_counter() - start)
+            if not graphic:
+                return
 
         n = len(sequence)
-        vertices = list(range(n))
-        result_graphs = []
+        deadline = None if timeout is None else time.monotonic() + timeout
         
-        # Create a graph with the correct number of vertices
-        G = nx.Graph()
-        G.add_nodes_from(vertices)
+        # Vertices are completed one at a time, highest target degree first
+        order = sorted(range(n), key=lambda v: -sequence[v])
+        cached = None if self.cache is None else self.cache.get('realizations', sequence)
+        if cached is not None:
+            position = [0] * n
+            for i, v in enumerate(order):
+                position[v] = i
+            realizations = (relabel(rows, position) for rows in cached)
+        elif workers is not None and workers > 1 and limit is None:
+            realizations = self._parallel_search(sequence, order, orderly, deadline,
+                                                 workers, stop, stats)
+            if stats is not None:
+                realizations = self._timed(realizations, None, stats)
+        else:
+            # Realizations are deduplicated by canonical form instead of being
+            # compared pairwise with nx.is_isomorphic
+            seen = CanonicalDeduplicator()
+            search = self._search(sequence, order, [0] * n, list(sequence), 0,
+                                  orderly, deadline, stop, stats)
+            if stats is None:
+                realizations = (realization for realization in search if seen.add(realization))
+            else:
+                realizations = self._timed(search, seen, stats)
         
-        def is_valid_degree_sequence(G):
-            """Check if the current graph has the desired degree sequence"""
-            current_degrees = sorted([G.degree(v) for v in G.nodes()], reverse=True)
-            target_degrees = sorted(sequence, reverse=True)
-            return current_degrees == target_degrees
+        tracing = False
+        if stats is not None and stats.track_memory:
+            import tracemalloc
+            tracing = not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        
+        # Only a search that was neither cut short nor already cached is stored
+        store = store and self.cache is not None and cached is None
+        found, stored = 0, []
+        try:
+            for realization in realizations:
+                yield realization
+                found += 1
+                if store:
+                    stored.append(list(relabel(realization, order)))
+                    if len(stored) > MAX_CACHED_REALIZATIONS:
+                        store, stored = False, []
+                if limit is not None and found >= limit:
+                    return
+        except _SearchStopped:
+            return
+        finally:
+            if stats is not None:
+                if stats.track_memory:
+                    stats.peak_memory = max(stats.peak_memory or 0,
+                                            tracemalloc.get_traced_memory()[1])
+                    if tracing:
+                        tracemalloc.stop()
+        if store:
+            self.cache.put('realizations', sequence, stored)
 
-        def can_add_edge(G, u, v, target_degrees):
-            """Check if adding edge (u,v) maintains valid degree sequence"""
-            if G.has_edge(u, v):
-                return False
-            return (G.degree(u) < target_degrees[u] and 
-                    G.degree(v) < target_degrees[v])
+    @staticmethod
+    def _timed(realizations, seen: Optional[CanonicalDeduplicator], stats: SearchStats):
+        """Deduplicates search results with seen, timing the search and dedup phases"""
+        clock = time.perf_counter
+        iterator = iter(realizations)
+        while True:
+            start = clock()
+            try:
+                realization = next(iterator)
+            except StopIteration:
+                stats.add_time('search', clock() - start)
+                return
+            except _SearchStopped:
+                stats.add_time('search', clock() - start)
+                raise
+            found = clock()
+            stats.add_time('search', found - start)
+            if seen is None:
+                yield realization
+                continue
+            
+            stats.leaves += 1
+            stats.dedup_lookups += 1
+            is_new = seen.add(realization)
+            stats.add_time('dedup', clock() - found)
+            if is_new:
+                yield realization
+            else:
+                stats.duplicates += 1
+
+    def count_realizations(self, sequence: List[int], labeled: bool = False,
+                           workers: Optional[int] = None) -> int:
+        """
+        Counts the simple graphs with the given degree sequence without building them.
+        
+        Labeled counts (vertex i gets degree sequence[i]) use a memoized dynamic
+        program: removing the vertex with the largest residual degree d leaves
+        a subproblem that only depends on the multiset of residual degrees, and
+        the ways to pick its d neighbors only depend on how many vertices sit at
+        each residual degree. States are memoized as count-per-degree tuples.
+        
+        Unlabeled counts (non-isomorphic realizations) have no such shortcut:
+        they run the symmetry-breaking orderly search on adjacency bitsets and
+        count what it finds, keeping only certificates, never graph objects.
+        They therefore cost as much time as enumerating the realizations with
+        iter_realizations, and the enumeration limit applies to them too
+        (e.g. [3] * 14 takes minutes); only labeled counts go beyond it.
+        
+        Args:
+            sequence (List[int]): A sequence of non-negative integers
+            labeled (bool): Count labeled graphs instead of isomorphism classes
+            workers (Optional[int]): Worker processes for the unlabeled search
+            
+        Returns:
+            int: The number of realizations, 0 if the sequence is not graphic
+        """
+        kind = 'labeled-count' if labeled else 'count'
+        if self.cache is not None:
+            cached = self.cache.get(kind, sequence)
+            if cached is not None:
+                return cached
+        
+        result = self._count_realizations(sequence, labeled, workers)
+        if self.cache is not None:
+            self.cache.put(kind, sequence, result)
+        return result
+
+    def _count_realizations(self, sequence: List[int], labeled: bool,
+                            workers: Optional[int]) -> int:
+        """Uncached body of count_realizations"""
+        if not self.is_graphic(sequence):
+            return 0
+        if not labeled:
+            return sum(1 for _ in self.iter_realizations(sequence, workers=workers, store=False))
+
+        memo: Dict[Tuple[int, ...], int] = {}
+
+        def count(state: Tuple[int, ...]) -> int:
+            # state[t - 1] is the number of vertices with residual degree t;
+            # saturated vertices are dropped
+            if not state:
+                return 1
+            if state in memo:
+                return memo[state]
+            
+            d = len(state)
+            counts = list(state)
+            counts[d - 1] -= 1
+            if not self.erdos_gallai_check(
+                    [t for t in range(d, 0, -1) for _ in range(counts[t - 1])] + [d]):
+                memo[state] = 0
+                return 0
+            
+            total = 0
+            moved = [0] * (d + 1)
+
+            def distribute(t: int, need: int, ways: int):
+                # Choose moved[t] of the counts[t - 1] vertices at residual t
+                nonlocal total
+                if need == 0:
+                    after = counts[:]
+                    for level in range(1, d + 1):
+                        after[level - 1] -= moved[level]
+                        if level > 1:
+                            after[level - 2] += moved[level]
+                    while after and after[-1] == 0:
+                        after.pop()
+                    total += ways * count(tuple(after))
+                    return
+                if t == 0:
+                    return
+                for j in range(min(need, counts[t - 1]), -1, -1):
+                    moved[t] = j
+                    distribute(t - 1, need - j, ways * comb(counts[t - 1], j))
+                moved[t] = 0
+
+            distribute(d, d, 1)
+            memo[state] = total
+            return total
 
-        def generate_recursive(G, remaining_edges):
-            if is_valid_degree_sequence(G):
+        histogram = [0] * max(sequence, default=0)
+        for d in sequence:
+            if d:
+                histogram[d - 1] += 1
+        return count(tuple(histogram))
+
+    def _search(self, sequence: List[int], order: List[int], rows: List[int],
+                residual: List[int], position: int, orderly: bool,
+                deadline: Optional[float], stop: Optional[Callable[[], bool]] = None,
+                stats: Optional[SearchStats] = None, depth_limit: Optional[int] = None):
+        """
+        Depth-first realization search below a partial graph.
+        
+        rows[v] is the adjacency bitset of v and residual[v] how many more edges
+        v still needs; the vertices order[:position] are completed, i.e. all of
+        their edges are decided. Yields every labeled realization reached, not
+        yet deduplicated. With depth_limit, nodes at that depth are not expanded
+        but yielded as _Subproblem states instead. Prunes are counted in stats
+        if given.
+        """
+        n = len(sequence)
+
+        def generate_recursive(position, depth):
+            if stats is not None:
+                stats.nodes += 1
+            if deadline is not None and time.monotonic() > deadline:
+                raise _SearchStopped
+            if stop is not None and stop():
+                raise _SearchStopped
+            
+            # Skip vertices that are already saturated
+            while position < n and residual[order[position]] == 0:
+                position += 1
+                
+            if position == n:
                 # Found a valid graph
-                if not any(nx.is_isomorphic(G, H) for H in result_graphs):
-                    result_graphs.append(G.copy())
+                yield tuple(rows)
+                return
+            if depth == depth_limit:
+                yield _Subproblem(position, tuple(rows), tuple(residual))
                 return
 
-            if not remaining_edges:
+            u = order[position]
+            later = order[position + 1:]
+            candidates = [v for v in later if residual[v] > 0]
+            
+            # u can only reach its target through vertices not completed yet
+            need = residual[u]
+            if len(candidates) < need:
+                if stats is not None:
+                    stats.capacity_prunes += 1
                 return
 
-            u, v = remaining_edges[0]
-            new_remaining = remaining_edges[1:]
+            if orderly:
+                choices = self._class_choices(
+                    self._interchangeable_classes(candidates, sequence, rows), need)
+            else:
+                choices = combinations(candidates, need)
 
-            # Try adding the edge
-            if can_add_edge(G, u, v, dict(zip(vertices, sequence))):
-                G.add_edge(u, v)
-                generate_recursive(G, new_remaining)
-                G.remove_edge(u, v)
+            residual[u] = 0
+            u_row, u_bit = rows[u], 1 << u
+            for neighbors in choices:
+                for v in neighbors:
+                    rows[u] |= 1 << v
+                    rows[v] |= u_bit
+                    residual[v] -= 1
+                    
+                # The rest has to be realizable among the remaining vertices
+                feasible = self.havel_hakimi_check([residual[v] for v in later])
+                if stats is not None:
+                    stats.residual_checks += 1
+                    stats.residual_prunes += not feasible
+                if feasible:
+                    yield from generate_recursive(position + 1, depth + 1)
+                    
+                for v in neighbors:
+                    rows[v] ^= u_bit
+                    residual[v] += 1
+                rows[u] = u_row
+            residual[u] = need
 
-            # Try without the edge
-            generate_recursive(G, new_remaining)
+        yield from generate_recursive(position, 0)
 
-        # Generate all possible edge combinations
-        potential_edges = list(combinations(vertices, 2))
-        generate_recursive(G, potential_edges)
+    def _parallel_search(self, sequence: List[int], order: List[int], orderly: bool,
+                         deadline: Optional[float], workers: int,
+                         stop: Optional[Callable[[], bool]] = None,
+                         stats: Optional[SearchStats] = None):
+        """Split the top of the search tree into subtrees, search them in a process pool, and merge"""
+        import multiprocessing
+        from concurrent.futures import Future, ProcessPoolExecutor, wait
         
-        return result_graphs
+        n = len(sequence)
+        
+        # Go one level deeper until every worker gets a few subtrees
+        for depth in range(1, n + 1):
+            frontier_stats = None if stats is None else SearchStats()
+            frontier = list(self._search(sequence, order, [0] * n, list(sequence), 0,
+                                         orderly, deadline, stop, frontier_stats,
+                                         depth_limit=depth))
+            subproblems = sum(isinstance(item, _Subproblem) for item in frontier)
+            if subproblems == 0 or subproblems >= 4 * workers:
+                break
+        if stats is not None:
+            stats.merge_counts(frontier_stats)
+
+        # Workers send back canonical certificates with their realizations, so
+        # merging is a plain set lookup
+        seen = set()
+        context = multiprocessing.get_context()
+        cancel = context.Event()
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                       initializer=_init_search_worker, initargs=(cancel,))
+        try:
+            tasks = []
+            for item in frontier:
+                if isinstance(item, _Subproblem):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    tasks.append(executor.submit(
+                        _search_subproblem,
+                        (sequence, order, orderly, item, remaining, stats is not None)))
+                else:
+                    if stats is not None:
+                        stats.leaves += 1
+                    tasks.append([(item, canonical_form(item))])
+                    
+            # Consume in frontier order so results come out as in the serial search
+            for task in tasks:
+                stopped = False
+                if stop is not None and stop():
+                    raise _SearchStopped
+                if isinstance(task, Future):
+                    # Wait in slices, so stop and the timeout are noticed
+                    # while a worker is still busy
+                    while not wait([task], timeout=STOP_POLL_INTERVAL).done:
+                        if stop is not None and stop():
+                            raise _SearchStopped
+                        if deadline is not None and time.monotonic() > deadline:
+                            raise _SearchStopped
+                    task, stopped, task_stats = task.result()
+                    if stats is not None:
+                        stats.merge_counts(task_stats)
+                for realization, certificate in task:
+                    if stats is not None:
+                        stats.dedup_lookups += 1
+                        stats.duplicates += certificate in seen
+                    if certificate not in seen:
+                        seen.add(certificate)
+                        yield realization
+                if stopped:
+                    raise _SearchStopped
+        finally:
+            # Whether the search ended, was stopped or was abandoned by the
+            # caller, no worker keeps searching past this point
+            cancel.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _interchangeable_classes(candidates: List[int], sequence: List[int],
+                                 rows: List[int]) -> List[List[int]]:
+        """
+        Groups open vertices that an automorphism of the partial graph can swap.
+
+        Open vertices only have edges to completed vertices, so two of them
+        with the same target degree and the same neighbors are interchangeable.
+        """
+        classes: Dict[Tuple, List[int]] = {}
+        for v in candidates:
+            classes.setdefault((sequence[v], rows[v]), []).append(v)
+        return list(classes.values())
+
+    @staticmethod
+    def _class_choices(classes: List[List[int]], need: int):
+        """Yield neighbor sets taking the first j members of each class, sum j = need"""
+        chosen: List[int] = []
+
+        def choose(index: int, need: int):
+            if need == 0:
+                yield tuple(chosen)
+                return
+            if index == len(classes):
+                return
+            members = classes[index]
+            for j in range(min(need, len(members)), -1, -1):
+                chosen.extend(members[:j])
+                yield from choose(index + 1, need - j)
+                del chosen[len(chosen) - j:]
+
+        yield from choose(0, need)
+
+def _init_search_worker(cancel):
+    """Process pool initializer of the parallel search"""
+    global _cancel_event
+    _cancel_event = cancel
+
+def _search_subproblem(task):
+    """Search one subtree of the realization search in a worker process"""
+    sequence, order, orderly, subproblem, timeout, instrument = task
+    analyzer = GraphSequenceAnalyzer()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    stats = SearchStats() if instrument else None
+    
+    # Deduplicate locally to keep the results sent back small
+    seen = set()
+    realizations = []
+    stopped = False
+    try:
+        for realization in analyzer._search(sequence, order, list(subproblem.rows),
+                                            list(subproblem.residual), subproblem.position,
+                                            orderly, deadline, _cancel_event.is_set, stats):
+            certificate = canonical_form(realization)
+            if stats is not None:
+                stats.leaves += 1
+                stats.dedup_lookups += 1
+                stats.duplicates += certificate in seen
+            if certificate not in seen:
+                seen.add(certificate)
+                realizations.append((realization, certificate))
+    except _SearchStopped:
+        stopped = True
+    return realizations, stopped, stats
@@ -0,0 +1,177 @@
+from typing import Dict, Optional
+
+import networkx as nx
+import numpy as np
+
+# Graphs with at least this many vertices use the vectorized layout below
+# instead of networkx's spring layout
+LARGE_GRAPH = 100
+# Spectral initial positions need a dense eigendecomposition, O(n^3)
+SPECTRAL_MAX_VERTICES = 1500
+# Force iterations for a fresh layout and for one warm-started from the
+# previous realization, which only has to adjust to a few changed edges
+ITERATIONS = 50
+WARM_ITERATIONS = 15
+
+Layout = Dict[int, np.ndarray]
+
+
+def compute_layout(G: nx.Graph, previous: Optional[Layout] = None) -> Layout:
+    """
+    Computes vertex positions for drawing a realization.
+
+    Realizations of one sequence share their vertex set, so the positions of
+    the previously shown realization are a good starting point: only a few
+    edges differ, a short run of the force layout settles them, and the
+    picture does not jump around between realizations.
+
+    Args:
+        G (nx.Graph): The graph to lay out
+        previous (Optional[Layout]): Positions of a graph on the same vertices
+
+    Returns:
+        Layout: Position of every vertex, scaled to [-1, 1]
+    """
+    n = G.number_of_nodes()
+    if n == 0:
+        return {}
+    if previous is not None and previous.keys() != set(G):
+        previous = None
+    iterations = ITERATIONS if previous is None else WARM_ITERATIONS
+
+    if n < LARGE_GRAPH:
+        return nx.spring_layout(G, k=1.5, pos=previous, iterations=iterations, seed=0)
+
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    adjacency = np.zeros((n, n))
+    for u, v in G.edges():
+        adjacency[index[u], index[v]] = adjacency[index[v], index[u]] = 1.0
+
+    if previous is not None:
+        pos = np.array([previous[v] for v in nodes], dtype=float)
+        temperature = 0.02
+    else:
+        pos = _spectral_positions(adjacency)
+        temperature = 0.1
+    pos = _force_layout(adjacency, pos, iterations, temperature)
+    return dict(zip(nodes, pos))
+
+
+def _spectral_positions(adjacency: np.ndarray) -> np.ndarray:
+    """Initial positions from the Laplacian eigenvectors, or a circle for huge graphs"""
+    n = len(adjacency)
+    if n > SPECTRAL_MAX_VERTICES:
+        angles = 2 * np.pi * np.arange(n) / n
+        return np.column_stack([np.cos(angles), np.sin(angles)])
+
+    laplacian = np.diag(adjacency.sum(axis=1)) - adjacency
+    _, vectors = np.linalg.eigh(laplacian)
+    pos = vectors[:, 1:3]
+    # Vertices of other components collapse onto one point; jitter them
+    # deterministically so the forces can pull them apart
+    pos = pos + 1e-3 * np.random.default_rng(0).standard_normal(pos.shape)
+    return _rescale(pos)
+
+
+def _force_layout(adjacency: np.ndarray, pos: np.ndarray, iterations: int,
+                  temperature: float) -> np.ndarray:
+    """Fruchterman-Reingold iterations over all vertex pairs at once"""
+    n = len(adjacency)
+    k = 1.0 / np.sqrt(n)
+    pos = _rescale(pos) / 2 + 0.5
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        squared = (pos ** 2).sum(axis=1)
+        distance = np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2 * pos @ pos.T,
+                                      1e-4))
+        # Every pair repels, adjacent pairs also attract; summing
+        # force[i, j] * (pos[i] - pos[j]) over j is two matrix products
+        force = k * k / distance ** 2 - adjacency * distance / k
+        np.fill_diagonal(force, 0.0)
+        displacement = pos * force.sum(axis=1)[:, None] - force @ pos
+        length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 0.01)
+        pos += displacement * (temperature / length)[:, None]
+        temperature -= cooling
+    return _rescale(pos)
+
+
+def _rescale(pos: np.ndarray) -> np.ndarray:
+    pos = pos - pos.mean(axis=0)
+    extent = np.abs(pos).max()
+    return pos / extent if extent > 0 else pos
+
+
+class GraphDrawing:
+    """
+    Matplotlib artists showing one realization at a time on a fixed Axes.
+
+    The artists are created once and then updated in place: showing another
+    realization of the same sequence only moves the vertices and labels and
+    swaps the edge segments, instead of rebuilding the figure.
+
+    Args:
+        ax: The matplotlib Axes to draw on
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.nodes = None
+        self.edges = None
+        self.labels = []
+        self.ax.set_axis_off()
+
+    def show(self, G: nx.Graph, pos: Layout):
+        """
+        Draws G with the given vertex positions.
+
+        Args:
+            G (nx.Graph): The graph to draw
+            pos (Layout): Position of every vertex
+        """
+        from matplotlib.collections import LineCollection
+
+        nodes = list(G)
+        xy = np.array([pos[v] for v in nodes], dtype=float).reshape(-1, 2)
+        segments = [(pos[u], pos[v]) for u, v in G.edges()]
+
+        if self.nodes is None or len(self.labels) != len(nodes):
+            self.clear()
+            n = len(nodes)
+            # Keep the original look for small graphs and shrink for big ones
+            node_size = 2000 if n <= 12 else max(20, 24000 // n)
+            self.edges = LineCollection(segments, colors='#404040',
+                                        linewidths=2 if n <= 40 else 0.5, alpha=0.9, zorder=1)
+            self.ax.add_collection(self.edges)
+            self.nodes = self.ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c='#ADD8E6',
+                                         alpha=0.9, zorder=2)
+            if n <= 40:
+                self.labels = [
+                    self.ax.text(x, y, str(v), ha='center', va='center',
+                                 fontsize=16 if n <= 12 else 9, fontweight='bold',
+                                 color='#000000', zorder=3,
+                                 bbox=dict(facecolor='white', edgecolor='none', alpha=0.7))
+                    for v, (x, y) in zip(nodes, xy)
+                ]
+            else:
+                self.labels = [None] * n
+        else:
+            self.edges.set_segments(segments)
+            self.nodes.set_offsets(xy)
+            for label, (x, y) in zip(self.labels, xy):
+                if label is not None:
+                    label.set_position((x, y))
+
+        margin = 0.15
+        if len(xy):
+            low, high = xy.min(axis=0) - margin, xy.max(axis=0) + margin
+            self.ax.set_xlim(low[0], high[0])
+            self.ax.set_ylim(low[1], high[1])
+
+    def clear(self):
+        """Removes the drawing"""
+        for artist in [self.nodes, self.edges] + self.labels:
+            if artist is not None:
+                artist.remove()
+        self.nodes = self.edges = None
+        self.labels = []
@@ -0,0 +1,199 @@
+"""
+Exhaustive enumeration and counting of the graphic sequences of length n.
+
+iter_graphic_sequences walks the non-increasing sequences in descending
+lexicographic order and cuts every prefix that can no longer satisfy the
+Erdős-Gallai inequalities, so it spends its time on graphic sequences only.
+count_graphic_sequences does not enumerate at all: it counts with a dynamic
+program over the Durfee square and reaches n in the 30s in seconds
+(OEIS A004251: 1, 1, 2, 4, 11, 31, 102, 342, 1213, ...).
+"""
+from typing import Iterator, List, Sequence
+
+# Counts up to this n fit in int64 with a wide margin; beyond it the
+# dynamic program switches to Python integers
+INT64_MAX_VERTICES = 30
+
+
+def iter_graphic_sequences(n: int, workers: int = 1,
+                           prefix: Sequence[int] = ()) -> Iterator[List[int]]:
+    """
+    Yields every graphic sequence of length n, non-increasing, in descending
+    lexicographic order.
+
+    For a prefix d1..dk the remaining n - k degrees are at most dk, so
+
+        slack(j) = j(j-1) + sum(min(di, j)) + (n - k) min(dk, j) - sum(di)
+                           j<i<=k                                 i<=j
+
+    bounds the Erdős-Gallai slack of every j <= k over all completions, and a
+    prefix with a negative slack(j) has no graphic completion. Appending
+    v <= dk lowers slack(j) by (n - k)(min(dk, j) - v) for j > v only, so an
+    extension is checked in O(k); at k = n the bound is exact and only the
+    parity is left to test.
+
+    Args:
+        n (int): Length of the sequences
+        workers (int): Number of worker processes; the search is sharded by
+            its two-degree prefixes
+        prefix (Sequence[int]): Only yield sequences starting with these degrees
+
+    Yields:
+        List[int]: Each graphic sequence of length n
+    """
+    if workers <= 1 or n < 3 or prefix:
+        yield from _search(n, list(prefix))
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    shards = [[first, second] for first in range(n - 1, -1, -1) for second in range(first, -1, -1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for shard in shards:
+            pending.append(executor.submit(_collect_shard, n, shard))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _collect_shard(n: int, prefix: List[int]) -> List[List[int]]:
+    return list(_search(n, prefix))
+
+
+def _search(n: int, prefix: List[int]) -> Iterator[List[int]]:
+    if n == 0:
+        if not prefix:
+            yield []
+        return
+    seq: List[int] = []
+    # slack[j - 1] is slack(j) of the current prefix, left_sum[j] = d1 + ... + dj
+    slack: List[int] = []
+    left_sum = [0]
+    for d in prefix:
+        if not 0 <= d <= (seq[-1] if seq else n - 1) or not _push(n, seq, slack, left_sum, d):
+            return
+    yield from _extend(n, seq, slack, left_sum)
+
+
+def _push(n: int, seq: List[int], slack: List[int], left_sum: List[int], v: int) -> bool:
+    """Appends v if the prefix stays feasible; leaves everything unchanged otherwise"""
+    k = len(seq)
+    if seq:
+        last = seq[-1]
+        for j in range(v + 1, k + 1):
+            if slack[j - 1] < (n - k) * (min(last, j) - v):
+                return False
+    new_sum = left_sum[-1] + v
+    new_slack = (k + 1) * k + (n - k - 1) * min(v, k + 1) - new_sum
+    if new_slack < 0:
+        return False
+
+    if seq:
+        for j in range(v + 1, k + 1):
+            slack[j - 1] -= (n - k) * (min(last, j) - v)
+    seq.append(v)
+    slack.append(new_slack)
+    left_sum.append(new_sum)
+    return True
+
+
+def _pop(n: int, seq: List[int], slack: List[int], left_sum: List[int]):
+    """Undoes the last _push"""
+    v = seq.pop()
+    slack.pop()
+    left_sum.pop()
+    k = len(seq)
+    if seq:
+        last = seq[-1]
+        for j in range(v + 1, k + 1):
+            slack[j - 1] += (n - k) * (min(last, j) - v)
+
+
+def _extend(n: int, seq: List[int], slack: List[int],
+            left_sum: List[int]) -> Iterator[List[int]]:
+    if len(seq) == n:
+        if left_sum[-1] % 2 == 0:
+            yield list(seq)
+        return
+    for v in range(seq[-1] if seq else n - 1, -1, -1):
+        if _push(n, seq, slack, left_sum, v):
+            yield from _extend(n, seq, slack, left_sum)
+            _pop(n, seq, slack, left_sum)
+
+
+def count_graphic_sequences(n: int, workers: int = 1) -> int:
+    """
+    Counts the graphic sequences of length n without enumerating them.
+
+    Let m = max{i : di >= i} be the side of the Durfee square of the sequence
+    and d* its conjugate. For k <= m every one of d1..dk is at least k, which
+    turns the Erdős-Gallai inequality into
+
+        sum(di) <= sum(d*t) - k
+        i<=k      t<=k
+
+    and the inequalities for k > m then hold as well. Writing ri = di - m
+    for the rows to the right of the square and ct = d*t - m for the columns
+    below it, this says (r1 + 1) + ... + (rk + 1) <= c1 + ... + ck for every
+    k <= m. Both r and c are non-increasing, r1 <= n - 1 - m and c1 <= n - m,
+    and the degree sum m² + sum(r) + sum(c) must be even; every such pair is
+    exactly one sequence. The pairs are counted for each m by a dynamic
+    program over (rk, ck, slack, parity), vectorized over the slack, in
+    roughly O(n^5) overall. Every m is independent, so the values of m are
+    sharded across worker processes.
+
+    Args:
+        n (int): Length of the sequences
+        workers (int): Number of worker processes
+
+    Returns:
+        int: The number of graphic sequences of length n
+    """
+    if n <= 1:
+        return 1
+    # m = 0 is the all-zero sequence
+    sizes = range(1, n)
+    if workers <= 1:
+        return 1 + sum(_count_durfee(n, m) for m in sizes)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The middle values of m carry most of the work, so they go first
+    order = sorted(sizes, key=lambda m: -m * (n - m) ** 3)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return 1 + sum(executor.map(_count_durfee, [n] * len(order), order))
+
+
+def _count_durfee(n: int, m: int) -> int:
+    """Graphic sequences of length n whose Durfee square has side m"""
+    import numpy as np
+
+    rows, columns = n - m, n - m + 1
+    size = m * (n - m) + 1
+    dtype = np.int64 if n <= INT64_MAX_VERTICES else object
+
+    # state[r, c, s, p]: pairs of prefixes ending in r and c, with slack s
+    # and degree-sum parity p
+    state = np.zeros((rows, columns, size, 2), dtype=dtype)
+    for r in range(rows):
+        for c in range(r + 1, columns):
+            state[r, c, c - r - 1, (r + c) % 2] += 1
+
+    for _ in range(m - 1):
+        # Predecessors of (r, c) are all (r', c') with r' >= r and c' >= c
+        reach = state[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1]
+        state = np.zeros_like(state)
+        for r in range(rows):
+            for c in range(columns):
+                shift = c - r - 1
+                moved = np.zeros_like(reach[r, c])
+                if shift >= 0:
+                    moved[shift:] = reach[r, c, :size - shift]
+                else:
+                    moved[:size + shift] = reach[r, c, -shift:]
+                state[r, c] = moved[:, ::-1] if (r + c) % 2 else moved
+
+    return int(state[..., (m * m) % 2].sum())
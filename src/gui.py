@@ -1,12 +1,21 @@
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
-import networkx as nx
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from analysis_worker import AnalysisWorker
 from graph_algorithm import GraphSequenceAnalyzer
+from graph_view import GraphDrawing, compute_layout
+from sequence_cache import SequenceCache
 from test_graph import TestCases
 
 class GraphSequenceGUI:
+    # Milliseconds between checks for results from the analysis worker
+    POLL_INTERVAL = 50
+    # Most worker messages handled per poll, so a burst of small graphs
+    # cannot starve the event loop
+    MAX_MESSAGES_PER_POLL = 200
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Graph Sequence Analyzer")
@@ -30,6 +39,11 @@ class GraphSequenceGUI:
         # Initialize variables
         self.current_graph_index = 0
         self.graphs = []
+        self.worker = None
+        # Layouts of the current realizations by index, so paging back and
+        # forth shows each one exactly as before
+        self.layouts = {}
+        self.shown_layout = None
         
         # Get screen dimensions and set window size
         screen_width = root.winfo_screenwidth()
@@ -40,7 +54,8 @@ class GraphSequenceGUI:
         y_pos = (screen_height - window_height) // 2
         self.root.geometry(f"{window_width}x{window_height}+{x_pos}+{y_pos}")
         
-        self.analyzer = GraphSequenceAnalyzer()
+        # Re-selecting a test case is answered from the cache
+        self.analyzer = GraphSequenceAnalyzer(cache=SequenceCache(maxsize=256))
         self.test_cases = {
             name: (sequence, description) 
             for name, (sequence, description, _) in TestCases.get_test_cases().items()
@@ -135,6 +150,10 @@ class GraphSequenceGUI:
         ttk.Button(btn_frame, text="Analyze", command=self.analyze_sequence,
                   padding=(20, 5)).grid(row=0, column=0)
         
+        self.cancel_button = ttk.Button(btn_frame, text="Cancel", command=self.cancel_analysis,
+                                        state=tk.DISABLED, padding=(20, 5))
+        self.cancel_button.grid(row=0, column=1, padx=(5, 0))
+        
         # Results section
         self.results_frame = ttk.LabelFrame(left_panel, text="Results", padding=(10, 5))
         self.results_frame.grid(row=2, column=0, sticky="ew", pady=(0, 10))
@@ -178,6 +197,13 @@ class GraphSequenceGUI:
         self.graph_frame.columnconfigure(0, weight=1)
         self.graph_frame.rowconfigure(0, weight=1)
         
+        # One figure and canvas for the lifetime of the window; showing a
+        # realization only updates the artists on it
+        self.figure = Figure(figsize=(8, 8), dpi=100, tight_layout=True)
+        self.drawing = GraphDrawing(self.figure.add_subplot(111))
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        
         # Navigation controls
         nav_frame = ttk.Frame(right_panel, padding=(0, 5))
         nav_frame.grid(row=1, column=0, sticky="ew")
@@ -216,46 +242,30 @@ class GraphSequenceGUI:
         if not self.graphs:
             return
             
-        # Clear previous graph
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
-            
-        # Create new figure that fills the frame
-        fig = Figure(figsize=(8, 8), dpi=100, tight_layout=True)
-        ax = fig.add_subplot(111)
-        
         G = self.graphs[self.current_graph_index]
-        pos = nx.spring_layout(G, k=1.5, iterations=50)  # Increased k for better spacing
-        
-        # Draw graph with enhanced visual properties
-        nx.draw(G, pos, ax=ax,
-               with_labels=True,
-               node_color='#ADD8E6',  # Light blue
-               node_size=2000,
-               font_size=16,
-               font_weight='bold',
-               font_color='#000000',
-               width=2,
-               edge_color='#404040',
-               alpha=0.9,
-               bbox=dict(facecolor='white', edgecolor='none', alpha=0.7))
-        
-        # Create canvas with improved size handling
-        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-        canvas.draw()
-        
-        # Make canvas expandable
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        
-        # Update navigation label with more information
-        total_graphs = len(self.graphs)
+        pos = self.layouts.get(self.current_graph_index)
+        if pos is None:
+            # Start from the realization on screen so the picture stays put
+            pos = compute_layout(G, previous=self.shown_layout)
+            self.layouts[self.current_graph_index] = pos
+        self.shown_layout = pos
+        
+        self.drawing.show(G, pos)
+        self.canvas.draw_idle()
+        
+        self.update_graph_label()
+        
+    def update_graph_label(self):
+        """Show which realization is displayed and whether more may arrive"""
+        if not self.graphs:
+            return
+        searching = " (searching...)" if self.worker is not None else ""
         self.graph_label.config(
-            text=f"Realization {self.current_graph_index + 1} of {total_graphs}"
+            text=f"Realization {self.current_graph_index + 1} of {len(self.graphs)}{searching}"
         )
         
     def analyze_sequence(self):
-        """Analyze the input sequence with improved feedback"""
+        """Start analyzing the input sequence in the background"""
         try:
             # Get and clean the input
             sequence_text = self.sequence_entry.get().strip()
@@ -264,84 +274,151 @@ class GraphSequenceGUI:
                 return
                 
             sequence = [int(x.strip()) for x in sequence_text.split(',')]
+        except ValueError:
+            messagebox.showerror(
+                "Input Error",
+                "Please enter valid integers separated by commas"
+            )
+            return
             
-            # Get selected method
-            method = self.method_var.get()
+        # Get selected method
+        method = self.method_var.get()
+        
+        # Any earlier analysis is abandoned
+        self.cancel_analysis()
+        self.graphs = []
+        self.layouts = {}
+        self.shown_layout = None
+        self.current_graph_index = 0
+        self.clear_graph_display()
+        
+        # Clear previous results
+        for widget in self.results_frame.winfo_children():
+            widget.destroy()
+        
+        # Create results container with proper spacing
+        self.results_container = ttk.Frame(self.results_frame)
+        self.results_container.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+        self.results_container.columnconfigure(0, weight=1)
+        
+        # Add method used to results
+        method_names = {
+            'both': 'Both Methods',
+            'havel-hakimi': 'Havel-Hakimi Algorithm',
+            'erdos-gallai': 'Erdős-Gallai Theorem'
+        }
+        ttk.Label(self.results_container,
+                 text=f"Method used: {method_names[method]}",
+                 style='Info.TLabel').grid(
+                     row=0, column=0, sticky="w", pady=2)
+        
+        self.status_label = ttk.Label(self.results_container, text="Checking...",
+                                      style='Info.TLabel')
+        self.status_label.grid(row=1, column=0, sticky="w", pady=2)
+        
+        # The check and the search run in a worker thread; poll_worker picks
+        # up its results from the Tk event loop
+        self.worker = AnalysisWorker(self.analyzer, sequence, method)
+        self.worker.start()
+        self.cancel_button.config(state=tk.NORMAL)
+        self.root.after(self.POLL_INTERVAL, self.poll_worker, self.worker)
+        
+    def poll_worker(self, worker):
+        """Handle the messages a worker has posted since the last poll"""
+        if worker is not self.worker:
+            return  # Superseded or cancelled
             
-            # Clear previous results
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
+        first_new = len(self.graphs)
+        finished = False
+        for _ in range(self.MAX_MESSAGES_PER_POLL):
+            try:
+                kind, payload = worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'graph':
+                self.graphs.append(payload)
+            elif kind == 'verdict':
+                self.show_verdict(worker.sequence, payload)
+            elif kind == 'error':
+                messagebox.showerror("Analysis Error", str(payload))
+                finished = True
+                break
+            else:  # 'done'
+                finished = True
+                break
+                
+        if finished:
+            self.worker = None
+            self.cancel_button.config(state=tk.DISABLED)
+            if self.graphs:
+                self.show_search_stats(worker.stats)
             
-            # Create results container with proper spacing
-            results_container = ttk.Frame(self.results_frame)
-            results_container.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
-            results_container.columnconfigure(0, weight=1)
+        if len(self.graphs) > first_new and first_new == 0:
+            # The first realization is shown as soon as it arrives
+            self.show_current_graph()
+        if self.graphs:
+            self.update_graph_label()
+            self.update_navigation_buttons()
+            self.update_realization_count(finished)
             
-            # Check if sequence is graphic using selected method
-            is_graphic = self.analyzer.is_graphic(sequence, method=method)
+        if not finished:
+            self.root.after(self.POLL_INTERVAL, self.poll_worker, worker)
             
-            # Add method used to results
-            method_names = {
-                'both': 'Both Methods',
-                'havel-hakimi': 'Havel-Hakimi Algorithm',
-                'erdos-gallai': 'Erdős-Gallai Theorem'
-            }
-            ttk.Label(results_container,
-                     text=f"Method used: {method_names[method]}",
-                     style='Info.TLabel').grid(
-                         row=0, column=0, sticky="w", pady=2)
+    def show_verdict(self, sequence, verdict):
+        """Show whether the sequence is graphic, and why not if it is not"""
+        if verdict.graphic:
+            ttk.Label(self.results_container, 
+                     text="✓ The sequence is graphic",
+                     style='Success.TLabel').grid(
+                         row=1, column=0, sticky="w", pady=2)
             
-            if is_graphic:
-                self.graphs = self.analyzer.generate_all_graphs(sequence)
-                
-                # Show detailed results
-                ttk.Label(results_container, 
-                         text="✓ The sequence is graphic",
-                         style='Success.TLabel').grid(
-                             row=1, column=0, sticky="w", pady=2)
-                             
-                ttk.Label(results_container,
-                         text=f"Found {len(self.graphs)} different realization" + 
-                              ("s" if len(self.graphs) != 1 else ""),
-                         style='Info.TLabel').grid(
-                             row=2, column=0, sticky="w", pady=2)
-                
-                if sequence:
-                    ttk.Label(results_container,
-                             text=f"Sum of degrees: {sum(sequence)}",
-                             style='Info.TLabel').grid(
-                                 row=3, column=0, sticky="w", pady=2)
-                
-                self.current_graph_index = 0
-                self.show_current_graph()
-                self.update_navigation_buttons()
-            else:
-                ttk.Label(results_container,
-                         text="✗ The sequence is not graphic",
-                         style='Error.TLabel').grid(
-                             row=1, column=0, sticky="w", pady=2)
-                
-                # Show reason why it's not graphic
-                if sum(sequence) % 2 != 0:
-                    reason = "Sum of degrees must be even"
-                elif max(sequence) >= len(sequence):
-                    reason = "Maximum degree exceeds possible connections"
-                else:
-                    reason = "Violates degree sequence constraints"
-                    
-                ttk.Label(results_container,
-                         text=f"Reason: {reason}",
+            self.status_label.config(text="Searching for realizations...")
+            self.status_label.grid(row=2, column=0, sticky="w", pady=2)
+            
+            if sequence:
+                ttk.Label(self.results_container,
+                         text=f"Sum of degrees: {sum(sequence)}",
                          style='Info.TLabel').grid(
-                             row=2, column=0, sticky="w", pady=2)
-                
-                self.graphs = []
-                self.clear_graph_display()
-                
-        except ValueError:
-            messagebox.showerror(
-                "Input Error",
-                "Please enter valid integers separated by commas"
-            )
+                             row=3, column=0, sticky="w", pady=2)
+        else:
+            ttk.Label(self.results_container,
+                     text="✗ The sequence is not graphic",
+                     style='Error.TLabel').grid(
+                         row=1, column=0, sticky="w", pady=2)
+            
+            # The checker's certificate says exactly what failed
+            self.status_label.config(text=f"Reason: {verdict.explain()}")
+            self.status_label.grid(row=2, column=0, sticky="w", pady=2)
+            
+    def show_search_stats(self, stats):
+        """Show how much work the realization search did"""
+        ttk.Label(self.results_container,
+                 text="\n".join(stats.summary()),
+                 style='Info.TLabel',
+                 justify=tk.LEFT).grid(
+                     row=4, column=0, sticky="w", pady=(8, 2))
+            
+    def update_realization_count(self, finished, cancelled=False):
+        """Show how many realizations have been found so far"""
+        count = len(self.graphs)
+        plural = "s" if count != 1 else ""
+        if cancelled:
+            text = f"Cancelled after {count} realization{plural}"
+        elif not finished:
+            text = f"Found {count} realization{plural} so far..."
+        else:
+            text = f"Found {count} different realization{plural}"
+        self.status_label.config(text=text)
+        
+    def cancel_analysis(self):
+        """Stop the running analysis, keeping the realizations found so far"""
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        self.worker = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.update_graph_label()
+        self.update_realization_count(finished=True, cancelled=True)
             
     def on_test_case_selected(self, event):
         """Handle test case selection"""
@@ -349,6 +426,7 @@ class GraphSequenceGUI:
         sequence, description = self.test_cases[selected]
         
         if selected == "Custom Input":
+            self.cancel_analysis()
             self.sequence_entry.delete(0, tk.END)
             self.update_theory_text("Enter your own sequence of non-negative integers, separated by commas.")
             self.clear_graph_display()
@@ -400,7 +478,7 @@ class GraphSequenceGUI:
             
     def clear_graph_display(self):
         """Clear the graph display area"""
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
+        self.drawing.clear()
+        self.canvas.draw_idle()
         self.graph_label.config(text="")
         self.update_navigation_buttons()
\ No newline at end of file
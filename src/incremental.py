@@ -0,0 +1,266 @@
+from typing import Iterable, List
+
+INFINITY = float('inf')
+
+
+class _FenwickTree:
+    """Counts of values 0..capacity-1 with O(log n) updates and prefix counts"""
+
+    def __init__(self, capacity: int):
+        self.tree = [0] * (capacity + 1)
+
+    def add(self, value: int, delta: int):
+        i = value + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def count_below(self, value: int) -> int:
+        """How many stored values are < value"""
+        i = min(value, len(self.tree) - 1)
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+
+class _MinSegmentTree:
+    """
+    Array with range add and global minimum, both O(log n).
+
+    mins[node] is the minimum of the subtree including adds[node], an amount
+    added to the whole subtree, so range adds never have to be pushed down.
+    """
+
+    def __init__(self, values: List[float], capacity: int):
+        self.size = 1
+        while self.size < max(capacity, 1):
+            self.size *= 2
+        self.mins = [INFINITY] * (2 * self.size)
+        self.adds = [0] * (2 * self.size)
+        self.mins[self.size:self.size + len(values)] = values
+        for node in range(self.size - 1, 0, -1):
+            self.mins[node] = min(self.mins[2 * node], self.mins[2 * node + 1])
+
+    def minimum(self) -> float:
+        return self.mins[1]
+
+    def add(self, lo: int, hi: int, delta: int):
+        """Adds delta to positions lo..hi - 1"""
+        if lo >= hi:
+            return
+        mins, adds = self.mins, self.adds
+        lo += self.size
+        hi += self.size
+        first, last = lo, hi - 1
+        while lo < hi:
+            if lo & 1:
+                mins[lo] += delta
+                adds[lo] += delta
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                mins[hi] += delta
+                adds[hi] += delta
+            lo >>= 1
+            hi >>= 1
+        self._pull(first)
+        self._pull(last)
+
+    def set(self, index: int, value: float):
+        """Sets one position, taking the adds pending above it into account"""
+        node = index + self.size
+        pending = 0
+        parent = node // 2
+        while parent:
+            pending += self.adds[parent]
+            parent //= 2
+        self.mins[node] = value - pending
+        self.adds[node] = 0
+        self._pull(node)
+
+    def _pull(self, node: int):
+        mins, adds = self.mins, self.adds
+        node >>= 1
+        while node:
+            left, right = mins[2 * node], mins[2 * node + 1]
+            mins[node] = (left if left < right else right) + adds[node]
+            node >>= 1
+
+
+class IncrementalGraphicChecker:
+    """
+    Keeps a degree sequence under small edits and tells whether it is graphic.
+
+    With d1 >= ... >= dn sorted, the Erdős-Gallai slack of index k is
+
+        f(k) = k(k-1) + sum_{i>k} min(di, k) - sum_{i<=k} di
+
+    and the sequence is graphic iff its sum is even and f(k) >= 0 for all k.
+    Raising a degree from v to v + 1 can be taken to raise the first of the
+    v's in sorted order, at position a: that adds 1 to the left sum of every
+    k >= a and 1 to min(d_a, k) for v < k < a, so f drops by one on [a, n]
+    and rises by one on [v + 1, a - 1]. Lowering the last v, at position b,
+    is the mirror image: +1 on [b, n] and -1 on [v, b - 1].
+
+    Positions come from a Fenwick tree over the degree values, and the
+    slacks live in a segment tree with range add and global minimum, so
+    every edit is O(log n) and is_graphic is O(1).
+
+    Args:
+        sequence (Iterable[int]): The initial degrees; vertex v has degree sequence[v]
+
+    Raises:
+        ValueError: If a degree is negative
+    """
+
+    def __init__(self, sequence: Iterable[int] = ()):
+        self._degrees = list(sequence)
+        if any(d < 0 for d in self._degrees):
+            raise ValueError("degrees must be non-negative")
+        self._total = sum(self._degrees)
+        self._build(2 * len(self._degrees))
+
+    def __len__(self) -> int:
+        return len(self._degrees)
+
+    @property
+    def total(self) -> int:
+        """Sum of the degrees"""
+        return self._total
+
+    def degree(self, v: int) -> int:
+        """Current degree of vertex v"""
+        return self._degrees[v]
+
+    def sequence(self) -> List[int]:
+        """The current degrees, indexed by vertex"""
+        return list(self._degrees)
+
+    def is_graphic(self) -> bool:
+        """
+        Whether the current sequence is graphic, in O(1).
+
+        Returns:
+            bool: True if the sequence is graphic, False otherwise
+        """
+        return self._total % 2 == 0 and (not self._degrees or self._slack.minimum() >= 0)
+
+    def increment(self, v: int):
+        """
+        Raises the degree of vertex v by one, in O(log n).
+
+        Args:
+            v (int): The vertex
+        """
+        value = self._degrees[v]
+        if value + 1 >= len(self._counts):
+            self._build(self._capacity)
+        n = len(self._degrees)
+        a = self._count_ge(value + 1) + 1
+
+        self._slack.add(a - 1, n, -1)
+        self._slack.add(value, min(a - 1, n), 1)
+        self._move(v, value + 1)
+        self._total += 1
+
+    def decrement(self, v: int):
+        """
+        Lowers the degree of vertex v by one, in O(log n).
+
+        Args:
+            v (int): The vertex
+
+        Raises:
+            ValueError: If the degree of v is already 0
+        """
+        value = self._degrees[v]
+        if value == 0:
+            raise ValueError(f"vertex {v} already has degree 0")
+        n = len(self._degrees)
+        b = self._count_ge(value)
+
+        self._slack.add(b - 1, n, 1)
+        self._slack.add(value - 1, min(b - 1, n), -1)
+        self._move(v, value - 1)
+        self._total -= 1
+
+    def append(self, degree: int = 0) -> int:
+        """
+        Adds a vertex, in O((degree + 1) log n) amortized.
+
+        A vertex of degree 0 goes last in sorted order and leaves every
+        existing slack unchanged; its own slack is n(n-1) - sum. A larger
+        degree is then reached by increments.
+
+        Args:
+            degree (int): Degree of the new vertex
+
+        Returns:
+            int: The index of the new vertex
+
+        Raises:
+            ValueError: If degree is negative
+        """
+        if degree < 0:
+            raise ValueError("degrees must be non-negative")
+        n = len(self._degrees) + 1
+        if n > self._capacity:
+            self._degrees.append(0)
+            self._build(2 * n)
+        else:
+            self._degrees.append(0)
+            self._counts_tree.add(0, 1)
+            self._counts[0] += 1
+            self._slack.set(n - 1, n * (n - 1) - self._total)
+
+        v = n - 1
+        for _ in range(degree):
+            self.increment(v)
+        return v
+
+    def _count_ge(self, value: int) -> int:
+        return len(self._degrees) - self._counts_tree.count_below(value)
+
+    def _move(self, v: int, value: int):
+        old = self._degrees[v]
+        self._counts_tree.add(old, -1)
+        self._counts_tree.add(value, 1)
+        self._counts[old] -= 1
+        self._counts[value] += 1
+        self._degrees[v] = value
+
+    def _build(self, capacity: int):
+        """(Re)builds both trees from scratch in O(n + max degree)"""
+        n = len(self._degrees)
+        self._capacity = max(capacity, n, 1)
+        # Room for the degrees to double before the next rebuild
+        value_capacity = max(self._capacity, 2 * max(self._degrees, default=0) + 2)
+
+        self._counts = [0] * value_capacity
+        for d in self._degrees:
+            self._counts[d] += 1
+        self._counts_tree = _FenwickTree(value_capacity)
+        for value, count in enumerate(self._counts):
+            if count:
+                self._counts_tree.add(value, count)
+
+        # Slack of every k from the sorted sequence: the degrees >= k are
+        # its first count_ge entries, so each sum is a prefix sum
+        seq = []
+        for value in range(value_capacity - 1, -1, -1):
+            seq.extend([value] * self._counts[value])
+        prefix = [0] * (n + 1)
+        for i, d in enumerate(seq):
+            prefix[i + 1] = prefix[i] + d
+        count_ge = [0] * (value_capacity + 1)
+        for value in range(value_capacity - 1, -1, -1):
+            count_ge[value] = count_ge[value + 1] + self._counts[value]
+
+        slack = []
+        for k in range(1, n + 1):
+            c = count_ge[k] if k < value_capacity else 0
+            p = max(k, c)
+            slack.append(k * (k - 1) + k * (p - k) + prefix[n] - prefix[p] - prefix[k])
+        self._slack = _MinSegmentTree(slack, self._capacity)
@@ -1,14 +1,22 @@
-import tkinter as tk
-from gui import GraphSequenceGUI
+import sys
 
 def main():
     """
     Main entry point of the application.
-    Creates and runs the GUI application.
+    Runs the command-line batch analyzer when arguments are given,
+    otherwise creates and runs the GUI application.
     """
+    if len(sys.argv) > 1:
+        # Keep tkinter and matplotlib out of headless runs
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    import tkinter as tk
+    from gui import GraphSequenceGUI
+
     root = tk.Tk()
     app = GraphSequenceGUI(root)
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,282 @@
+import random
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set
+
+from graph_algorithm import GraphSequenceAnalyzer
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def connect_components(n: int, sources: List[int], targets: List[int]) -> bool:
+    """
+    Rewires an edge list in place into a connected graph with the same degrees.
+
+    Two components merge by swapping a cycle edge (u, v) of one with an edge
+    (x, y) of the other for (u, x) and (v, y): dropping a cycle edge keeps
+    the first component connected, both halves of the second one get
+    attached, and the new edges cannot already exist. Edges outside a
+    spanning forest lie on cycles, and every merge keeps the remaining ones
+    off the new spanning forest, so one union-find pass finds every edge
+    the merges need. O((n + m) α(n)) overall.
+
+    Args:
+        n (int): Number of vertices
+        sources (List[int]): First endpoint of every edge
+        targets (List[int]): Second endpoint of every edge
+
+    Returns:
+        bool: True if the edges now form a connected graph, False if no
+            rewiring can make them connected
+    """
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    cycle_edges: List[int] = []
+    tree_edges = []
+    for i, (u, v) in enumerate(zip(sources, targets)):
+        root_u, root_v = find(u), find(v)
+        if root_u == root_v:
+            cycle_edges.append(i)
+        else:
+            parent[root_u] = root_v
+            tree_edges.append(i)
+
+    # Group both kinds of edges by component; isolated vertices are
+    # components without edges and can never be attached
+    components = {find(v) for v in range(n)}
+    if len(components) <= 1:
+        return True
+    spare = {root: [] for root in components}
+    tree = {root: [] for root in components}
+    for i in cycle_edges:
+        spare[find(sources[i])].append(i)
+    for i in tree_edges:
+        tree[find(sources[i])].append(i)
+    if any(not spare[root] and not tree[root] for root in components):
+        return False
+
+    # Components with spare cycle edges go first so the pool never runs dry
+    # while there is still enough in total
+    order = sorted(components, key=lambda root: -len(spare[root]))
+    pool = list(spare[order[0]])
+    for root in order[1:]:
+        if not pool:
+            return False
+        i = pool.pop()
+        j = tree[root][0]
+        u, v, x, y = sources[i], targets[i], sources[j], targets[j]
+        sources[i], targets[i] = u, x
+        sources[j], targets[j] = v, y
+        pool.extend(spare[root])
+    return True
+
+
+class RealizationSampler:
+    """
+    Samples realizations of a degree sequence with a double-edge swap chain.
+
+    The chain starts from the Havel-Hakimi realization. Each step picks two
+    edges (a, b) and (c, d) uniformly at random and replaces them with
+    (a, d) and (c, b), or (a, c) and (b, d), each with probability 1/2; a
+    swap that would create a loop or a multi-edge is rejected and the chain
+    stays where it is. The proposal is symmetric, so the stationary
+    distribution is uniform over the labeled simple realizations.
+
+    Edges are kept in two parallel lists plus a set of edge keys, which makes
+    every swap O(1).
+
+    In connected mode the start is rewired into a connected realization and
+    swaps run in windows: connectivity is only checked after a whole window,
+    which is rolled back if it disconnected the graph. The window doubles
+    after a success and halves after a failure (Viger & Latapy, 2005). The
+    samples are then connected, at the price of exact uniformity.
+
+    Args:
+        sequence (List[int]): A graphic sequence
+        seed (Optional[int]): Seed of the random number generator
+        connected (bool): Only sample connected realizations
+        burn_in (Optional[int]): Swap attempts before the first sample;
+            defaults to 10 per edge
+        thin (Optional[int]): Swap attempts between consecutive samples;
+            defaults to one per edge
+        analyzer (Optional[GraphSequenceAnalyzer]): Analyzer building the
+            starting realization
+
+    Raises:
+        ValueError: If the sequence has no (connected) realization
+    """
+
+    def __init__(self, sequence: List[int], seed: Optional[int] = None,
+                 connected: bool = False, burn_in: Optional[int] = None,
+                 thin: Optional[int] = None,
+                 analyzer: Optional[GraphSequenceAnalyzer] = None):
+        analyzer = analyzer or GraphSequenceAnalyzer()
+        edges = analyzer.havel_hakimi_edges(sequence)
+        if edges is None:
+            raise ValueError("sequence is not graphic")
+
+        self.n = len(sequence)
+        self.connected = connected
+        self.rng = random.Random(seed)
+        self._sources: List[int] = edges[:, 0].tolist()
+        self._targets: List[int] = edges[:, 1].tolist()
+        if connected and not connect_components(self.n, self._sources, self._targets):
+            raise ValueError("sequence has no connected realization")
+        self._keys: Set[int] = {self._key(u, v) for u, v in zip(self._sources, self._targets)}
+
+        m = len(self._sources)
+        self.burn_in = 10 * m if burn_in is None else burn_in
+        self.thin = m if thin is None else thin
+        self.attempts = 0
+        self.accepted = 0
+        self._burned = False
+        self._sampled = False
+        self._window = 1
+
+    @property
+    def acceptance_rate(self) -> float:
+        """Fraction of swap attempts that changed the graph"""
+        return self.accepted / self.attempts if self.attempts else 0.0
+
+    def edges(self):
+        """
+        The current realization.
+
+        Returns:
+            np.ndarray: An (m, 2) int64 array of edges
+        """
+        import numpy as np
+
+        return np.column_stack([np.array(self._sources, dtype=np.int64),
+                                np.array(self._targets, dtype=np.int64)]).reshape(-1, 2)
+
+    def swap(self) -> bool:
+        """
+        Attempts one double-edge swap.
+
+        Returns:
+            bool: True if the swap was accepted
+        """
+        self.attempts += 1
+        m = len(self._sources)
+        if m < 2:
+            return False
+        i, j = self.rng.randrange(m), self.rng.randrange(m)
+        if i == j:
+            return False
+
+        a, b = self._sources[i], self._targets[i]
+        c, d = self._sources[j], self._targets[j]
+        if self.rng.random() < 0.5:
+            c, d = d, c
+        # (a, b), (c, d) -> (a, d), (c, b)
+        if a == d or c == b:
+            return False
+        new_first, new_second = self._key(a, d), self._key(c, b)
+        if new_first in self._keys or new_second in self._keys:
+            return False
+
+        self._keys.remove(self._key(a, b))
+        self._keys.remove(self._key(c, d))
+        self._keys.add(new_first)
+        self._keys.add(new_second)
+        self._sources[i], self._targets[i] = a, d
+        self._sources[j], self._targets[j] = c, b
+        self.accepted += 1
+        return True
+
+    def run(self, steps: int):
+        """
+        Advances the chain by a number of swap attempts.
+
+        Args:
+            steps (int): Number of swap attempts
+        """
+        if not self.connected:
+            for _ in range(steps):
+                self.swap()
+            return
+
+        while steps > 0:
+            window = min(self._window, steps)
+            saved = (list(self._sources), list(self._targets), set(self._keys))
+            for _ in range(window):
+                self.swap()
+            if self._is_connected():
+                self._window *= 2
+            else:
+                self._sources, self._targets, self._keys = saved
+                self._window = max(1, self._window // 2)
+            steps -= window
+
+    def sample(self, k: int):
+        """
+        Draws k realizations, burning in first if that has not happened yet.
+
+        Args:
+            k (int): Number of samples
+
+        Returns:
+            np.ndarray: A (k, m, 2) int64 array, one edge array per sample
+        """
+        import numpy as np
+
+        samples = list(self._iter_edges(k))
+        if not samples:
+            return np.zeros((0, len(self._sources), 2), dtype=np.int64)
+        return np.stack(samples)
+
+    def iter_graphs(self, k: int) -> Iterator['nx.Graph']:
+        """
+        Yields k sampled realizations as networkx graphs.
+
+        Args:
+            k (int): Number of samples
+
+        Yields:
+            nx.Graph: A graph on nodes 0..n-1 for each sample
+        """
+        import networkx as nx
+
+        for edges in self._iter_edges(k):
+            G = nx.Graph()
+            G.add_nodes_from(range(self.n))
+            G.add_edges_from(edges.tolist())
+            yield G
+
+    def _iter_edges(self, k: int):
+        if not self._burned:
+            self.run(self.burn_in)
+            self._burned = True
+        for _ in range(k):
+            # Consecutive samples are a thinning interval apart, also
+            # across calls
+            if self._sampled:
+                self.run(self.thin)
+            self._sampled = True
+            yield self.edges()
+
+    def _key(self, u: int, v: int) -> int:
+        return u * self.n + v if u < v else v * self.n + u
+
+    def _is_connected(self) -> bool:
+        if self.n <= 1:
+            return True
+        adjacency: List[List[int]] = [[] for _ in range(self.n)]
+        for u, v in zip(self._sources, self._targets):
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+        seen = [False] * self.n
+        seen[0] = True
+        stack = [0]
+        while stack:
+            for w in adjacency[stack.pop()]:
+                if not seen[w]:
+                    seen[w] = True
+                    stack.append(w)
+        return all(seen)
@@ -0,0 +1,162 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+
+class CacheStats:
+    """Hit and miss counters of a SequenceCache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from memory or disk"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (f"CacheStats(hits={self.hits}, disk_hits={self.disk_hits}, "
+                f"misses={self.misses}, evictions={self.evictions})")
+
+
+class SequenceCache:
+    """
+    Memoizes per-sequence results such as graphicality verdicts, realization
+    counts and realization sets.
+
+    Entries are keyed by a kind (e.g. 'graphic') and the degree sequence sorted
+    in descending order, since none of these results depend on vertex order.
+    A bounded LRU keeps the most recent entries in memory, limited both in
+    number and in total weight, the count of numbers they hold (see weight),
+    so a few large realization sets cannot take over memory; a single entry
+    heavier than max_weight is not kept in memory at all. With a path, every
+    entry is also written to a SQLite database that survives restarts and is
+    consulted on memory misses. Values must be JSON-serializable.
+
+    Args:
+        maxsize (int): Maximum number of entries kept in memory
+        path (Optional[str]): SQLite file for the persistent store
+        max_weight (int): Maximum total weight of the entries kept in memory
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None,
+                 max_weight: int = 1 << 20):
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.stats = CacheStats()
+        # Every entry maps to (value, weight)
+        self._entries: "OrderedDict[Tuple[str, Tuple[int, ...]], Tuple[Any, int]]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "kind TEXT, sequence TEXT, value TEXT, PRIMARY KEY (kind, sequence))"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def weight(value: Any) -> int:
+        """Rough memory footprint of a value: the numbers it holds, nested lists included"""
+        if isinstance(value, (list, tuple)):
+            return 1 + sum(SequenceCache.weight(item) for item in value)
+        return 1
+
+    @staticmethod
+    def key(sequence: Sequence[int]) -> Tuple[int, ...]:
+        """Canonical cache key of a degree sequence"""
+        return tuple(sorted(sequence, reverse=True))
+
+    def get(self, kind: str, sequence: Sequence[int]) -> Optional[Any]:
+        """
+        Looks up a cached result.
+
+        Args:
+            kind (str): What the value is, e.g. 'graphic' or 'count'
+            sequence (Sequence[int]): The degree sequence, in any order
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss
+        """
+        entry: Hashable = (kind, self.key(sequence))
+        with self._lock:
+            if entry in self._entries:
+                self._entries.move_to_end(entry)
+                self.stats.hits += 1
+                return self._entries[entry][0]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE kind = ? AND sequence = ?",
+                    (kind, self._encode_key(entry[1]))
+                ).fetchone()
+                if row is not None:
+                    self.stats.disk_hits += 1
+                    value = json.loads(row[0])
+                    self._remember(entry, value)
+                    return value
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, kind: str, sequence: Sequence[int], value: Any):
+        """
+        Stores a result in memory and, if configured, on disk.
+
+        Args:
+            kind (str): What the value is, e.g. 'graphic' or 'count'
+            sequence (Sequence[int]): The degree sequence, in any order
+            value (Any): JSON-serializable result
+        """
+        entry = (kind, self.key(sequence))
+        with self._lock:
+            self._remember(entry, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (kind, sequence, value) VALUES (?, ?, ?)",
+                    (kind, self._encode_key(entry[1]), json.dumps(value))
+                )
+                self._db.commit()
+
+    def clear(self):
+        """Drops every entry from memory and disk"""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self):
+        """Closes the on-disk store"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, entry, value):
+        if entry in self._entries:
+            self._weight -= self._entries.pop(entry)[1]
+        weight = self.weight(value)
+        if weight > self.max_weight:
+            return
+        self._entries[entry] = (value, weight)
+        self._weight += weight
+        while len(self._entries) > self.maxsize or self._weight > self.max_weight:
+            self._weight -= self._entries.popitem(last=False)[1][1]
+            self.stats.evictions += 1
+
+    @staticmethod
+    def _encode_key(key: Tuple[int, ...]) -> str:
+        return ",".join(map(str, key))
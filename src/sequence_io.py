@@ -0,0 +1,151 @@
+"""
+Binary degree-sequence files, read through numpy.memmap without copying.
+
+Files are headerless little-endian arrays in one of three formats:
+
+- 'uint32' / 'uint64': the degrees themselves, one entry per vertex
+- 'histogram': uint64 counts, entry d holding the number of vertices of degree d
+
+A degree file is never loaded as a whole: it is binned chunk by chunk into
+its histogram, and the Erdős-Gallai check runs on the histogram alone, so a
+10^8-entry file needs memory for one chunk and for counts up to the largest
+degree only.
+"""
+import os
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph_algorithm import GraphicVerdict, GraphSequenceAnalyzer
+
+# numpy dtype of every format
+BINARY_FORMATS = {'uint32': '<u4', 'uint64': '<u8', 'histogram': '<u8'}
+
+# Degrees binned at a time
+CHUNK_SIZE = 1 << 22
+
+
+def open_degrees(path: str, input_format: str = 'uint32') -> np.ndarray:
+    """
+    Maps a binary degree file read-only into memory, without reading it.
+
+    Args:
+        path (str): The file
+        input_format (str): 'uint32', 'uint64' or 'histogram'
+
+    Returns:
+        np.ndarray: A numpy.memmap over the file, or an empty array for an
+            empty file, which cannot be mapped
+
+    Raises:
+        ValueError: If the format is unknown or the file size is not a
+            multiple of the entry size
+    """
+    if input_format not in BINARY_FORMATS:
+        raise ValueError(f"unknown binary format {input_format!r}")
+    dtype = np.dtype(BINARY_FORMATS[input_format])
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(f"{path}: {size} bytes is not a whole number of {input_format} entries")
+    if not size:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def write_degrees(path: str, values: Sequence[int], input_format: str = 'uint32'):
+    """
+    Writes degrees, or the counts of a histogram, as a binary file.
+
+    Args:
+        path (str): The file
+        values (Sequence[int]): The degrees, or for 'histogram' the counts
+        input_format (str): 'uint32', 'uint64' or 'histogram'
+
+    Raises:
+        ValueError: If the format is unknown or a value does not fit it
+    """
+    if input_format not in BINARY_FORMATS:
+        raise ValueError(f"unknown binary format {input_format!r}")
+    dtype = np.dtype(BINARY_FORMATS[input_format])
+    values = np.asarray(values)
+    if values.size and (values.min() < 0 or values.max() > np.iinfo(dtype).max):
+        raise ValueError(f"values do not fit in {input_format}")
+    values.astype(dtype).tofile(path)
+
+
+def degree_histogram(degrees: np.ndarray, chunk_size: int = CHUNK_SIZE,
+                     limit: Optional[int] = None) -> np.ndarray:
+    """
+    Counts the vertices of every degree with one np.bincount per chunk, so a
+    memory-mapped array is streamed from disk rather than loaded.
+
+    Args:
+        degrees (np.ndarray): The degrees, e.g. from open_degrees
+        chunk_size (int): Degrees binned at a time
+        limit (Optional[int]): Reject degrees >= limit before binning them
+
+    Returns:
+        np.ndarray: int64 counts, entry d holding the number of degree-d
+            vertices, up to the largest degree
+
+    Raises:
+        ValueError: If a degree is negative or not below limit
+    """
+    counts, bad = _bin_degrees(degrees, chunk_size, limit)
+    if counts is None:
+        raise ValueError(f"degree {bad} is out of range")
+    return counts
+
+
+def _bin_degrees(degrees: np.ndarray, chunk_size: int,
+                 limit: Optional[int]) -> Tuple[Optional[np.ndarray], int]:
+    """(counts, 0), or (None, degree) for the first chunk's offending degree"""
+    counts = np.zeros(0, dtype=np.int64)
+    signed = degrees.dtype.kind == 'i'
+    for start in range(0, len(degrees), chunk_size):
+        chunk = degrees[start:start + chunk_size]
+        if signed and chunk.min() < 0:
+            return None, int(chunk.min())
+        top = int(chunk.max())
+        if limit is not None and top >= limit:
+            return None, top
+        # bincount cannot take uint64, and one chunk is cheap to convert
+        binned = np.bincount(chunk.astype(np.int64, copy=False))
+        if len(binned) > len(counts):
+            counts = np.concatenate([counts, np.zeros(len(binned) - len(counts), dtype=np.int64)])
+        counts[:len(binned)] += binned
+    return counts, 0
+
+
+def check_degree_file(path: str, input_format: str = 'uint32',
+                      analyzer: Optional[GraphSequenceAnalyzer] = None,
+                      chunk_size: int = CHUNK_SIZE) -> GraphicVerdict:
+    """
+    Runs the Erdős-Gallai check on a binary degree file, out of core.
+
+    Degrees are binned in chunks straight from the memory map, and degrees
+    of n or more are caught chunk by chunk before binning, so the histogram
+    never grows beyond n entries.
+
+    Args:
+        path (str): The file
+        input_format (str): 'uint32', 'uint64' or 'histogram'
+        analyzer (Optional[GraphSequenceAnalyzer]): Analyzer to check with
+        chunk_size (int): Degrees binned at a time
+
+    Returns:
+        GraphicVerdict: GRAPHIC, or why the sequence is not graphic
+
+    Raises:
+        ValueError: If the file does not hold whole entries of the format
+    """
+    analyzer = analyzer or GraphSequenceAnalyzer()
+    values = open_degrees(path, input_format)
+    if input_format == 'histogram':
+        return analyzer.erdos_gallai_histogram_verdict(values)
+
+    n = len(values)
+    counts, bad = _bin_degrees(values, chunk_size, n)
+    if counts is None:
+        return GraphicVerdict(False, 'degree-too-large', left=bad, right=n - 1)
+    return analyzer.erdos_gallai_histogram_verdict(counts)
@@ -1,6 +1,27 @@
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
+from itertools import combinations, combinations_with_replacement, product
 from typing import Dict, List, Tuple
-from graph_algorithm import GraphSequenceAnalyzer
+import networkx as nx
+import numpy as np
+import graph_algorithm
+from graph_algorithm import GRAPHIC, GraphicVerdict, GraphSequenceAnalyzer, SearchStats
+from sequence_cache import SequenceCache
+from analysis_worker import AnalysisWorker
+from sampling import RealizationSampler, connect_components
+from incremental import IncrementalGraphicChecker
+from graphic_sequences import count_graphic_sequences, iter_graphic_sequences
+from sequence_io import check_degree_file, degree_histogram, open_degrees, write_degrees
+import cli
+from graph_view import LARGE_GRAPH, GraphDrawing, compute_layout
+from canonical import CanonicalDeduplicator, canonical_form, graph_rows, rows_to_graph
 
 class TestCases:
     """Collection of test cases for graph sequence analysis with detailed explanations"""
@@ -172,6 +193,34 @@ class TestGraphSequenceAnalyzer(unittest.TestCase):
                     f"Erdős-Gallai test failed for {name}"
                 )
 
+    def test_erdos_gallai_matches_reference(self):
+        """Test the linear-time Erdős-Gallai check against the O(n²) reference"""
+        rng = random.Random(1960)
+        sequences = [sequence for sequence, _, _ in self.test_cases.values()]
+        for _ in range(2000):
+            n = rng.randint(1, 12)
+            sequences.append([rng.randint(0, n) for _ in range(n)])
+        for sequence in sequences:
+            with self.subTest(sequence=sequence):
+                self.assertEqual(
+                    self.analyzer.erdos_gallai_check(sequence),
+                    self.analyzer.erdos_gallai_reference_check(sequence)
+                )
+
+    def test_havel_hakimi_matches_reference(self):
+        """Test the bucket-queue Havel-Hakimi check against the re-sorting reference"""
+        rng = random.Random(1955)
+        sequences = [sequence for sequence, _, _ in self.test_cases.values()]
+        for _ in range(2000):
+            n = rng.randint(1, 12)
+            sequences.append([rng.randint(-1, n) for _ in range(n)])
+        for sequence in sequences:
+            with self.subTest(sequence=sequence):
+                self.assertIs(
+                    self.analyzer.havel_hakimi_check(sequence),
+                    self.analyzer.havel_hakimi_reference_check(sequence)
+                )
+
     def test_both_methods(self):
         """Test sequences using both methods"""
         for name, (sequence, _, expected_result) in self.test_cases.items():
@@ -183,6 +232,91 @@ class TestGraphSequenceAnalyzer(unittest.TestCase):
                     f"Combined methods test failed for {name}"
                 )
 
+    def test_havel_hakimi_construction(self):
+        """Test that the constructed realization has exactly the requested degrees"""
+        rng = random.Random(16)
+        sequences = [[], [0, 0], [3, 3, 2, 2, 2], [3, 3, 1, 1], [4, 4, 4, 4, 4]]
+        sequences += [[rng.randrange(9) for _ in range(10)] for _ in range(200)]
+        for sequence in sequences:
+            with self.subTest(sequence=sequence):
+                edges = self.analyzer.havel_hakimi_edges(sequence)
+                G = self.analyzer.havel_hakimi_graph(sequence)
+                if not self.analyzer.is_graphic(sequence):
+                    self.assertIsNone(edges)
+                    self.assertIsNone(G)
+                    continue
+                self.assertEqual(edges.shape, (sum(sequence) // 2, 2))
+                pairs = {frozenset(edge) for edge in edges.tolist()}
+                self.assertEqual(len(pairs), len(edges))
+                self.assertTrue(all(len(pair) == 2 for pair in pairs))
+                self.assertEqual([d for _, d in sorted(G.degree())], sequence)
+                self.assertEqual(pairs, {frozenset(edge) for edge in G.edges()})
+
+    def test_is_graphic_many(self):
+        """Test the batch checker against is_graphic, padded and ragged"""
+        rng = random.Random(2024)
+        sequences = [sequence for sequence, _, _ in self.test_cases.values()]
+        for _ in range(500):
+            n = rng.randint(0, 9)
+            sequences.append([rng.randint(-1, n) for _ in range(n)])
+        width = max(len(sequence) for sequence in sequences)
+        padded = [sequence + [0] * (width - len(sequence)) for sequence in sequences]
+        values = [d for sequence in sequences for d in sequence]
+        offsets = [0]
+        for sequence in sequences:
+            offsets.append(offsets[-1] + len(sequence))
+
+        for method in ('havel-hakimi', 'erdos-gallai', 'both'):
+            expected = [self.analyzer.is_graphic(sequence, method=method)
+                        for sequence in sequences]
+            with self.subTest(method=method, layout='padded'):
+                mask = self.analyzer.is_graphic_many(padded, method=method)
+                self.assertEqual(mask.tolist(), expected)
+            with self.subTest(method=method, layout='ragged'):
+                mask = self.analyzer.is_graphic_many(values, method=method, offsets=offsets)
+                self.assertEqual(mask.tolist(), expected)
+
+    def test_failure_certificates(self):
+        """Test that verdicts name the first failing k, or the stuck step"""
+        rng = random.Random(23)
+        for _ in range(2000):
+            n = rng.randint(1, 10)
+            sequence = [rng.randint(0, n - 1) for _ in range(n)]
+            verdict = self.analyzer.erdos_gallai_verdict(sequence)
+            self.assertEqual(verdict.graphic, self.analyzer.erdos_gallai_reference_check(sequence))
+            self.assertEqual(bool(self.analyzer.havel_hakimi_verdict(sequence)), verdict.graphic)
+            if verdict.reason != 'erdos-gallai':
+                continue
+            seq = sorted(sequence, reverse=True)
+            for k in range(1, verdict.k + 1):
+                left_sum = sum(seq[:k])
+                right_sum = k * (k - 1) + sum(min(d, k) for d in seq[k:])
+                self.assertEqual(left_sum > right_sum, k == verdict.k)
+            self.assertEqual((verdict.left, verdict.right), (left_sum, right_sum))
+
+        self.assertIs(self.analyzer.graphic_verdict([2, 2, 2]), GRAPHIC)
+        self.assertEqual(self.analyzer.graphic_verdict([3, 3, 3, 1]),
+                         GraphicVerdict(False, 'erdos-gallai', k=2, left=6, right=5))
+        self.assertEqual(self.analyzer.graphic_verdict([3, 3, 3, 1], method='havel-hakimi'),
+                         GraphicVerdict(False, 'havel-hakimi', left=2, right=1, step=2))
+        self.assertEqual(self.analyzer.graphic_verdict([2, 2, 1]).reason, 'odd-sum')
+        self.assertEqual(self.analyzer.graphic_verdict([5, 1, 1, 1]).reason, 'degree-too-large')
+        self.assertIn("k = 2", self.analyzer.graphic_verdict([3, 3, 3, 1]).explain())
+
+    def test_is_graphic_many_failing_k(self):
+        """Test that the batch path reports the same first failing k"""
+        rng = random.Random(24)
+        lengths = [rng.randint(1, 8) for _ in range(500)]
+        sequences = [[rng.randint(0, n - 1) for _ in range(n)] for n in lengths]
+        padded = [sequence + [0] * (8 - len(sequence)) for sequence in sequences]
+        for method in ('erdos-gallai', 'both'):
+            mask, failing_k = self.analyzer.is_graphic_many(padded, method=method, return_k=True)
+            self.assertEqual(mask.tolist(), [self.analyzer.is_graphic(sequence, method=method)
+                                             for sequence in sequences])
+            self.assertEqual(failing_k.tolist(),
+                             [self.analyzer.erdos_gallai_verdict(sequence).k or 0
+                              for sequence in sequences])
+
     def test_graph_generation(self):
         """Test graph generation for graphic sequences"""
         for name, (sequence, _, is_graphic) in self.test_cases.items():
@@ -207,6 +341,223 @@ class TestGraphSequenceAnalyzer(unittest.TestCase):
                             f"Generated graph degrees don't match for {name}"
                         )
 
+    def test_realization_counts(self):
+        """Test the number of non-isomorphic realizations found"""
+        expected_counts = {
+            (2, 2, 2, 2): 1,
+            (3, 3, 2, 2, 2): 2,
+            (3, 3, 3, 3, 2, 2): 4,
+            (3, 3, 3, 3, 3, 3): 2,
+            (2, 2, 2, 1, 1): 2,
+            (2, 2, 2, 2, 2, 2): 2,
+            (3, 3, 3, 3, 3, 3, 2, 2): 20,
+        }
+        for sequence, count in expected_counts.items():
+            with self.subTest(sequence=sequence):
+                graphs = self.analyzer.generate_all_graphs(list(sequence))
+                self.assertEqual(len(graphs), count)
+
+    def test_orderly_generation(self):
+        """Test that orderly generation finds the same isomorphism classes"""
+        for sequence in ([3, 3, 3, 3, 2, 2], [2, 2, 2, 2, 2, 2, 2], [4, 3, 3, 2, 2, 1, 1]):
+            with self.subTest(sequence=sequence):
+                labeled_stats, orderly_stats = SearchStats(), SearchStats()
+                labeled = self.analyzer.generate_all_graphs(sequence, orderly=False,
+                                                            stats=labeled_stats)
+                orderly = self.analyzer.generate_all_graphs(sequence, orderly=True,
+                                                            stats=orderly_stats)
+                self.assertLess(orderly_stats.nodes, labeled_stats.nodes)
+                self.assertEqual(
+                    {canonical_form(graph_rows(G)) for G in orderly},
+                    {canonical_form(graph_rows(G)) for G in labeled}
+                )
+                self.assertEqual(len(orderly), len(labeled))
+
+    def test_iter_graphs_limits(self):
+        """Test early stopping of the streaming realization generator"""
+        sequence = [3] * 10
+        first_two = list(self.analyzer.iter_graphs(sequence, limit=2))
+        self.assertEqual(len(first_two), 2)
+        self.assertEqual(list(self.analyzer.iter_graphs(sequence, limit=0)), [])
+        self.assertEqual(list(self.analyzer.iter_graphs(sequence, timeout=0)), [])
+        self.assertEqual(list(self.analyzer.iter_graphs([3, 3, 3, 1])), [])
+
+        streamed = self.analyzer.iter_graphs([3, 3, 3, 3, 2, 2])
+        self.assertEqual(
+            {canonical_form(graph_rows(G)) for G in streamed},
+            {canonical_form(graph_rows(G))
+             for G in self.analyzer.generate_all_graphs([3, 3, 3, 3, 2, 2])}
+        )
+
+    def test_interleaved_searches(self):
+        """Test that searches sharing an analyzer keep separate node counts"""
+        alone = SearchStats()
+        list(self.analyzer.iter_realizations([3] * 8, stats=alone))
+        first, second = SearchStats(), SearchStats()
+        searches = [self.analyzer.iter_realizations([3] * 8, stats=first),
+                    self.analyzer.iter_realizations([2] * 8, stats=second)]
+        # Alternate between the two generators until both are exhausted
+        while searches:
+            search = searches.pop(0)
+            if next(search, None) is not None:
+                searches.append(search)
+        self.assertEqual(first.nodes, alone.nodes)
+        self.assertLess(second.nodes, alone.nodes)
+        self.assertFalse(hasattr(self.analyzer, 'last_search_nodes'))
+
+    def test_stop_callback(self):
+        """Test that a stop callback cancels the search between graphs"""
+        found = []
+        for G in self.analyzer.iter_graphs([3] * 12, stop=lambda: len(found) >= 3):
+            found.append(G)
+        self.assertEqual(len(found), 3)
+        self.assertEqual(list(self.analyzer.iter_graphs([3] * 10, stop=lambda: True)), [])
+
+    def test_search_stats(self):
+        """Test that instrumentation counts the search without changing its output"""
+        sequence = [3] * 10
+        plain = list(self.analyzer.iter_realizations(sequence))
+        counted = SearchStats()
+        self.assertEqual(list(self.analyzer.iter_realizations(sequence, stats=counted)), plain)
+        stats = SearchStats(track_memory=True)
+        self.assertEqual(list(self.analyzer.iter_realizations(sequence, stats=stats)), plain)
+        self.assertEqual(stats.nodes, counted.nodes)
+        self.assertEqual(stats.dedup_lookups, stats.leaves)
+        self.assertEqual(stats.leaves - stats.duplicates, len(plain))
+        self.assertGreater(stats.residual_prunes, 0)
+        self.assertLessEqual(stats.residual_prunes, stats.residual_checks)
+        self.assertEqual(set(stats.phase_times), {'check', 'search', 'dedup'})
+        self.assertGreater(stats.peak_memory, 0)
+
+        parallel = SearchStats()
+        self.analyzer.generate_all_graphs(sequence, workers=2, stats=parallel)
+        self.assertEqual((parallel.leaves, parallel.residual_prunes),
+                         (stats.leaves, stats.residual_prunes))
+        self.assertIn('graphs', parallel.phase_times)
+
+    def test_iter_realizations(self):
+        """Test that bitset realizations match the requested degrees"""
+        sequence = [4, 3, 3, 2, 2, 1, 1]
+        for rows in self.analyzer.iter_realizations(sequence):
+            self.assertIsInstance(rows, tuple)
+            self.assertEqual([bin(row).count("1") for row in rows], sequence)
+            for v, row in enumerate(rows):
+                self.assertFalse(row >> v & 1, "realization has a self-loop")
+
+    def test_parallel_generation(self):
+        """Test that the process pool gives the same output as the serial search"""
+        for sequence in ([3] * 10, [3, 3, 3, 3, 3, 3, 2, 2], [3, 1, 1, 1]):
+            with self.subTest(sequence=sequence):
+                serial = list(self.analyzer.iter_realizations(sequence))
+                parallel = list(self.analyzer.iter_realizations(sequence, workers=2))
+                self.assertEqual(parallel, serial)
+        self.assertEqual(len(self.analyzer.generate_all_graphs([3] * 10, workers=2)), 21)
+
+    def test_parallel_search_stops_early(self):
+        """Test that a parallel search stopped early returns promptly and leaves no busy workers"""
+        start = time.monotonic()
+        self.assertEqual(len(list(self.analyzer.iter_realizations([3] * 14, workers=2,
+                                                                  limit=1))), 1)
+        stop_at = time.monotonic() + 0.5
+        self.assertEqual(list(self.analyzer.iter_realizations(
+            [3] * 14, workers=2, stop=lambda: time.monotonic() > stop_at)), [])
+        self.assertEqual(list(self.analyzer.iter_realizations([3] * 14, workers=2,
+                                                              timeout=0.5)), [])
+        search = self.analyzer.iter_realizations([3] * 12, workers=2)
+        next(search)
+        search.close()
+        # The full searches would take minutes
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_count_realizations(self):
+        """Test realization counts against brute force and enumeration"""
+        for sequence in ([2, 2, 2, 2], [3, 3, 2, 2, 2], [3, 2, 2, 2, 1],
+                         [2, 2, 2, 2, 2, 2], [1, 1, 0], [3, 3, 1, 1]):
+            with self.subTest(sequence=sequence):
+                n = len(sequence)
+                edges = list(combinations(range(n), 2))
+                labeled = 0
+                for chosen in range(1 << len(edges)):
+                    degrees = [0] * n
+                    for i, (u, v) in enumerate(edges):
+                        if chosen >> i & 1:
+                            degrees[u] += 1
+                            degrees[v] += 1
+                    labeled += degrees == sequence
+                self.assertEqual(
+                    self.analyzer.count_realizations(sequence, labeled=True), labeled)
+                self.assertEqual(
+                    self.analyzer.count_realizations(sequence),
+                    len(self.analyzer.generate_all_graphs(sequence))
+                )
+
+    def test_realizability(self):
+        """Test the constrained checks and witnesses against brute force"""
+        properties = {
+            'simple': lambda G: True,
+            'connected': nx.is_connected,
+            'forest': nx.is_forest,
+            'tree': nx.is_tree,
+            'k-edge-connected': lambda G: len(G) == 1 or nx.edge_connectivity(G) >= 2,
+        }
+        realizable: Dict[Tuple[int, ...], set] = {}
+        for n in range(1, 5):
+            pairs = list(combinations(range(n), 2))
+            for mask in range(1 << len(pairs)):
+                G = nx.Graph()
+                G.add_nodes_from(range(n))
+                G.add_edges_from(pair for i, pair in enumerate(pairs) if mask >> i & 1)
+                kinds = realizable.setdefault(tuple(d for _, d in sorted(G.degree())), set())
+                kinds.update(kind for kind, test in properties.items() if test(G))
+
+        for n in range(1, 5):
+            for sequence in product(range(4), repeat=n):
+                for constraint, test in properties.items():
+                    expected = constraint in realizable.get(sequence, ())
+                    with self.subTest(sequence=sequence, constraint=constraint):
+                        self.assertEqual(self.analyzer.is_realizable(list(sequence), constraint,
+                                                                     k=2), expected)
+                        edges = self.analyzer.realize(list(sequence), constraint, k=2)
+                        self.assertEqual(edges is not None, expected)
+                        if not expected:
+                            continue
+                        G = nx.Graph()
+                        G.add_nodes_from(range(n))
+                        G.add_edges_from(edges.tolist())
+                        self.assertEqual(G.number_of_edges(), len(edges))
+                        self.assertEqual(tuple(d for _, d in sorted(G.degree())), sequence)
+                        self.assertTrue(test(G))
+
+    def test_multigraph_realizability(self):
+        """Test multigraph checks and witnesses, with and without loops"""
+        self.assertFalse(self.analyzer.is_realizable([3, 1, 0], 'multigraph'))
+        self.assertTrue(self.analyzer.is_realizable([3, 1, 0], 'multigraph-loops'))
+        self.assertTrue(self.analyzer.is_realizable([4, 4], 'multigraph'))
+        self.assertFalse(self.analyzer.is_realizable([4, 4, 1], 'multigraph-loops'))
+        rng = random.Random(22)
+        for _ in range(300):
+            sequence = [rng.randint(0, 8) for _ in range(rng.randint(1, 6))]
+            for constraint in ('multigraph', 'multigraph-loops'):
+                edges = self.analyzer.realize(sequence, constraint)
+                self.assertEqual(edges is not None,
+                                 self.analyzer.is_realizable(sequence, constraint))
+                if edges is not None:
+                    self.assertEqual(np.bincount(edges.ravel(),
+                                                 minlength=len(sequence)).tolist(), sequence)
+                    if constraint == 'multigraph':
+                        self.assertFalse((edges[:, 0] == edges[:, 1]).any())
+
+    def test_k_edge_connected_witness(self):
+        """Test that the swap search reaches the requested edge connectivity"""
+        for k, n in ((2, 12), (3, 20), (4, 16)):
+            sequence = [k] * n
+            edges = self.analyzer.realize(sequence, 'k-edge-connected', k=k, seed=1)
+            self.assertGreaterEqual(nx.edge_connectivity(nx.Graph(edges.tolist())), k)
+        self.assertFalse(self.analyzer.is_realizable([3, 3, 3, 3, 2, 2], 'k-edge-connected', k=3))
+        with self.assertRaises(ValueError):
+            self.analyzer.is_realizable([1, 1], 'planar')
+
     def test_empty_sequence(self):
         """Test empty sequence"""
         self.assertTrue(
@@ -221,5 +572,630 @@ class TestGraphSequenceAnalyzer(unittest.TestCase):
             "Single vertex with degree 0 should be graphic"
         )
 
+    def test_histogram_check(self):
+        """Test the histogram form of the Erdős-Gallai check against the list form"""
+        analyzer = GraphSequenceAnalyzer()
+        rng = random.Random(17)
+        sequences = [sequence for sequence, _, _ in TestCases.get_test_cases().values()]
+        sequences += [[rng.randrange(n) for _ in range(n)] for n in range(1, 30) for _ in range(20)]
+        for sequence in sequences:
+            # A histogram has no room for negative degrees
+            if min(sequence, default=0) < 0:
+                continue
+            # Trailing zero counts are harmless
+            counts = [0] * (max(sequence, default=0) + 3)
+            for d in sequence:
+                counts[d] += 1
+            self.assertEqual(analyzer.erdos_gallai_histogram_verdict(counts),
+                             analyzer.erdos_gallai_verdict(sequence), sequence)
+            self.assertEqual(analyzer.erdos_gallai_histogram_check(np.array(counts)),
+                             analyzer.erdos_gallai_check(sequence))
+        self.assertTrue(analyzer.erdos_gallai_histogram_check([]))
+        with self.assertRaises(ValueError):
+            analyzer.erdos_gallai_histogram_check([2, -1])
+
+class TestBipartiteAndDirected(unittest.TestCase):
+    """Test suite for the Gale-Ryser and Fulkerson-Chen-Anstee engines"""
+
+    def setUp(self):
+        self.analyzer = GraphSequenceAnalyzer()
+
+    @staticmethod
+    def realizable_pairs(cells: List[Tuple[int, int]], p: int, q: int):
+        """Degree pairs of every subset of the given cells, by brute force"""
+        pairs = set()
+        for mask in range(1 << len(cells)):
+            out_degrees, in_degrees = [0] * p, [0] * q
+            for bit, (u, v) in enumerate(cells):
+                if mask >> bit & 1:
+                    out_degrees[u] += 1
+                    in_degrees[v] += 1
+            pairs.add((tuple(out_degrees), tuple(in_degrees)))
+        return pairs
+
+    def test_gale_ryser(self):
+        """Test the bipartite check and builder against brute force"""
+        bigraphic = self.realizable_pairs([(i, j) for i in range(3) for j in range(3)], 3, 3)
+        for left in product(range(5), repeat=3):
+            for right in product(range(5), repeat=3):
+                expected = (left, right) in bigraphic
+                self.assertEqual(self.analyzer.is_graphic((list(left), list(right)),
+                                                          method='gale-ryser'), expected)
+                edges = self.analyzer.gale_ryser_edges(list(left), list(right))
+                self.assertEqual(edges is not None, expected)
+                if expected:
+                    self.assertEqual(len({tuple(e) for e in edges.tolist()}), len(edges))
+                    self.assertEqual(tuple(np.bincount(edges[:, 0], minlength=3)), left)
+                    self.assertEqual(tuple(np.bincount(edges[:, 1], minlength=3)), right)
+
+    def test_fulkerson_chen_anstee(self):
+        """Test the digraph check and Kleitman-Wang builder against brute force"""
+        n = 4
+        digraphic = self.realizable_pairs(
+            [(u, v) for u in range(n) for v in range(n) if u != v], n, n)
+        for out_degrees in product(range(n), repeat=n):
+            for in_degrees in product(range(n), repeat=n):
+                expected = (out_degrees, in_degrees) in digraphic
+                self.assertEqual(self.analyzer.is_graphic((list(out_degrees), list(in_degrees)),
+                                                          method='fulkerson-chen-anstee'),
+                                 expected)
+                if sum(out_degrees) != sum(in_degrees):
+                    continue
+                arcs = self.analyzer.kleitman_wang_edges(list(out_degrees), list(in_degrees))
+                self.assertEqual(arcs is not None, expected)
+                if expected:
+                    self.assertEqual(len({tuple(a) for a in arcs.tolist()}), len(arcs))
+                    self.assertFalse((arcs[:, 0] == arcs[:, 1]).any())
+                    self.assertEqual(tuple(np.bincount(arcs[:, 0], minlength=n)), out_degrees)
+                    self.assertEqual(tuple(np.bincount(arcs[:, 1], minlength=n)), in_degrees)
+        with self.assertRaises(ValueError):
+            self.analyzer.fulkerson_chen_anstee_check([1], [0, 1])
+
+    def test_is_graphic_many(self):
+        """Test the batch checks against the scalar ones on padded pairs"""
+        rng = random.Random(21)
+        for method in ('gale-ryser', 'fulkerson-chen-anstee'):
+            pairs = []
+            for _ in range(400):
+                n = rng.randint(0, 7)
+                m = n if method == 'fulkerson-chen-anstee' else rng.randint(0, 7)
+                pairs.append(([rng.randint(0, m) for _ in range(n)],
+                              [rng.randint(0, n) for _ in range(m)]))
+            width = max(len(half) for pair in pairs for half in pair)
+            padded = [[half + [0] * (width - len(half)) for half in pair] for pair in pairs]
+            with self.subTest(method=method):
+                expected = [self.analyzer.is_graphic(pair, method=method) for pair in pairs]
+                self.assertTrue(any(expected))
+                mask = self.analyzer.is_graphic_many(padded, method=method)
+                self.assertEqual(mask.tolist(), expected)
+        with self.assertRaises(ValueError):
+            self.analyzer.is_graphic_many([[1, 1]], method='gale-ryser')
+
+class TestCanonicalForm(unittest.TestCase):
+    """Test suite for canonical graph certificates"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = random.Random(1981)
+        self.graphs = [
+            nx.empty_graph(7),
+            nx.complete_graph(6),
+            nx.cycle_graph(8),
+            nx.petersen_graph(),
+            nx.circular_ladder_graph(5),
+            nx.complete_bipartite_graph(3, 4),
+        ]
+        for _ in range(40):
+            n = self.rng.randint(1, 9)
+            self.graphs.append(nx.gnp_random_graph(n, self.rng.random(), seed=self.rng.randrange(10 ** 6)))
+
+    def relabeled(self, G):
+        """Return a copy of G with randomly permuted vertex labels"""
+        nodes = list(G.nodes())
+        shuffled = nodes[:]
+        self.rng.shuffle(shuffled)
+        return nx.relabel_nodes(G, dict(zip(nodes, shuffled)))
+
+    def test_invariant_under_relabeling(self):
+        """Test that isomorphic copies get the same certificate"""
+        for G in self.graphs:
+            with self.subTest(graph=sorted(G.edges())):
+                self.assertEqual(
+                    canonical_form(graph_rows(G)),
+                    canonical_form(graph_rows(self.relabeled(G)))
+                )
+
+    def test_matches_isomorphism(self):
+        """Test that certificates agree with nx.is_isomorphic"""
+        for G in self.graphs:
+            for H in self.graphs:
+                if G.number_of_nodes() != H.number_of_nodes():
+                    continue
+                self.assertEqual(
+                    canonical_form(graph_rows(G)) == canonical_form(graph_rows(H)),
+                    nx.is_isomorphic(G, H)
+                )
+
+    def test_rows_round_trip(self):
+        """Test conversion between networkx graphs and adjacency bitsets"""
+        for G in self.graphs:
+            H = rows_to_graph(graph_rows(G))
+            self.assertEqual(sorted(H.nodes()), sorted(G.nodes()))
+            self.assertEqual(sorted(H.edges()), sorted(G.edges()))
+
+    def test_deduplicator(self):
+        """Test that the deduplicator keeps one graph per isomorphism class"""
+        seen = CanonicalDeduplicator()
+        for G in self.graphs:
+            seen.add(graph_rows(G))
+            self.assertFalse(seen.add(graph_rows(self.relabeled(G))))
+
+class TestLazyImports(unittest.TestCase):
+    """Test that networkx is only loaded for graph-returning calls"""
+
+    def loaded_after(self, statements: str) -> List[str]:
+        script = ("import sys\nfrom graph_algorithm import GraphSequenceAnalyzer\n"
+                  "analyzer = GraphSequenceAnalyzer()\n" + statements +
+                  "\nprint(*[m for m in ('networkx', 'concurrent.futures') if m in sys.modules])")
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return output.stdout.split()
+
+    def test_checks_do_not_load_networkx(self):
+        """Test that checking, counting and bitset search stay light"""
+        self.assertEqual(self.loaded_after(
+            "analyzer.is_graphic([3, 3, 2, 2, 2])\n"
+            "analyzer.count_realizations([3, 3, 2, 2, 2])\n"
+            "list(analyzer.iter_realizations([3, 3, 2, 2, 2]))"), [])
+
+    def test_graphs_load_networkx(self):
+        """Test that networkx is loaded once graphs are requested"""
+        self.assertEqual(self.loaded_after("analyzer.generate_all_graphs([2, 2, 2])"),
+                         ['networkx'])
+
+    def test_import_benchmark_from_other_directory(self):
+        """Test that the import benchmark finds the modules wherever it is started"""
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark.py')
+        with tempfile.TemporaryDirectory() as directory:
+            output = subprocess.run([sys.executable, script, '--suite', 'imports',
+                                     '--repeats', '1'],
+                                    capture_output=True, text=True, cwd=directory)
+        self.assertEqual(output.returncode, 0, output.stderr)
+        self.assertIn('graph_algorithm', output.stdout)
+
+class TestRealizationSampler(unittest.TestCase):
+    """Test suite for the double-edge swap sampler"""
+
+    def assert_realizes(self, edges, sequence: List[int]):
+        pairs = {frozenset(edge) for edge in edges.tolist()}
+        self.assertEqual(len(pairs), len(edges), "sample has a multi-edge")
+        self.assertTrue(all(len(pair) == 2 for pair in pairs), "sample has a loop")
+        degrees = [0] * len(sequence)
+        for u, v in edges.tolist():
+            degrees[u] += 1
+            degrees[v] += 1
+        self.assertEqual(degrees, sequence)
+
+    def test_samples_are_uniform(self):
+        """Test that every labeled realization is drawn about equally often"""
+        sequence = [2, 2, 2, 2, 1, 1]
+        sampler = RealizationSampler(sequence, seed=7, burn_in=100, thin=20)
+        samples = sampler.sample(3100)
+        self.assertEqual(samples.shape, (3100, 5, 2))
+        frequencies: Dict[frozenset, int] = {}
+        for edges in samples:
+            self.assert_realizes(edges, sequence)
+            key = frozenset(frozenset(edge) for edge in edges.tolist())
+            frequencies[key] = frequencies.get(key, 0) + 1
+        self.assertEqual(len(frequencies),
+                         GraphSequenceAnalyzer().count_realizations(sequence, labeled=True))
+        self.assertTrue(all(50 <= f <= 150 for f in frequencies.values()), frequencies)
+
+    def test_seeded(self):
+        """Test that a seed makes the chain reproducible"""
+        sequence = [3, 3, 3, 3, 2, 2, 2, 2, 1, 1]
+        first = RealizationSampler(sequence, seed=3).sample(5)
+        second = RealizationSampler(sequence, seed=3).sample(5)
+        self.assertTrue((first == second).all())
+        with self.assertRaises(ValueError):
+            RealizationSampler([3, 3, 1, 1])
+
+    def test_connect_components(self):
+        """Test rewiring disjoint components into one"""
+        sources, targets = [0, 1, 2, 3, 4, 5, 6], [1, 2, 0, 4, 5, 3, 7]
+        self.assertTrue(connect_components(8, sources, targets))
+        G = nx.Graph(list(zip(sources, targets)))
+        self.assertTrue(nx.is_connected(G))
+        self.assertEqual(G.number_of_edges(), 7)
+        self.assertEqual([d for _, d in sorted(G.degree())], [2] * 6 + [1, 1])
+        self.assertFalse(connect_components(4, [0, 2], [1, 3]))
+        self.assertFalse(connect_components(3, [0], [1]))
+
+    def test_connected_samples(self):
+        """Test that connected mode only produces connected realizations"""
+        sequence = [2] * 6 + [1] * 2
+        sampler = RealizationSampler(sequence, seed=5, connected=True)
+        for G in sampler.iter_graphs(20):
+            self.assertTrue(nx.is_connected(G))
+            self.assertEqual([d for _, d in sorted(G.degree())], sequence)
+        with self.assertRaises(ValueError):
+            RealizationSampler([1, 1, 1, 1], connected=True)
+
+class TestIncrementalGraphicChecker(unittest.TestCase):
+    """Test suite for the incremental graphicality checker"""
+
+    def test_matches_erdos_gallai(self):
+        """Test the verdict against a full check after every random edit"""
+        analyzer = GraphSequenceAnalyzer()
+        rng = random.Random(11)
+        checker = IncrementalGraphicChecker([rng.randrange(6) for _ in range(8)])
+        for _ in range(3000):
+            choice = rng.random()
+            if choice < 0.02:
+                checker.append(rng.randrange(4))
+            elif choice < 0.5:
+                checker.increment(rng.randrange(len(checker)))
+            else:
+                v = rng.randrange(len(checker))
+                if checker.degree(v):
+                    checker.decrement(v)
+            sequence = checker.sequence()
+            self.assertEqual(checker.is_graphic(), analyzer.erdos_gallai_check(sequence),
+                             sequence)
+            self.assertEqual(checker.total, sum(sequence))
+
+    def test_test_cases(self):
+        """Test the checker built from scratch and by appending"""
+        for name, (sequence, _, expected) in TestCases.get_test_cases().items():
+            with self.subTest(name=name):
+                self.assertEqual(IncrementalGraphicChecker(sequence).is_graphic(), expected)
+                checker = IncrementalGraphicChecker()
+                for d in sequence:
+                    checker.append(d)
+                self.assertEqual(checker.is_graphic(), expected)
+
+    def test_invalid_edits(self):
+        """Test that degrees cannot become negative"""
+        checker = IncrementalGraphicChecker([1, 0])
+        with self.assertRaises(ValueError):
+            checker.decrement(1)
+        with self.assertRaises(ValueError):
+            checker.append(-1)
+        with self.assertRaises(ValueError):
+            IncrementalGraphicChecker([2, -1])
+        self.assertTrue(IncrementalGraphicChecker().is_graphic())
+
+class TestGraphicSequences(unittest.TestCase):
+    """Test suite for enumerating and counting graphic sequences"""
+
+    # OEIS A004251, n = 0..9
+    COUNTS = [1, 1, 2, 4, 11, 31, 102, 342, 1213, 4361]
+
+    def test_enumeration_matches_brute_force(self):
+        """Test the pruned search against filtering all non-increasing sequences"""
+        analyzer = GraphSequenceAnalyzer()
+        for n in range(1, 8):
+            with self.subTest(n=n):
+                expected = [list(s) for s in combinations_with_replacement(range(n - 1, -1, -1), n)
+                            if analyzer.erdos_gallai_check(list(s))]
+                self.assertEqual(list(iter_graphic_sequences(n)), expected)
+        self.assertEqual(list(iter_graphic_sequences(0)), [[]])
+        self.assertEqual(list(iter_graphic_sequences(5, prefix=[4, 4])),
+                         [[4, 4, 4, 4, 4], [4, 4, 4, 3, 3], [4, 4, 3, 3, 2], [4, 4, 2, 2, 2]])
+        self.assertEqual(list(iter_graphic_sequences(4, prefix=[3, 0])), [])
+
+    def test_counts(self):
+        """Test both the counter and the search against the known counts"""
+        for n, expected in enumerate(self.COUNTS):
+            with self.subTest(n=n):
+                self.assertEqual(count_graphic_sequences(n), expected)
+                self.assertEqual(sum(1 for _ in iter_graphic_sequences(n)), expected)
+        self.assertEqual(count_graphic_sequences(20), 10029832754)
+
+    def test_workers(self):
+        """Test that sharding across processes changes nothing"""
+        self.assertEqual(list(iter_graphic_sequences(7, workers=2)), list(iter_graphic_sequences(7)))
+        self.assertEqual(count_graphic_sequences(12, workers=2), count_graphic_sequences(12))
+
+class TestSequenceIO(unittest.TestCase):
+    """Test suite for binary degree-sequence files"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'degrees.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_check_degree_file(self):
+        """Test the out-of-core check against the in-memory one in every format"""
+        analyzer = GraphSequenceAnalyzer()
+        rng = random.Random(5)
+        sequences = [[rng.randrange(n + 1) for _ in range(n)] for n in range(1, 25)]
+        sequences += [[3, 3, 2, 2, 2], [3, 3, 1], [], [0]]
+        for sequence in sequences:
+            expected = analyzer.erdos_gallai_verdict(sequence)
+            for input_format in ('uint32', 'uint64'):
+                write_degrees(self.path, sequence, input_format)
+                self.assertEqual(check_degree_file(self.path, input_format, chunk_size=4),
+                                 expected, sequence)
+            if max(sequence, default=0) < len(sequence):
+                write_degrees(self.path, np.bincount(sequence, minlength=1), 'histogram')
+                self.assertEqual(check_degree_file(self.path, 'histogram'), expected)
+
+    def test_memory_map(self):
+        """Test that files are mapped rather than read, and binned in chunks"""
+        degrees = np.random.default_rng(3).integers(0, 40, size=10000)
+        write_degrees(self.path, degrees, 'uint64')
+        mapped = open_degrees(self.path, 'uint64')
+        self.assertIsInstance(mapped, np.memmap)
+        self.assertEqual(mapped.tolist(), degrees.tolist())
+        self.assertEqual(degree_histogram(mapped, chunk_size=999).tolist(),
+                         np.bincount(degrees).tolist())
+        with self.assertRaises(ValueError):
+            degree_histogram(mapped, limit=10)
+
+    def test_invalid_files(self):
+        """Test truncated files, unknown formats and values that do not fit"""
+        with open(self.path, 'wb') as f:
+            f.write(b'\x01\x00\x00')
+        with self.assertRaises(ValueError):
+            open_degrees(self.path, 'uint32')
+        with self.assertRaises(ValueError):
+            open_degrees(self.path, 'int8')
+        with self.assertRaises(ValueError):
+            write_degrees(self.path, [-1], 'uint32')
+        with self.assertRaises(ValueError):
+            write_degrees(self.path, [2 ** 32], 'uint32')
+
+class TestSequenceCache(unittest.TestCase):
+    """Test suite for the sequence result cache"""
+
+    def test_hits_and_misses(self):
+        """Test that lookups ignore vertex order and are counted"""
+        cache = SequenceCache()
+        self.assertIsNone(cache.get('graphic', [1, 2, 1]))
+        cache.put('graphic', [2, 1, 1], True)
+        self.assertTrue(cache.get('graphic', [1, 1, 2]))
+        self.assertIsNone(cache.get('count', [1, 1, 2]))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 2))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = SequenceCache(maxsize=2)
+        cache.put('graphic', [0], True)
+        cache.put('graphic', [1, 1], True)
+        cache.get('graphic', [0])
+        cache.put('graphic', [2, 2, 2], True)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertIsNone(cache.get('graphic', [1, 1]))
+        self.assertTrue(cache.get('graphic', [0]))
+
+    def test_persistence(self):
+        """Test that entries survive reopening the on-disk store"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = SequenceCache(path=path)
+            cache.put('count', [3, 3, 3, 3], 1)
+            cache.close()
+
+            reopened = SequenceCache(path=path)
+            self.assertEqual(reopened.get('count', [3, 3, 3, 3]), 1)
+            self.assertEqual(reopened.stats.disk_hits, 1)
+            reopened.close()
+
+    def test_analyzer_uses_cache(self):
+        """Test cached realizations are relabeled to the caller's vertex order"""
+        cache = SequenceCache()
+        analyzer = GraphSequenceAnalyzer(cache=cache)
+        sequence = [1, 3, 2, 2, 2]
+        first = analyzer.generate_all_graphs(sorted(sequence, reverse=True))
+        second = analyzer.generate_all_graphs(sequence)
+        self.assertEqual(len(first), len(second))
+        for graph in second:
+            self.assertEqual([graph.degree(v) for v in range(len(sequence))], sequence)
+        self.assertGreater(cache.stats.hits, 0)
+        self.assertEqual(analyzer.count_realizations(sequence),
+                         analyzer.count_realizations(sequence[::-1]))
+
+    def test_weight_bound(self):
+        """Test that memory is bounded by the size of the entries, not just their number"""
+        cache = SequenceCache(max_weight=20)
+        cache.put('realizations', [1, 1], [[1, 2], [3, 4], [5, 6]])
+        cache.put('count', [2, 2, 2], 1)
+        self.assertEqual(len(cache), 2)
+        # Weighs 19: the least recently used entry goes to make room
+        cache.put('realizations', [2, 2, 2], [list(range(8))] * 2)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('realizations', [1, 1]))
+        self.assertEqual(cache.stats.evictions, 1)
+        # Heavier than max_weight on its own: never kept in memory
+        cache.put('realizations', [3, 3, 3, 3], [list(range(30))])
+        self.assertIsNone(cache.get('realizations', [3, 3, 3, 3]))
+        self.assertEqual(SequenceCache.weight([[1, 2], [3]]), 6)
+
+    def test_counting_stores_only_the_count(self):
+        """Test that counting never stores the realizations it counted"""
+        cache = SequenceCache()
+        analyzer = GraphSequenceAnalyzer(cache=cache)
+        self.assertEqual(analyzer.count_realizations([3] * 8), 6)
+        self.assertIsNone(cache.get('realizations', [3] * 8))
+        self.assertEqual(cache.get('count', [3] * 8), 6)
+
+        original = graph_algorithm.MAX_CACHED_REALIZATIONS
+        graph_algorithm.MAX_CACHED_REALIZATIONS = 5
+        try:
+            self.assertEqual(len(analyzer.generate_all_graphs([3] * 8)), 6)
+        finally:
+            graph_algorithm.MAX_CACHED_REALIZATIONS = original
+        self.assertIsNone(cache.get('realizations', [3] * 8))
+        analyzer.generate_all_graphs([2] * 6)
+        self.assertEqual(len(cache.get('realizations', [2] * 6)), 2)
+
+class TestAnalysisWorker(unittest.TestCase):
+    """Test suite for the background analysis worker"""
+
+    def drain(self, worker: AnalysisWorker) -> List[Tuple]:
+        worker.join(timeout=30)
+        messages = []
+        while not worker.messages.empty():
+            messages.append(worker.messages.get_nowait())
+        return messages
+
+    def test_streams_results(self):
+        """Test that the verdict comes first and every realization is posted"""
+        worker = AnalysisWorker(GraphSequenceAnalyzer(), [3, 3, 3, 3, 2, 2])
+        worker.start()
+        messages = self.drain(worker)
+        self.assertEqual(messages[0], ('verdict', GRAPHIC))
+        self.assertTrue(messages[0][1])
+        self.assertEqual(messages[-1], ('done', False))
+        self.assertEqual(sum(kind == 'graph' for kind, _ in messages), 4)
+
+    def test_not_graphic(self):
+        """Test that a non-graphic sequence posts no graphs"""
+        worker = AnalysisWorker(GraphSequenceAnalyzer(), [3, 3, 1, 1], 'erdos-gallai')
+        worker.start()
+        verdict = GraphicVerdict(False, 'erdos-gallai', k=2, left=6, right=4)
+        self.assertEqual(self.drain(worker), [('verdict', verdict), ('done', False)])
+
+    def test_cancel(self):
+        """Test that cancelling ends a long search promptly"""
+        worker = AnalysisWorker(GraphSequenceAnalyzer(), [3] * 16)
+        worker.start()
+        while worker.messages.qsize() < 2:
+            worker.join(timeout=0.01)
+        worker.cancel()
+        messages = self.drain(worker)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(messages[-1], ('done', True))
+
+class TestGraphView(unittest.TestCase):
+    """Test suite for realization layouts and drawing"""
+
+    def test_layout_covers_vertices(self):
+        """Test that small and large layouts place every vertex in [-1, 1]"""
+        for G in (nx.cycle_graph(6), nx.random_regular_graph(3, LARGE_GRAPH + 20, seed=1)):
+            with self.subTest(n=G.number_of_nodes()):
+                pos = compute_layout(G)
+                self.assertEqual(set(pos), set(G))
+                for x, y in pos.values():
+                    self.assertLessEqual(max(abs(x), abs(y)), 1 + 1e-9)
+        self.assertEqual(compute_layout(nx.Graph()), {})
+
+    def test_warm_start(self):
+        """Test that a warm-started layout stays close to the previous one"""
+        first = nx.random_regular_graph(3, LARGE_GRAPH, seed=2)
+        second = nx.double_edge_swap(first.copy(), nswap=1, seed=3)
+        previous = compute_layout(first)
+        warm = compute_layout(second, previous=previous)
+        moved = sum(((warm[v] - previous[v]) ** 2).sum() for v in first) / len(first)
+        self.assertLess(moved, 0.05)
+        # Positions of another vertex set are ignored
+        self.assertEqual(set(compute_layout(nx.path_graph(3), previous=previous)), {0, 1, 2})
+
+    def test_drawing_updates_in_place(self):
+        """Test that showing another realization reuses the artists"""
+        from matplotlib.figure import Figure
+
+        drawing = GraphDrawing(Figure().add_subplot(111))
+        G, H = nx.cycle_graph(6), nx.circulant_graph(6, [3])
+        H.add_edges_from([(0, 1), (2, 3), (4, 5)])
+        drawing.show(G, compute_layout(G))
+        nodes, edges = drawing.nodes, drawing.edges
+        drawing.show(H, compute_layout(H))
+        self.assertIs(drawing.nodes, nodes)
+        self.assertIs(drawing.edges, edges)
+        self.assertEqual(len(drawing.edges.get_segments()), H.number_of_edges())
+        drawing.show(nx.path_graph(3), compute_layout(nx.path_graph(3)))
+        self.assertIsNot(drawing.nodes, nodes)
+        self.assertIsNot(drawing.edges, edges)
+
+class TestCommandLine(unittest.TestCase):
+    """Test suite for the batch command-line analyzer"""
+
+    INPUT = "3, 3, 2, 2, 2\n# comment\n\n[4, 1, 1]\n{\"sequence\": [3, 3, 3, 3], \"id\": 7}\nx y\n"
+
+    def run_cli(self, *args: str) -> str:
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'input.txt')
+            target = os.path.join(directory, 'output')
+            with open(source, 'w') as f:
+                f.write(self.INPUT)
+            self.assertEqual(cli.main([source, '-o', target, *args]), 0)
+            with open(target) as f:
+                return f.read()
+
+    def test_parse_line(self):
+        """Test the accepted line formats"""
+        self.assertEqual(cli.parse_line("3,3 2, 2"), {'sequence': [3, 3, 2, 2]})
+        self.assertEqual(cli.parse_line("[1, 1]"), {'sequence': [1, 1]})
+        self.assertEqual(cli.parse_line('{"sequence": [0], "id": "a"}'),
+                         {'sequence': [0], 'id': 'a'})
+        self.assertEqual(cli.parse_line("[[1], [0, 1]]"), {'sequence': [[1], [0, 1]]})
+        for line in ("1, x", "[1, 1.5]", '{"id": 1}', "[true]", "[[1], [0], [1]]"):
+            with self.assertRaises(ValueError):
+                cli.parse_line(line)
+
+    def test_jsonl_output(self):
+        """Test verdicts, counts, pass-through fields and parse errors"""
+        results = [json.loads(line) for line in self.run_cli('--count').splitlines()]
+        self.assertEqual([result['line'] for result in results], [1, 4, 5, 6])
+        self.assertEqual([result.get('graphic') for result in results], [True, False, True, None])
+        self.assertEqual(results[0]['realizations'], 2)
+        self.assertEqual(results[2]['id'], 7)
+        self.assertIn('error', results[3])
+
+    def test_csv_output_with_workers(self):
+        """Test that the process pool keeps input order"""
+        serial = self.run_cli('--output-format', 'csv')
+        parallel = self.run_cli('--output-format', 'csv', '--workers', '2', '--chunk-size', '1')
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial.splitlines()[0], 'line,sequence,graphic,error')
+        self.assertEqual(serial.splitlines()[1], '1,3 3 2 2 2,True,')
+
+    def test_explain(self):
+        """Test that rejected sequences carry the checker's reason"""
+        results = list(cli.analyze_records([{'sequence': [3, 3, 3, 1]}, {'sequence': [2, 2, 2]}],
+                                           explain=True))
+        self.assertIn("k = 2", results[0]['reason'])
+        self.assertNotIn('reason', results[1])
+
+    def test_pair_methods(self):
+        """Test bipartite and directed input, and mismatched input shapes"""
+        records = [{'sequence': [[2, 1], [1, 1, 1]]}, {'sequence': [[2, 1], [3]]},
+                   {'sequence': [3, 3, 2, 2, 2]}]
+        results = list(cli.analyze_records(records, method='gale-ryser'))
+        self.assertEqual([result.get('graphic') for result in results], [True, False, None])
+        self.assertIn('error', results[2])
+        results = list(cli.analyze_records(records, method='fulkerson-chen-anstee'))
+        self.assertTrue(all('error' in result for result in results))
+        self.assertIn('error', list(cli.analyze_records(records[:1]))[0])
+
+    def test_binary_input(self):
+        """Test checking a binary degree file, and the options it rejects"""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'degrees.bin')
+            target = os.path.join(directory, 'output')
+            write_degrees(source, [3, 3, 3, 1], 'uint32')
+            self.assertEqual(cli.main([source, '-o', target, '--input-format', 'uint32',
+                                       '--explain']), 0)
+            with open(target) as f:
+                result = json.loads(f.read())
+            self.assertEqual(result['input'], source)
+            self.assertFalse(result['graphic'])
+            self.assertIn("k = 2", result['reason'])
+
+            write_degrees(source, [1, 1], 'uint64')
+            self.assertEqual(cli.main([source, '-o', target, '--input-format', 'uint64',
+                                       '--output-format', 'csv']), 0)
+            with open(target) as f:
+                self.assertEqual(f.read().splitlines(), ['input,graphic,error', f'{source},True,'])
+
+            for args in (['--method', 'havel-hakimi'], ['--count']):
+                with self.assertRaises(SystemExit):
+                    cli.main([source, '--input-format', 'uint64', *args])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file